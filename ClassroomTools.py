@@ -2,13 +2,17 @@
 from __future__ import annotations
 
 import base64
+import concurrent.futures
 import configparser
 import contextlib
 import ctypes
 from ctypes import wintypes
 import filecmp
+import hashlib
 import importlib
+import importlib.util
 import io
+import itertools
 import json
 import logging
 import math
@@ -24,8 +28,8 @@ import time
 import traceback
 import functools
 from collections import OrderedDict, deque
-from functools import singledispatch
 from queue import Empty, Queue
+from types import MappingProxyType
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import (
@@ -36,6 +40,7 @@ from typing import (
     Iterable,
     List,
     Mapping,
+    NamedTuple,
     Optional,
     Set,
     Tuple,
@@ -154,6 +159,30 @@ def _configure_winapi_prototypes() -> None:
 
 _configure_winapi_prototypes()
 
+
+def _bind_user32(name: str, *, argtypes: Optional[list] = None, restype: Any = None) -> Any:
+    """解析一次 user32 导出函数并设置签名，供热路径直接调用。"""
+
+    func = getattr(_USER32, name, None) if _USER32 is not None else None
+    _safe_set_prototype(func, argtypes=argtypes, restype=restype)
+    return func
+
+
+_PRECT = ctypes.POINTER(wintypes.RECT)
+_IsWindow = _bind_user32("IsWindow", argtypes=[wintypes.HWND], restype=wintypes.BOOL)
+_IsWindowVisible = _bind_user32("IsWindowVisible", argtypes=[wintypes.HWND], restype=wintypes.BOOL)
+_IsIconic = _bind_user32("IsIconic", argtypes=[wintypes.HWND], restype=wintypes.BOOL)
+_GetClassNameW = _bind_user32(
+    "GetClassNameW", argtypes=[wintypes.HWND, wintypes.LPWSTR, ctypes.c_int], restype=ctypes.c_int
+)
+_GetForegroundWindow = _bind_user32("GetForegroundWindow", argtypes=[], restype=wintypes.HWND)
+_GetParent = _bind_user32("GetParent", argtypes=[wintypes.HWND], restype=wintypes.HWND)
+_GetAncestor = _bind_user32("GetAncestor", argtypes=[wintypes.HWND, wintypes.UINT], restype=wintypes.HWND)
+_GetWindowRect = _bind_user32("GetWindowRect", argtypes=[wintypes.HWND, _PRECT], restype=wintypes.BOOL)
+_SetForegroundWindow = _bind_user32("SetForegroundWindow", argtypes=[wintypes.HWND], restype=wintypes.BOOL)
+_SetActiveWindow = _bind_user32("SetActiveWindow", argtypes=[wintypes.HWND], restype=wintypes.HWND)
+_SetFocus = _bind_user32("SetFocus", argtypes=[wintypes.HWND], restype=wintypes.HWND)
+
 VK_UP = getattr(win32con, "VK_UP", 0x26)
 VK_DOWN = getattr(win32con, "VK_DOWN", 0x28)
 VK_LEFT = getattr(win32con, "VK_LEFT", 0x25)
@@ -178,9 +207,19 @@ def clamp(value: float, minimum: float, maximum: float) -> float:
     return max(minimum, min(maximum, value))
 
 
-_TRUE_STRINGS = frozenset({"1", "true", "yes", "on", "y", "t"})
-_FALSE_STRINGS = frozenset({"0", "false", "no", "off", "n", "f"})
+def _clamp_sorted(value: float, minimum: float, maximum: float) -> float:
+    """Fast :func:`clamp` for callers that already guarantee ``minimum <= maximum``."""
+
+    return minimum if value < minimum else (maximum if value > maximum else value)
+
+
+_BOOL_STRINGS = {
+    **dict.fromkeys(("1", "true", "yes", "on", "y", "t"), True),
+    **dict.fromkeys(("0", "false", "no", "off", "n", "f"), False),
+}
 _INVALID_SHEET_CHARS = frozenset("\\/:?*[]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_NA_TOKENS = frozenset({"nan", "none", "nat"})
 _PHOTO_SEGMENT_SANITIZER = re.compile(r"[^\w\u4e00-\u9fff-]+")
 
 
@@ -192,36 +231,20 @@ class _BooleanParseResult:
 NumberT = TypeVar("NumberT", int, float)
 
 
-@singledispatch
-def _coerce_bool(value: Any) -> object:
-    """Return a parsed boolean or :data:`_BooleanParseResult.UNRESOLVED`."""
-
-    return _BooleanParseResult.UNRESOLVED
-
-
-@_coerce_bool.register(bool)
 def _coerce_bool_from_bool(value: bool) -> bool:
     return value
 
 
-@_coerce_bool.register(int)
 def _coerce_bool_from_int(value: int) -> bool:
     return bool(value)
 
 
-@_coerce_bool.register(float)
 def _coerce_bool_from_float(value: float) -> object:
     if math.isnan(value):
         return _BooleanParseResult.UNRESOLVED
     return bool(value)
 
 
-@_coerce_bool.register(Enum)
-def _coerce_bool_from_enum(value: Enum) -> object:
-    return _coerce_bool(value.value)
-
-
-@_coerce_bool.register(bytes)
 def _coerce_bool_from_bytes(value: bytes) -> object:
     try:
         decoded = value.decode("utf-8")
@@ -230,8 +253,6 @@ def _coerce_bool_from_bytes(value: bytes) -> object:
     return _coerce_bool(decoded)
 
 
-@_coerce_bool.register(bytearray)
-@_coerce_bool.register(memoryview)
 def _coerce_bool_from_byteslike(value: Union[bytearray, memoryview]) -> object:
     """Handle common bytes-like inputs when converting to booleans."""
 
@@ -241,18 +262,22 @@ def _coerce_bool_from_byteslike(value: Union[bytearray, memoryview]) -> object:
         return _BooleanParseResult.UNRESOLVED
 
 
-@_coerce_bool.register(str)
+@functools.lru_cache(maxsize=512)
 def _coerce_bool_from_str(value: str) -> object:
+    """Parse textual booleans; cached since config values repeat a small vocabulary."""
+
     normalized = value.strip()
     if not normalized:
         return _BooleanParseResult.UNRESOLVED
     lowered = normalized.casefold()
-    if lowered in _TRUE_STRINGS:
-        return True
-    if lowered in _FALSE_STRINGS:
-        return False
+    keyword = _BOOL_STRINGS.get(lowered, _BooleanParseResult.UNRESOLVED)
+    if keyword is not _BooleanParseResult.UNRESOLVED:
+        return keyword
     signless = lowered[1:] if lowered[0] in "+-" and len(lowered) > 1 else lowered
     if signless.isdigit():
+        if signless.isascii():
+            # 纯 ASCII 数字无需构造整数：只要存在非零位即为真。
+            return signless.strip("0") != ""
         try:
             return bool(int(lowered, 10))
         except Exception:
@@ -266,6 +291,32 @@ def _coerce_bool_from_str(value: str) -> object:
     return bool(number)
 
 
+# 按精确类型分派的快速路径；子类与枚举在 _coerce_bool 中回退处理。
+_BOOL_COERCERS = {
+    bool: _coerce_bool_from_bool,
+    int: _coerce_bool_from_int,
+    float: _coerce_bool_from_float,
+    str: _coerce_bool_from_str,
+    bytes: _coerce_bool_from_bytes,
+    bytearray: _coerce_bool_from_byteslike,
+    memoryview: _coerce_bool_from_byteslike,
+}
+
+
+def _coerce_bool(value: Any) -> object:
+    """Return a parsed boolean or :data:`_BooleanParseResult.UNRESOLVED`."""
+
+    coercer = _BOOL_COERCERS.get(type(value))
+    if coercer is not None:
+        return coercer(value)
+    if isinstance(value, Enum):
+        return _coerce_bool(value.value)
+    for base, coercer in _BOOL_COERCERS.items():
+        if isinstance(value, base):
+            return coercer(value)
+    return _BooleanParseResult.UNRESOLVED
+
+
 def _coerce_to_text(value: Any) -> str:
     """Safely coerce *value* into text, returning an empty string on failure."""
 
@@ -358,6 +409,13 @@ def _ensure_writable_directory(path: str) -> bool:
         return False
     if not _ensure_directory(path):
         return False
+    return _is_writable_dir(path)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_writable_dir(path: str) -> bool:
+    """Probe an existing directory for write access once per process."""
+
     test_path: Optional[str] = None
     fd: Optional[int] = None
     try:
@@ -376,6 +434,12 @@ def _ensure_writable_directory(path: str) -> bool:
     return True
 
 
+def _abs(path: str) -> str:
+    """Return *path* made absolute, skipping :func:`os.path.abspath` for absolute inputs."""
+
+    return path if os.path.isabs(path) else os.path.abspath(path)
+
+
 def _collect_resource_roots() -> List[str]:
     """Return an ordered list of candidate directories containing bundled resources."""
 
@@ -385,7 +449,7 @@ def _collect_resource_roots() -> List[str]:
     def _append(path: Optional[str]) -> None:
         if not path:
             return
-        normalized = os.path.normpath(os.path.abspath(path))
+        normalized = os.path.normpath(_abs(path))
         if normalized in seen:
             return
         seen.add(normalized)
@@ -424,22 +488,27 @@ def _collect_resource_roots() -> List[str]:
 class _ResourceLocator:
     """Centralised helper for resolving bundled and user data paths."""
 
-    __slots__ = ("_roots", "_cache")
+    __slots__ = ("_roots", "_cached_candidates")
 
     def __init__(self) -> None:
         self._roots: Tuple[str, ...] = tuple(_collect_resource_roots())
-        self._cache: Dict[str, Tuple[str, ...]] = {}
+        # 每个实例独立的有界缓存，lru_cache 自带容量上限与线程安全。
+        self._cached_candidates = functools.lru_cache(maxsize=512)(self._compute_candidates)
 
     def candidates(self, relative_path: str) -> Tuple[str, ...]:
         normalized_key = os.path.normpath(str(relative_path).strip().replace("\\", "/"))
-        cached = self._cache.get(normalized_key)
-        if cached is not None:
-            return cached
+        return self._cached_candidates(normalized_key)
+
+    def _compute_candidates(self, normalized_key: str) -> Tuple[str, ...]:
         norm_rel = normalized_key.lstrip("./")
         if not norm_rel:
-            result = self._roots
-            self._cache[normalized_key] = result
-            return result
+            return self._roots
+        is_plain_relative = not (
+            os.path.isabs(norm_rel) or os.path.splitdrive(norm_rel)[0] or ".." in norm_rel.split(os.sep)
+        )
+        if is_plain_relative:
+            # 根目录已规范化且互不重复，拼接普通相对路径后无需再次规范化去重。
+            return tuple(os.path.join(root, norm_rel) for root in self._roots)
         paths: List[str] = []
         seen: Set[str] = set()
         for root in self._roots:
@@ -449,9 +518,7 @@ class _ResourceLocator:
                 continue
             seen.add(normalized)
             paths.append(normalized)
-        result = tuple(paths)
-        self._cache[normalized_key] = result
-        return result
+        return tuple(paths)
 
 
 @functools.lru_cache(maxsize=1)
@@ -460,6 +527,8 @@ def _get_resource_locator() -> _ResourceLocator:
 
 
 def _any_existing_path(paths: Iterable[str]) -> Optional[str]:
+    """Return the first candidate that exists, checking each with a single stat."""
+
     for path in paths:
         if path and os.path.exists(path):
             return path
@@ -504,18 +573,23 @@ def _choose_writable_target(
     return fallback
 
 
+@functools.lru_cache(maxsize=1024)
+def _normalized_path_pair(path: str) -> Tuple[str, str]:
+    """Return ``(normpath(abspath(path)), normcase(...))`` for candidate comparisons."""
+
+    normalized = os.path.normpath(_abs(path))
+    return normalized, os.path.normcase(normalized)
+
+
 def _mirror_resource_to_primary(primary: str, candidates: Tuple[str, ...]) -> None:
     if os.path.exists(primary):
         return
-    source = None
-    for candidate in candidates:
-        if not candidate:
-            continue
-        if os.path.normcase(os.path.abspath(candidate)) == os.path.normcase(os.path.abspath(primary)):
-            continue
-        if os.path.exists(candidate):
-            source = candidate
-            break
+    primary_marker = _normalized_path_pair(primary)[1]
+    source = _any_existing_path(
+        candidate
+        for candidate in candidates
+        if candidate and _normalized_path_pair(candidate)[1] != primary_marker
+    )
     if source is None:
         return
     directory = os.path.dirname(primary)
@@ -552,8 +626,7 @@ def _resolve_writable_resource(
     def _append(path: Optional[str]) -> None:
         if not path:
             return
-        normalized = os.path.normpath(os.path.abspath(path))
-        marker = os.path.normcase(normalized)
+        normalized, marker = _normalized_path_pair(path)
         if marker in seen:
             return
         seen.add(marker)
@@ -577,8 +650,9 @@ def _resolve_writable_resource(
 
     fallback = fallback_name or os.path.basename(normalized_rel) or normalized_rel.replace("/", "_")
     primary = _choose_writable_target(tuple(candidate_list), is_dir=is_dir, fallback_name=fallback)
+    primary_marker = os.path.normcase(primary)
     unique_candidates = (primary,) + tuple(
-        candidate for candidate in candidate_list if os.path.normcase(candidate) != os.path.normcase(primary)
+        candidate for candidate in candidate_list if _normalized_path_pair(candidate)[1] != primary_marker
     )
 
     if is_dir:
@@ -659,11 +733,11 @@ def _determine_student_photo_roots() -> Tuple[str, List[str]]:
 
 
 def _user32_window_rect(hwnd: int) -> Optional[Tuple[int, int, int, int]]:
-    if _USER32 is None or hwnd == 0:
+    if _GetWindowRect is None or hwnd == 0:
         return None
     rect = wintypes.RECT()
     try:
-        ok = bool(_USER32.GetWindowRect(wintypes.HWND(hwnd), ctypes.byref(rect)))
+        ok = bool(_GetWindowRect(hwnd, ctypes.byref(rect)))
     except Exception:
         return None
     if not ok:
@@ -672,72 +746,104 @@ def _user32_window_rect(hwnd: int) -> Optional[Tuple[int, int, int, int]]:
 
 
 def _user32_is_window(hwnd: int) -> bool:
-    if _USER32 is None or hwnd == 0:
+    if _IsWindow is None or hwnd == 0:
         return False
     try:
-        return bool(_USER32.IsWindow(wintypes.HWND(hwnd)))
+        return bool(_IsWindow(hwnd))
     except Exception:
         return False
 
 
 def _user32_is_window_visible(hwnd: int) -> bool:
-    if _USER32 is None or hwnd == 0:
+    if _IsWindowVisible is None or hwnd == 0:
         return False
     try:
-        return bool(_USER32.IsWindowVisible(wintypes.HWND(hwnd)))
+        return bool(_IsWindowVisible(hwnd))
     except Exception:
         return False
 
 
 def _user32_is_window_iconic(hwnd: int) -> bool:
-    if _USER32 is None or hwnd == 0:
+    if _IsIconic is None or hwnd == 0:
         return False
     try:
-        return bool(_USER32.IsIconic(wintypes.HWND(hwnd)))
+        return bool(_IsIconic(hwnd))
     except Exception:
         return False
 
 
+# Win32 查询在事件过滤器与定时器中频繁调用，按线程复用宽字符缓冲区以免反复分配。
+_WIN32_BUFFERS = threading.local()
+
+
+def _thread_unicode_buffer(size: int) -> Any:
+    buffers = getattr(_WIN32_BUFFERS, "buffers", None)
+    if buffers is None:
+        buffers = {}
+        _WIN32_BUFFERS.buffers = buffers
+    buffer = buffers.get(size)
+    if buffer is None:
+        buffer = ctypes.create_unicode_buffer(size)
+        buffers[size] = buffer
+    else:
+        buffer[0] = "\x00"
+    return buffer
+
+
+# 窗口类名在句柄存活期间不会变化；句柄可能被系统回收复用，因此命中时仍需确认窗口存在。
+_CLASS_NAME_CACHE: Dict[int, str] = {}
+_CLASS_NAME_CACHE_SIZE = 512
+
+
 def _user32_window_class_name(hwnd: int) -> str:
-    if _USER32 is None or hwnd == 0:
+    if _GetClassNameW is None or hwnd == 0:
         return ""
-    buffer = ctypes.create_unicode_buffer(256)
+    cached = _CLASS_NAME_CACHE.get(hwnd)
+    if cached is not None:
+        if _user32_is_window(hwnd):
+            return cached
+        _CLASS_NAME_CACHE.pop(hwnd, None)
+    buffer = _thread_unicode_buffer(256)
     try:
-        length = int(_USER32.GetClassNameW(wintypes.HWND(hwnd), buffer, len(buffer)))
+        length = int(_GetClassNameW(hwnd, buffer, len(buffer)))
     except Exception:
         return ""
     if length <= 0:
         return ""
-    return buffer.value.strip().lower()
+    class_name = buffer.value.strip().lower()
+    _CLASS_NAME_CACHE[hwnd] = class_name
+    if len(_CLASS_NAME_CACHE) > _CLASS_NAME_CACHE_SIZE:
+        # dict 保持插入顺序，淘汰最早写入的句柄即可。
+        del _CLASS_NAME_CACHE[next(iter(_CLASS_NAME_CACHE))]
+    return class_name
 
 
 def _user32_get_foreground_window() -> int:
-    if _USER32 is None:
+    if _GetForegroundWindow is None:
         return 0
     try:
-        return int(_USER32.GetForegroundWindow())
+        return int(_GetForegroundWindow() or 0)
     except Exception:
         return 0
 
 
 def _user32_get_parent(hwnd: int) -> int:
-    if _USER32 is None or hwnd == 0:
+    if _GetParent is None or hwnd == 0:
         return 0
     try:
-        return int(_USER32.GetParent(wintypes.HWND(hwnd)))
+        return int(_GetParent(hwnd) or 0)
     except Exception:
         return 0
 
 
+_GA_ROOT = getattr(win32con, "GA_ROOT", 2) if win32con is not None else 2
+
+
 def _user32_top_level_hwnd(hwnd: int) -> int:
-    if _USER32 is None or hwnd == 0:
+    if _GetAncestor is None or hwnd == 0:
         return hwnd
     try:
-        ga_root = getattr(win32con, "GA_ROOT", 2) if win32con is not None else 2
-    except Exception:
-        ga_root = 2
-    try:
-        ancestor = int(_USER32.GetAncestor(wintypes.HWND(hwnd), ga_root))
+        ancestor = int(_GetAncestor(hwnd, _GA_ROOT) or 0)
     except Exception:
         ancestor = 0
     if ancestor:
@@ -746,10 +852,13 @@ def _user32_top_level_hwnd(hwnd: int) -> int:
     return parent or hwnd
 
 
-@functools.lru_cache(maxsize=256)
-def _process_image_path(pid: int) -> str:
-    if pid <= 0 or _KERNEL32 is None:
-        return ""
+# 查询失败（权限不足、进程已退出）的 PID 短期内直接返回空串，避免反复 OpenProcess/CloseHandle。
+_PROC_PATH_LOCK = threading.Lock()
+_PROC_PATH_MISSES: Dict[int, float] = {}
+_PROC_PATH_MISS_TTL = 30.0
+
+
+def _query_process_image_path(pid: int) -> str:
     access = int(_PROCESS_QUERY_INFORMATION | _PROCESS_VM_READ)
     if _PROCESS_QUERY_LIMITED_INFORMATION:
         access |= int(_PROCESS_QUERY_LIMITED_INFORMATION)
@@ -765,9 +874,9 @@ def _process_image_path(pid: int) -> str:
             handle = None
     if not handle:
         return ""
+    buffer = _thread_unicode_buffer(512)
     try:
         if _PSAPI is not None:
-            buffer = ctypes.create_unicode_buffer(512)
             try:
                 length = int(_PSAPI.GetModuleFileNameExW(handle, None, buffer, len(buffer)))
             except Exception:
@@ -775,7 +884,6 @@ def _process_image_path(pid: int) -> str:
             if length:
                 return buffer.value.strip()
         if hasattr(_KERNEL32, "QueryFullProcessImageNameW"):
-            buffer = ctypes.create_unicode_buffer(512)
             size = wintypes.DWORD(len(buffer))
             try:
                 ok = bool(_KERNEL32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)))
@@ -791,22 +899,49 @@ def _process_image_path(pid: int) -> str:
     return ""
 
 
+@functools.lru_cache(maxsize=256)
+def _resolved_process_image_path(pid: int) -> str:
+    # 仅缓存成功结果：失败时抛出异常，lru_cache 不会记住它。
+    path = _query_process_image_path(pid)
+    if not path:
+        raise LookupError(pid)
+    return path
+
+
+def _process_image_path(pid: int) -> str:
+    if pid <= 0 or _KERNEL32 is None:
+        return ""
+    now = time.monotonic()
+    with _PROC_PATH_LOCK:
+        expiry = _PROC_PATH_MISSES.get(pid)
+        if expiry is not None:
+            if expiry > now:
+                return ""
+            del _PROC_PATH_MISSES[pid]
+    try:
+        return _resolved_process_image_path(pid)
+    except LookupError:
+        with _PROC_PATH_LOCK:
+            _PROC_PATH_MISSES[pid] = now + _PROC_PATH_MISS_TTL
+        return ""
+
+
 def _user32_focus_window(hwnd: int) -> bool:
     if _USER32 is None or hwnd == 0:
         return False
     focused = False
     try:
-        focused = bool(_USER32.SetForegroundWindow(wintypes.HWND(hwnd)))
+        focused = bool(_SetForegroundWindow(hwnd))
     except Exception:
         focused = False
     if not focused:
         try:
-            focused = bool(_USER32.SetActiveWindow(wintypes.HWND(hwnd)))
+            focused = bool(_SetActiveWindow(hwnd))
         except Exception:
             focused = False
     focus_ok = False
     try:
-        focus_ok = bool(_USER32.SetFocus(wintypes.HWND(hwnd)))
+        focus_ok = bool(_SetFocus(hwnd))
     except Exception:
         focus_ok = False
     return focused or focus_ok
@@ -839,11 +974,13 @@ from PyQt6.QtGui import (
     QFontDatabase,
     QFontMetrics,
     QIcon,
+    QImage,
     QPainter,
     QPainterPath,
     QPainterPathStroker,
     QPen,
     QPixmap,
+    QPixmapCache,
     QKeyEvent,
     QMouseEvent,
     QResizeEvent,
@@ -888,13 +1025,18 @@ _QT_NAVIGATION_KEYS = {
 
 # ---------- 运行环境准备 ----------
 
+_TTS_ENV_READY = False
+
+
 def _prepare_windows_tts_environment() -> None:
     """确保 Windows 打包环境下的语音依赖可以写入缓存。"""
 
-    if sys.platform != "win32":
+    global _TTS_ENV_READY
+    if _TTS_ENV_READY or sys.platform != "win32":
         return
-    cache_dir = os.environ.get("COMTYPES_CACHE_DIR", "").strip()
-    if cache_dir and os.path.isdir(cache_dir):
+    # 已显式配置的缓存目录直接信任，由 comtypes 自行处理，避免启动时额外的文件系统调用。
+    if os.environ.get("COMTYPES_CACHE_DIR", "").strip():
+        _TTS_ENV_READY = True
         return
     try:
         base = os.environ.get("LOCALAPPDATA")
@@ -903,6 +1045,7 @@ def _prepare_windows_tts_environment() -> None:
         cache_dir = os.path.join(base, "ClassroomTools", "comtypes_cache")
         os.makedirs(cache_dir, exist_ok=True)
         os.environ["COMTYPES_CACHE_DIR"] = cache_dir
+        _TTS_ENV_READY = True
     except Exception:
         # 打包环境下若目录创建失败，也不要阻塞主程序。
         pass
@@ -953,47 +1096,65 @@ _prepare_windows_tts_environment()
 # ---------- 图标 ----------
 class IconManager:
     """集中管理浮动工具条的 SVG 图标，方便后续统一换肤。"""
-    _icons: Dict[str, str] = {
-        "cursor": "PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+CiAgICA8cGF0aCBmaWxsPScjZjFmM2Y0JyBkPSdNNCAzLjMgMTEuNCAyMWwxLjgtNS44IDYuMy0yLjF6Jy8+CiAgICA8cGF0aCBmaWxsPScjOGFiNGY4JyBkPSdtMTIuNiAxNC40IDQuOCA0LjgtMi4xIDIuMS00LjItNC4yeicvPgo8L3N2Zz4=",
-        "shape": "PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+CiAgICA8cmVjdCB4PSczLjUnIHk9JzMuNScgd2lkdGg9JzknIGhlaWdodD0nOScgcng9JzInIGZpbGw9JyNmMWYzZjQnLz4KICAgIDxjaXJjbGUgY3g9JzE2LjUnIGN5PScxNi41JyByPSc1LjUnIGZpbGw9J25vbmUnIHN0cm9rZT0nI2YxZjNmNCcgc3Ryb2tlLXdpZHRoPScxLjgnLz4KICAgIDxjaXJjbGUgY3g9JzE2LjUnIGN5PScxNi41JyByPSczLjUnIGZpbGw9JyM4YWI0ZjgnIGZpbGwtb3BhY2l0eT0nMC4zNScvPgo8L3N2Zz4=",
-        "eraser": "PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHZpZXdCb3g9IjAgMCAyNCAyNCI+CiAgPHBhdGggZD0iTTQuNiAxNC4yIDExLjMgNy40YTIgMiAwIDAgMSAyLjggMGwzLjUgMy41YTIgMiAwIDAgMSAwIDIuOGwtNC44IDQuOEg5LjRhMiAyIDAgMCAxLTEuNC0uNmwtMy0zYTIgMiAwIDAgMSAwLTIuOHoiIGZpbGw9IiNmNGE5YjciLz4KICA8cGF0aCBkPSJNOS4yIDE5LjZoNi4xYy42IDAgMS4xLS4yIDEuNS0uNmwxLjctMS43IiBmaWxsPSJub25lIiBzdHJva2U9IiM1ZjYzNjgiIHN0cm9rZS13aWR0aD0iMS42IiBzdHJva2UtbGluZWNhcD0icm91bmQiLz4KICA8cGF0aCBkPSJtNy4yIDEyLjMgNC41IDQuNSIgZmlsbD0ibm9uZSIgc3Ryb2tlPSIjZmZmZmZmIiBzdHJva2Utd2lkdGg9IjEuNiIgc3Rya2UtbGluZWNhcD0icm91bmQiLz4KICA8cGF0aCBkPSJNMy42IDE4LjZoNiIgc3Ryb2tlPSIjNWY2MzY4IiBzdHJva2Utd2lkdGg9IjEuNiIgc3Rya2UtbGluZWNhcD0icm91bmQiLz4KPC9zdmc+",
-        "clear_all": "PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHZpZXdCb3g9IjAgMCAyNCAyNCI+CiAgPGRlZnM+CiAgICA8bGluZWFyR3JhZGllbnQgaWQ9ImciIHgxPSIwIiB4Mj0iMCIgeTE9IjAiIHkyPSIxIj4KICAgICAgPHN0b3Agb2Zmc2V0PSIwIiBzdG9wLWNvbG9yPSIjOGFiNGY4Ii8+CiAgICAgIDxzdG9wIG9mZnNldD0iMSIgc3RvcC1jb2xvcj0iIzFhNzNlOCIvPgogICAgPC9saW5lYXJHcmFkaWVudD4KICA8L2RlZnM+CiAgPHBhdGggZD0iTTUuNSA4aDEzbC0uOSAxMS4yQTIgMiAwIDAgMSAxNS42IDIxSDguNGEyIDIgMCAwIDEtMS45LTEuOEw1LjUgOHoiIGZpbGw9InVybCgjZykiIHN0cm9rZT0iIzFhNzNlOCIgc3Rya2Utd2lkdGg9IjEuMiIvPgogIDxwYXRoIGQ9Ik05LjUgNS41IDEwLjMgNGgzLjRsLjggMS41aDQuNSIgZmlsbD0ibm9uZSIgc3Rya2U9IiM1ZjYzNjgiIHN0cm9rZS13aWR0aD0iMS42IiBzdHJva2UtbGluZWNhcD0icm91bmQiIHN0cm9rZS1saW5lam9pbj0icm91bmQiLz4KICA8cGF0aCBkPSJNNSA1LjVoNCIgc3Ryb2tlPSIjNWY2MzY4IiBzdHJva2Utd2lkdGg9IjEuNiIgc3Rya2UtbGluZWNhcD0icm91bmQiLz4KICA8cGF0aCBkPSJNMTAgMTEuMnY2LjFNMTQgMTEuMnY2LjEiIHN0cm9rZT0iI2ZmZmZmZiIgc3Rya2Utd2lkdGg9IjEuNCIgc3Rya2UtbGluZWNhcD0icm91bmQiLz4KICA8cGF0aCBkPSJNOC4yIDExLjJ2Ni4xIiBzdHJva2U9IiMzYjc4ZTciIHN0cm9rZS13aWR0aD0iMS40IiBzdHJva2UtbGluZWNhcD0icm91bmQiIG9wYWNpdHk9Ii43Ii8+CiAgPHBhdGggZD0iTTE1LjggMTEuMnY2LjEiIHN0cm9rZT0iIzNiNzhlNyIgc3Rya2Utd2lkdGg9IjEuNCIgc3Rya2UtbGluZWNhcD0icm91bmQiIG9wYWNpdHk9Ii43Ii8+CiAgPHBhdGggZD0iTTYuMiAzLjYgNy40IDIuNCIgc3Ryb2tlPSIjZmJiYzA0IiBzdHJva2Utd2lkdGg9IjEuNCIgc3Rya2UtbGluZWNhcD0icm91bmQiLz4KICA8cGF0aCBkPSJtMTguNCAzLjQgMS40LTEuNCIgc3Rya2U9IiMzNGE4NTMiIHN0cm9rZS13aWR0aD0iMS40IiBzdHJva2UtbGluZWNhcD0icm91bmQiLz4KPC9zdmc+",
-        "settings": "PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+CiAgICA8Y2lyY2xlIGN4PScxMicgY3k9JzEyJyByPSczLjUnIGZpbGw9JyM4YWI0ZjgnLz4KICAgIDxwYXRoIGZpbGw9J25vbmUnIHN0cm9rZT0nI2YxZjNmNCcgc3Ryb2tlLXdpZHRoPScxLjYnIHN0cm9rZS1saW5lY2FwPSdyb3VuZCcgc3Ryb2tlLWxpbmVqb2luPSdyb3VuZCcKICAgICAgICBkPSdNMTIgNC41VjIuOG0wIDE4LjR2LTEuN203LjEtNy41SDIwbS0xOCAwaDEuNk0xNy42IDZsMS4yLTEuMk01LjIgMTguNCA2LjQgMTcuMk02LjQgNiA1LjIgNC44bTEzLjYgMTMuNi0xLjItMS4yJy8+Cjwvc3ZnPg==",
-        "whiteboard": "PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+CiAgICA8cmVjdCB4PSczJyB5PSc0JyB3aWR0aD0nMTgnIGhlaWdodD0nMTInIHJ4PScyJyByeT0nMicgZmlsbD0nI2YxZjNmNCcgZmlsbC1vcGFjaXR5PScwLjEyJyBzdHJva2U9JyNmMWYzZjQnIHN0cm9rZS13aWR0aD0nMS42Jy8+CiAgICA8cGF0aCBkPSdtNyAxOCA1LTUgNSA1JyBmaWxsPSdub25lJyBzdHJva2U9JyM4YWI0ZjgnIHN0cm9rZS13aWR0aD0nMS44JyBzdHJva2UtbGluZWNhcD0ncm91bmQnIHN0cm9rZS1saW5lam9pbj0ncm91bmQnLz4KICAgIDxwYXRoIGQ9J004IDloOG0tOCAzaDUnIHN0cm9rZT0nI2YxZjNmNCcgc3Ryb2tlLXdpZHRoPScxLjYnIHN0cm9rZS1saW5lY2FwPSdyb3VuZCcvPgo8L3N2Zz4=",
-        "undo": "PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+CiAgPHBhdGggZmlsbD0nI2YxZjNmNCcgZD0nTTguNCA1LjJMMyAxMC42bDUuNCA1LjQgMS40LTEuNC0yLjMtMi4zaDUuNWMzLjIgMCA1LjggMi42IDUuOCA1LjggMCAuNS0uMSAxLS4yIDEuNWwyLjEuNmMuMi0uNy4zLTEuNC4zLTIuMSAwLTQuNC0zLjYtOC04LThINy41bDIuMy0yLjMtMS40LTEuNHonLz4KPC9zdmc+",
+    _icons: Dict[str, bytes] = {
+        "cursor": b"PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+CiAgICA8cGF0aCBmaWxsPScjZjFmM2Y0JyBkPSdNNCAzLjMgMTEuNCAyMWwxLjgtNS44IDYuMy0yLjF6Jy8+CiAgICA8cGF0aCBmaWxsPScjOGFiNGY4JyBkPSdtMTIuNiAxNC40IDQuOCA0LjgtMi4xIDIuMS00LjItNC4yeicvPgo8L3N2Zz4=",
+        "shape": b"PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+CiAgICA8cmVjdCB4PSczLjUnIHk9JzMuNScgd2lkdGg9JzknIGhlaWdodD0nOScgcng9JzInIGZpbGw9JyNmMWYzZjQnLz4KICAgIDxjaXJjbGUgY3g9JzE2LjUnIGN5PScxNi41JyByPSc1LjUnIGZpbGw9J25vbmUnIHN0cm9rZT0nI2YxZjNmNCcgc3Ryb2tlLXdpZHRoPScxLjgnLz4KICAgIDxjaXJjbGUgY3g9JzE2LjUnIGN5PScxNi41JyByPSczLjUnIGZpbGw9JyM4YWI0ZjgnIGZpbGwtb3BhY2l0eT0nMC4zNScvPgo8L3N2Zz4=",
+        "eraser": b"PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHZpZXdCb3g9IjAgMCAyNCAyNCI+CiAgPHBhdGggZD0iTTQuNiAxNC4yIDExLjMgNy40YTIgMiAwIDAgMSAyLjggMGwzLjUgMy41YTIgMiAwIDAgMSAwIDIuOGwtNC44IDQuOEg5LjRhMiAyIDAgMCAxLTEuNC0uNmwtMy0zYTIgMiAwIDAgMSAwLTIuOHoiIGZpbGw9IiNmNGE5YjciLz4KICA8cGF0aCBkPSJNOS4yIDE5LjZoNi4xYy42IDAgMS4xLS4yIDEuNS0uNmwxLjctMS43IiBmaWxsPSJub25lIiBzdHJva2U9IiM1ZjYzNjgiIHN0cm9rZS13aWR0aD0iMS42IiBzdHJva2UtbGluZWNhcD0icm91bmQiLz4KICA8cGF0aCBkPSJtNy4yIDEyLjMgNC41IDQuNSIgZmlsbD0ibm9uZSIgc3Ryb2tlPSIjZmZmZmZmIiBzdHJva2Utd2lkdGg9IjEuNiIgc3Rya2UtbGluZWNhcD0icm91bmQiLz4KICA8cGF0aCBkPSJNMy42IDE4LjZoNiIgc3Ryb2tlPSIjNWY2MzY4IiBzdHJva2Utd2lkdGg9IjEuNiIgc3Rya2UtbGluZWNhcD0icm91bmQiLz4KPC9zdmc+",
+        "clear_all": b"PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHZpZXdCb3g9IjAgMCAyNCAyNCI+CiAgPGRlZnM+CiAgICA8bGluZWFyR3JhZGllbnQgaWQ9ImciIHgxPSIwIiB4Mj0iMCIgeTE9IjAiIHkyPSIxIj4KICAgICAgPHN0b3Agb2Zmc2V0PSIwIiBzdG9wLWNvbG9yPSIjOGFiNGY4Ii8+CiAgICAgIDxzdG9wIG9mZnNldD0iMSIgc3RvcC1jb2xvcj0iIzFhNzNlOCIvPgogICAgPC9saW5lYXJHcmFkaWVudD4KICA8L2RlZnM+CiAgPHBhdGggZD0iTTUuNSA4aDEzbC0uOSAxMS4yQTIgMiAwIDAgMSAxNS42IDIxSDguNGEyIDIgMCAwIDEtMS45LTEuOEw1LjUgOHoiIGZpbGw9InVybCgjZykiIHN0cm9rZT0iIzFhNzNlOCIgc3Rya2Utd2lkdGg9IjEuMiIvPgogIDxwYXRoIGQ9Ik05LjUgNS41IDEwLjMgNGgzLjRsLjggMS41aDQuNSIgZmlsbD0ibm9uZSIgc3Rya2U9IiM1ZjYzNjgiIHN0cm9rZS13aWR0aD0iMS42IiBzdHJva2UtbGluZWNhcD0icm91bmQiIHN0cm9rZS1saW5lam9pbj0icm91bmQiLz4KICA8cGF0aCBkPSJNNSA1LjVoNCIgc3Ryb2tlPSIjNWY2MzY4IiBzdHJva2Utd2lkdGg9IjEuNiIgc3Rya2UtbGluZWNhcD0icm91bmQiLz4KICA8cGF0aCBkPSJNMTAgMTEuMnY2LjFNMTQgMTEuMnY2LjEiIHN0cm9rZT0iI2ZmZmZmZiIgc3Rya2Utd2lkdGg9IjEuNCIgc3Rya2UtbGluZWNhcD0icm91bmQiLz4KICA8cGF0aCBkPSJNOC4yIDExLjJ2Ni4xIiBzdHJva2U9IiMzYjc4ZTciIHN0cm9rZS13aWR0aD0iMS40IiBzdHJva2UtbGluZWNhcD0icm91bmQiIG9wYWNpdHk9Ii43Ii8+CiAgPHBhdGggZD0iTTE1LjggMTEuMnY2LjEiIHN0cm9rZT0iIzNiNzhlNyIgc3Rya2Utd2lkdGg9IjEuNCIgc3Rya2UtbGluZWNhcD0icm91bmQiIG9wYWNpdHk9Ii43Ii8+CiAgPHBhdGggZD0iTTYuMiAzLjYgNy40IDIuNCIgc3Ryb2tlPSIjZmJiYzA0IiBzdHJva2Utd2lkdGg9IjEuNCIgc3Rya2UtbGluZWNhcD0icm91bmQiLz4KICA8cGF0aCBkPSJtMTguNCAzLjQgMS40LTEuNCIgc3Rya2U9IiMzNGE4NTMiIHN0cm9rZS13aWR0aD0iMS40IiBzdHJva2UtbGluZWNhcD0icm91bmQiLz4KPC9zdmc+",
+        "settings": b"PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+CiAgICA8Y2lyY2xlIGN4PScxMicgY3k9JzEyJyByPSczLjUnIGZpbGw9JyM4YWI0ZjgnLz4KICAgIDxwYXRoIGZpbGw9J25vbmUnIHN0cm9rZT0nI2YxZjNmNCcgc3Ryb2tlLXdpZHRoPScxLjYnIHN0cm9rZS1saW5lY2FwPSdyb3VuZCcgc3Ryb2tlLWxpbmVqb2luPSdyb3VuZCcKICAgICAgICBkPSdNMTIgNC41VjIuOG0wIDE4LjR2LTEuN203LjEtNy41SDIwbS0xOCAwaDEuNk0xNy42IDZsMS4yLTEuMk01LjIgMTguNCA2LjQgMTcuMk02LjQgNiA1LjIgNC44bTEzLjYgMTMuNi0xLjItMS4yJy8+Cjwvc3ZnPg==",
+        "whiteboard": b"PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+CiAgICA8cmVjdCB4PSczJyB5PSc0JyB3aWR0aD0nMTgnIGhlaWdodD0nMTInIHJ4PScyJyByeT0nMicgZmlsbD0nI2YxZjNmNCcgZmlsbC1vcGFjaXR5PScwLjEyJyBzdHJva2U9JyNmMWYzZjQnIHN0cm9rZS13aWR0aD0nMS42Jy8+CiAgICA8cGF0aCBkPSdtNyAxOCA1LTUgNSA1JyBmaWxsPSdub25lJyBzdHJva2U9JyM4YWI0ZjgnIHN0cm9rZS13aWR0aD0nMS44JyBzdHJva2UtbGluZWNhcD0ncm91bmQnIHN0cm9rZS1saW5lam9pbj0ncm91bmQnLz4KICAgIDxwYXRoIGQ9J004IDloOG0tOCAzaDUnIHN0cm9rZT0nI2YxZjNmNCcgc3Ryb2tlLXdpZHRoPScxLjYnIHN0cm9rZS1saW5lY2FwPSdyb3VuZCcvPgo8L3N2Zz4=",
+        "undo": b"PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+CiAgPHBhdGggZmlsbD0nI2YxZjNmNCcgZD0nTTguNCA1LjJMMyAxMC42bDUuNCA1LjQgMS40LTEuNC0yLjMtMi4zaDUuNWMzLjIgMCA1LjggMi42IDUuOCA1LjggMCAuNS0uMSAxLS4yIDEuNWwyLjEuNmMuMi0uNy4zLTEuNC4zLTIuMSAwLTQuNC0zLjYtOC04LThINy41bDIuMy0yLjMtMS40LTEuNHonLz4KPC9zdmc+",
+        "arrow_down": b"PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+PHBhdGggZmlsbD0nI2YxZjNmNCcgZD0nTTEyIDE2LjUgNSA5LjVoMTR6Jy8+PHBhdGggZmlsbD0nbm9uZScgc3Ryb2tlPScjMWE3M2U4JyBzdHJva2Utd2lkdGg9JzEuNScgc3Rya2UtbGluZWpvaW49J3JvdW5kJyBkPSdNMTIgMTYuNSA1IDkuNWgxNHonLz48L3N2Zz4=",
+        "arrow_up": b"PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+PHBhdGggZmlsbD0nI2YxZjNmNCcgZD0nTTEyIDcuNSAxOSAxNC41SDV6Jy8+PHBhdGggZmlsbD0nbm9uZScgc3Ryb2tlPScjMWE3M2U4JyBzdHJva2Utd2lkdGg9JzEuNScgc3Ryb2tlLWxpbmVqb2luPSdyb3VuZCcgZD0nTTEyIDcuNSAxOSAxNC41SDV6Jy8+PC9zdmc+",
+        "selection_delete": b"PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+PHJlY3QgeD0nNCcgeT0nNC41JyB3aWR0aD0nMTYnIGhlaWdodD0nMTInIGZpbGw9J25vbmUnIHN0cm9rZT0nI2YxZjNmNCcgc3Rya2Utd2lkdGg9JzEuNScgc3Rya2UtZGFzaGFycmF5PSczIDInIHN0cm9rZS1saW5lam9pbj0ncm91bmQnLz48cmVjdCB4PSc1LjQnIHk9JzUuOScgd2lkdGg9JzEzLjInIGhlaWdodD0nOS42JyBmaWxsPScjOGFiNGY4JyBvcGFjaXR5PScwLjE4Jy8+PHBhdGggZD0nTTkuMyAxNi4zIDE0IDExLjYgMTcgMTQuNiAxMi4zIDE5LjNjLS40LjQtMSAuNC0xLjQgMEw5LjMgMTcuN2ExIDEgMCAwIDEgMC0xLjRaJyBmaWxsPScjZjRhOWI3Jy8+PHBhdGggZD0nTTEzLjYgMTcgMTUuOSAxNC43JyBmaWxsPSdub25lJyBzdHJva2U9JyM1ZjYzNjgnIHN0cm9rZS13aWR0aD0nMS40JyBzdHJva2UtbGluZWNhcD0ncm91bmQnLz48L3N2Zz4=",
     }
+    # 键只来自固定图标名与画笔颜色，数量有限，无需额外的容量上限。
     _cache: Dict[str, QIcon] = {}
-    _icons.update(
-        {
-            "arrow_down": "PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+PHBhdGggZmlsbD0nI2YxZjNmNCcgZD0nTTEyIDE2LjUgNSA5LjVoMTR6Jy8+PHBhdGggZmlsbD0nbm9uZScgc3Ryb2tlPScjMWE3M2U4JyBzdHJva2Utd2lkdGg9JzEuNScgc3Rya2UtbGluZWpvaW49J3JvdW5kJyBkPSdNMTIgMTYuNSA1IDkuNWgxNHonLz48L3N2Zz4=",
-            "arrow_up": "PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+PHBhdGggZmlsbD0nI2YxZjNmNCcgZD0nTTEyIDcuNSAxOSAxNC41SDV6Jy8+PHBhdGggZmlsbD0nbm9uZScgc3Ryb2tlPScjMWE3M2U4JyBzdHJva2Utd2lkdGg9JzEuNScgc3Ryb2tlLWxpbmVqb2luPSdyb3VuZCcgZD0nTTEyIDcuNSAxOSAxNC41SDV6Jy8+PC9zdmc+",
-            "selection_delete": "PHN2ZyB4bWxucz0naHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnIHZpZXdCb3g9JzAgMCAyNCAyNCc+PHJlY3QgeD0nNCcgeT0nNC41JyB3aWR0aD0nMTYnIGhlaWdodD0nMTInIGZpbGw9J25vbmUnIHN0cm9rZT0nI2YxZjNmNCcgc3Rya2Utd2lkdGg9JzEuNScgc3Rya2UtZGFzaGFycmF5PSczIDInIHN0cm9rZS1saW5lam9pbj0ncm91bmQnLz48cmVjdCB4PSc1LjQnIHk9JzUuOScgd2lkdGg9JzEzLjInIGhlaWdodD0nOS42JyBmaWxsPScjOGFiNGY4JyBvcGFjaXR5PScwLjE4Jy8+PHBhdGggZD0nTTkuMyAxNi4zIDE0IDExLjYgMTcgMTQuNiAxMi4zIDE5LjNjLS40LjQtMSAuNC0xLjQgMEw5LjMgMTcuN2ExIDEgMCAwIDEgMC0xLjRaJyBmaWxsPScjZjRhOWI3Jy8+PHBhdGggZD0nTTEzLjYgMTcgMTUuOSAxNC43JyBmaWxsPSdub25lJyBzdHJva2U9JyM1ZjYzNjgnIHN0cm9rZS13aWR0aD0nMS40JyBzdHJva2UtbGluZWNhcD0ncm91bmQnLz48L3N2Zz4=",
-        }
-    )
+    _warm_worker: Optional["_IOWorker"] = None
 
-    @classmethod
-    def get_brush_icon(cls, color_hex: str) -> QIcon:
-        key = f"brush_{color_hex.lower()}"
-        if key in cls._cache:
-            return cls._cache[key]
-        pixmap = QPixmap(28, 28)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    _BRUSH_ICON_SIZE = 28
+
+    @staticmethod
+    def _paint_brush_swatch(painter: QPainter, x: int, color_hex: str) -> None:
         brush_color = QColor(color_hex)
         if not brush_color.isValid():
             brush_color = QColor("#999999")
         painter.setBrush(QBrush(brush_color))
         painter.setPen(QPen(QColor(0, 0, 0, 140), 1.4))
-        painter.drawEllipse(5, 6, 18, 18)
+        painter.drawEllipse(x + 5, 6, 18, 18)
         painter.setPen(QPen(QColor(255, 255, 255, 230), 3, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
-        painter.drawLine(9, 10, 18, 19)
+        painter.drawLine(x + 9, 10, x + 18, 19)
         painter.setPen(QPen(QColor(0, 0, 0, 90), 2, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
-        painter.drawLine(10, 9, 19, 18)
+        painter.drawLine(x + 10, 9, x + 19, 18)
+
+    @classmethod
+    def prime_brush_icons(cls, colors: Iterable[str]) -> None:
+        """将一组画笔色块一次性绘制到同一张图上，再切分为各自的图标缓存。"""
+
+        pending = [
+            color
+            for color in dict.fromkeys(str(value).lower() for value in colors)
+            if f"brush_{color}" not in cls._cache
+        ]
+        if not pending:
+            return
+        size = cls._BRUSH_ICON_SIZE
+        sheet = QPixmap(size * len(pending), size)
+        sheet.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(sheet)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        for index, color_hex in enumerate(pending):
+            cls._paint_brush_swatch(painter, index * size, color_hex)
         painter.end()
-        icon = QIcon(pixmap)
-        cls._cache[key] = icon
-        return icon
+        for index, color_hex in enumerate(pending):
+            cls._cache[f"brush_{color_hex}"] = QIcon(sheet.copy(index * size, 0, size, size))
+
+    @classmethod
+    def get_brush_icon(cls, color_hex: str) -> QIcon:
+        key = f"brush_{color_hex.lower()}"
+        if key not in cls._cache:
+            cls.prime_brush_icons((color_hex,))
+        return cls._cache[key]
 
     @classmethod
     def get_icon(cls, name: str) -> QIcon:
@@ -1007,33 +1168,143 @@ class IconManager:
             return QIcon()
         try:
             pixmap = QPixmap()
-            pixmap.loadFromData(QByteArray.fromBase64(data.encode("ascii")), "SVG")
+            pixmap.loadFromData(QByteArray.fromBase64(data), "SVG")
             icon = QIcon(pixmap)
             cls._cache[name] = icon
             return icon
         except Exception:
             return QIcon()
 
+    @classmethod
+    def _decode_images(cls, names: Tuple[str, ...]) -> Dict[str, QImage]:
+        # QImage 可在后台线程解码；QPixmap/QIcon 只能在 GUI 线程创建。
+        images: Dict[str, QImage] = {}
+        for name in names:
+            data = cls._icons.get(name)
+            if not data:
+                continue
+            image = QImage.fromData(QByteArray.fromBase64(data), "SVG")
+            if not image.isNull():
+                images[name] = image
+        return images
+
+    @classmethod
+    def _store_decoded(cls, images: Dict[str, QImage]) -> None:
+        cls._warm_worker = None
+        for name, image in images.items():
+            if name not in cls._cache:
+                cls._cache[name] = QIcon(QPixmap.fromImage(image))
+
+    @classmethod
+    def warm(cls) -> None:
+        """在线程池中预先解码全部工具条图标，首次绘制时无需再同步解析 SVG。"""
+
+        if cls._warm_worker is not None:
+            return
+        pending = tuple(name for name in cls._icons if name not in cls._cache)
+        if not pending:
+            return
+        worker = _IOWorker(cls._decode_images, pending)
+        worker.signals.finished.connect(cls._store_decoded)
+        worker.signals.error.connect(lambda _message, _exc: setattr(cls, "_warm_worker", None))
+        cls._warm_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
 
 # ---------- 可选依赖 ----------
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    pd = None
-    PANDAS_AVAILABLE = False
+class _LazyModule:
+    """首次访问属性时才导入 *name*，让未使用相关功能的启动跳过重量级模块。"""
+
+    def __init__(self, name: str, on_load: Optional[Callable[[Any], None]] = None) -> None:
+        self._name = name
+        self._on_load = on_load
+        self._module: Any = None
+        self._import_error: Optional[BaseException] = None
+
+    def _load(self) -> Any:
+        module = self._module
+        if module is None:
+            if self._import_error is not None:
+                raise ImportError(f"{self._name} is unavailable") from self._import_error
+            try:
+                module = importlib.import_module(self._name)
+            except Exception as exc:
+                # 已安装但无法导入（如二进制不兼容、缺少 PortAudio）时记为不可用，与启动时直接导入失败的降级一致。
+                self._import_error = exc
+                logger.warning("Optional module %s failed to import: %s", self._name, exc)
+                raise ImportError(f"{self._name} is unavailable") from exc
+            self._module = module
+            if self._on_load is not None:
+                self._on_load(module)
+        return module
+
+    def _importable(self) -> bool:
+        try:
+            self._load()
+        except ImportError:
+            return False
+        return True
 
-PANDAS_READY = PANDAS_AVAILABLE and pd is not None
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self._load(), attr)
 
-try:
-    OPENPYXL_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
-except Exception:
-    OPENPYXL_AVAILABLE = False
+
+class _ModuleGate:
+    """可选依赖的可用性标志：首次求值时才真正导入，导入失败即视为不可用。"""
+
+    __slots__ = ("_modules", "_ready")
+
+    def __init__(self, *modules: Optional[_LazyModule]) -> None:
+        self._modules = modules
+        self._ready: Optional[bool] = None
+
+    def __bool__(self) -> bool:
+        # 导入成败一经确定便不会再变，缓存结果让热路径上的判断只剩一次属性读取。
+        ready = self._ready
+        if ready is None:
+            ready = all(module is not None and module._importable() for module in self._modules)
+            self._ready = ready
+        return ready
+
+
+# pandas ≥ 2.0 支持写时复制：浅拷贝即可安全共享数据，修改时才真正复制。
+PANDAS_COPY_ON_WRITE = False
+
+
+def _configure_pandas(module: Any) -> None:
+    global PANDAS_COPY_ON_WRITE
+    try:
+        module.set_option("mode.copy_on_write", True)
+        PANDAS_COPY_ON_WRITE = True
+    except Exception:
+        PANDAS_COPY_ON_WRITE = False
+
+
+def _module_available(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except Exception:
+        return False
+
+
+# pandas 导入耗时明显，仅在首次真正使用名单数据时加载；已安装但无法导入时按未安装处理。
+pd: Any = _LazyModule("pandas", _configure_pandas) if _module_available("pandas") else None
+PANDAS_AVAILABLE = _ModuleGate(pd)
+
+PANDAS_READY = PANDAS_AVAILABLE
+
+OPENPYXL_AVAILABLE = _module_available("openpyxl")
+
+# 语音引擎只在首次播报时才需要，启动阶段仅确认其是否已安装。
+pyttsx3: Any = _LazyModule("pyttsx3") if _module_available("pyttsx3") else None
+PYTTSX3_AVAILABLE = _ModuleGate(pyttsx3)
 
 try:
-    import pyttsx3
+    import orjson  # type: ignore[import-not-found]
 except ImportError:
-    pyttsx3 = None
+    orjson = None  # type: ignore[assignment]
 
 try:
     import comtypes  # type: ignore[import-not-found]
@@ -1052,14 +1323,10 @@ except ImportError:
     pythoncom = None  # type: ignore[assignment]
     WIN32COM_AVAILABLE = False
 
-try:
-    import sounddevice as sd
-    import numpy as np
-    SOUNDDEVICE_AVAILABLE = True
-except ImportError:
-    sd = None
-    np = None
-    SOUNDDEVICE_AVAILABLE = False
+# numpy 与 sounddevice（含 PortAudio 初始化）仅在计时提示音真正播放时加载。
+np: Any = _LazyModule("numpy") if _module_available("numpy") else None
+sd: Any = _LazyModule("sounddevice") if _module_available("sounddevice") else None
+SOUNDDEVICE_AVAILABLE = _ModuleGate(sd, np)
 
 if TYPE_CHECKING:
     from pandas import DataFrame as PandasDataFrame
@@ -1094,7 +1361,7 @@ def _consume_embedded_roll_state() -> Optional[str]:
     return state
 
 # ---------- 缓存 ----------
-_SPEECH_ENV_CACHE: tuple[float, str, List[str]] = (0.0, "", [])
+_SPEECH_ENV_CACHE: tuple[float, str, Tuple[str, ...]] = (0.0, "", ())
 
 
 # ---------- DPI ----------
@@ -1129,51 +1396,167 @@ def geometry_to_text(widget: QWidget) -> str:
     return f"{width}x{height}+{frame.x()}+{frame.y()}"
 
 
-def apply_geometry_from_text(widget: QWidget, geometry: str) -> None:
-    if not geometry:
-        return
-    parts = geometry.split("+")
-    if len(parts) != 3:
-        return
-    size_part, x_str, y_str = parts
-    if "x" not in size_part:
-        return
-    width_str, height_str = size_part.split("x", 1)
+def _widget_minimum_size(widget: QWidget) -> Tuple[int, int]:
+    """合并窗口记录的基础最小尺寸与自定义下限。"""
+
+    # 这些属性都在实例上设置，直接查实例字典可避开完整的属性查找流程。
+    attrs = widget.__dict__
+    base_min_width = attrs.get("_base_minimum_width")
+    if base_min_width is None:
+        base_min_width = widget.minimumWidth()
+    base_min_height = attrs.get("_base_minimum_height")
+    if base_min_height is None:
+        base_min_height = widget.minimumHeight()
+    custom_min_width = attrs.get("_ensure_min_width", 160)
+    custom_min_height = attrs.get("_ensure_min_height", 120)
+    return max(base_min_width, custom_min_width), max(base_min_height, custom_min_height)
+
+
+class _ParsedGeometry(NamedTuple):
+    width: int
+    height: int
+    x: int
+    y: int
+
+
+_GEOMETRY_ALLOWED = frozenset("0123456789x+- \t")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_geometry_text(geometry: str) -> Optional[_ParsedGeometry]:
+    """解析 ``geometry_to_text`` 生成的 ``WxH+X+Y`` 文本，格式不符时返回 ``None``。"""
+
+    # 先做长度与字符集过滤：损坏的配置值无需进入逐段解析。
+    if not geometry or len(geometry) > 64 or not _GEOMETRY_ALLOWED.issuperset(geometry):
+        return None
+    size_part, _, position = geometry.strip().partition("+")
+    x_str, _, y_str = position.partition("+")
+    width_str, _, height_str = size_part.partition("x")
     try:
-        width = int(width_str)
-        height = int(height_str)
-        x = int(x_str)
-        y = int(y_str)
+        return _ParsedGeometry(int(width_str), int(height_str), int(x_str), int(y_str))
     except ValueError:
-        return
+        return None
+
+
+# 屏幕配置不变时，同一坐标对应的屏幕也不变；屏幕增删或几何变化时整体清空。
+_SCREEN_AT_CACHE: Dict[Tuple[int, int], Optional[QScreen]] = {}
+_SCREEN_AT_CACHE_LIMIT = 256
+_SCREEN_AT_HOOKED = False
 
-    base_min_width = getattr(widget, "_base_minimum_width", widget.minimumWidth())
-    base_min_height = getattr(widget, "_base_minimum_height", widget.minimumHeight())
 
-    custom_min_width = getattr(widget, "_ensure_min_width", 160)
-    custom_min_height = getattr(widget, "_ensure_min_height", 120)
+def _clear_screen_at_cache(*_args: object) -> None:
+    _SCREEN_AT_CACHE.clear()
 
-    min_width = max(base_min_width, custom_min_width)
-    min_height = max(base_min_height, custom_min_height)
 
-    screen = QApplication.screenAt(QPoint(x, y))
+def _watch_screen_for_screen_at(screen: QScreen) -> None:
+    # 任一屏幕几何变化都可能改变缓存中的结果（包括缓存为 None 的屏外坐标），故监听全部屏幕。
+    _SCREEN_AT_CACHE.clear()
+    screen.geometryChanged.connect(_clear_screen_at_cache)
+
+
+def _screen_at(x: int, y: int) -> Optional[QScreen]:
+    global _SCREEN_AT_HOOKED
+    key = (x, y)
+    if key in _SCREEN_AT_CACHE:
+        return _SCREEN_AT_CACHE[key]
+    app = QGuiApplication.instance()
+    if app is None:
+        return None
+    if not _SCREEN_AT_HOOKED:
+        app.screenAdded.connect(_watch_screen_for_screen_at)
+        app.screenRemoved.connect(_clear_screen_at_cache)
+        for existing in app.screens():
+            _watch_screen_for_screen_at(existing)
+        _SCREEN_AT_HOOKED = True
+    screen = QGuiApplication.screenAt(QPoint(x, y))
+    if len(_SCREEN_AT_CACHE) >= _SCREEN_AT_CACHE_LIMIT:
+        _SCREEN_AT_CACHE.clear()
+    _SCREEN_AT_CACHE[key] = screen
+    return screen
+
+
+def _apply_widget_geometry(widget: QWidget, x: int, y: int, width: int, height: int) -> None:
+    """仅在尺寸或位置确有变化时才调用 resize/move。"""
+
+    # 窗口显示前 pos()/size() 只是默认值，且跳过 move()/resize() 会让 WA_Moved/WA_Resized
+    # 保持未设置、由系统决定位置；因此仅在窗口可见或已被显式定位/调整过时才比较跳过。
+    visible = widget.isVisible()
+    size = widget.size()
+    if (
+        size.width() != width
+        or size.height() != height
+        or not (visible or widget.testAttribute(Qt.WidgetAttribute.WA_Resized))
+    ):
+        widget.resize(width, height)
+    # move() 以含边框的外框坐标为准，因此与 pos() 而非 geometry() 比较。
+    pos = widget.pos()
+    if pos.x() != x or pos.y() != y or not (visible or widget.testAttribute(Qt.WidgetAttribute.WA_Moved)):
+        widget.move(x, y)
+
+
+def apply_geometry_from_text(widget: QWidget, geometry: str) -> None:
+    if not geometry:
+        return
+    parsed = _parse_geometry_text(geometry)
+    if parsed is None:
+        return
+    width, height, x, y = parsed
+
+    min_width, min_height = _widget_minimum_size(widget)
+
+    screen = _screen_at(x, y)
     if screen is None:
         try:
             screen = widget.screen() or QApplication.primaryScreen()
         except Exception:
             screen = QApplication.primaryScreen()
-    if screen is not None:
-        available = screen.availableGeometry()
-        max_width = max(min_width, 320, int(available.width() * 0.9))
-        max_height = max(min_height, 240, int(available.height() * 0.9))
-        width = max(min_width, min(width, max_width))
-        height = max(min_height, min(height, max_height))
-        x = max(available.left(), min(x, available.right() - width))
-        y = max(available.top(), min(y, available.bottom() - height))
-    target_width = max(min_width, width)
-    target_height = max(min_height, height)
-    widget.resize(target_width, target_height)
-    widget.move(x, y)
+    if screen is None:
+        _apply_widget_geometry(widget, x, y, max(min_width, width), max(min_height, height))
+        return
+    x, y, width, height = _constrain_geometry_to_available(
+        screen.availableGeometry(), x, y, width, height, min_width, min_height
+    )
+    _apply_widget_geometry(widget, x, y, width, height)
+
+
+def _constrain_geometry_to_available(
+    available: QRect,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    min_width: int,
+    min_height: int,
+) -> Tuple[int, int, int, int]:
+    """把保存的几何限制在可用区域内，尺寸上限为可用区域的 90%。"""
+
+    left, top, right, bottom = available.getCoords()
+    max_width = max(min_width, 320, int((right - left + 1) * 0.9))
+    max_height = max(min_height, 240, int((bottom - top + 1) * 0.9))
+    # 上下界均已保证有序，可直接使用单次条件表达式的夹取。
+    width = _clamp_sorted(width, min_width, max_width)
+    height = _clamp_sorted(height, min_height, max_height)
+    x = _clamp_sorted(x, left, max(left, right - width))
+    y = _clamp_sorted(y, top, max(top, bottom - height))
+    return x, y, width, height
+
+
+def _measure_widget_geometry(widget: QWidget) -> Tuple[int, int, int, int]:
+    """一次取回内外几何矩形，返回 ``(x, y, width, height)``。"""
+
+    inner = widget.geometry()
+    frame = widget.frameGeometry()
+    frame_width = frame.width()
+    frame_height = frame.height()
+    width = inner.width() or frame_width
+    height = inner.height() or frame_height
+    if not (width and height):
+        hint = widget.sizeHint()
+        width = width or hint.width()
+        height = height or hint.height()
+    x = frame.x() if frame_width else inner.x()
+    y = frame.y() if frame_height else inner.y()
+    return x, y, width, height
 
 
 def ensure_widget_within_screen(widget: QWidget) -> None:
@@ -1186,19 +1569,10 @@ def ensure_widget_within_screen(widget: QWidget) -> None:
         screen = QApplication.primaryScreen()
     if screen is None:
         return
-    base_min_width = getattr(widget, "_base_minimum_width", widget.minimumWidth())
-    base_min_height = getattr(widget, "_base_minimum_height", widget.minimumHeight())
-
-    custom_min_width = getattr(widget, "_ensure_min_width", 160)
-    custom_min_height = getattr(widget, "_ensure_min_height", 120)
-
-    min_width = max(base_min_width, custom_min_width)
-    min_height = max(base_min_height, custom_min_height)
+    min_width, min_height = _widget_minimum_size(widget)
 
     available = screen.availableGeometry()
-    geom = widget.frameGeometry()
-    width = widget.width() or geom.width() or widget.sizeHint().width()
-    height = widget.height() or geom.height() or widget.sizeHint().height()
+    x, y, width, height = _measure_widget_geometry(widget)
     max_width = min(available.width(), max(min_width, int(available.width() * 0.9)))
     max_height = min(available.height(), max(min_height, int(available.height() * 0.9)))
     width = max(min_width, min(width, max_width))
@@ -1207,12 +1581,20 @@ def ensure_widget_within_screen(widget: QWidget) -> None:
     top_limit = available.y()
     right_limit = max(left_limit, available.x() + available.width() - width)
     bottom_limit = max(top_limit, available.y() + available.height() - height)
-    x = geom.x() if geom.width() else widget.x()
-    y = geom.y() if geom.height() else widget.y()
-    x = max(left_limit, min(x, right_limit))
-    y = max(top_limit, min(y, bottom_limit))
-    widget.resize(width, height)
-    widget.move(x, y)
+    x = _clamp_sorted(x, left_limit, right_limit)
+    y = _clamp_sorted(y, top_limit, bottom_limit)
+    _apply_widget_geometry(widget, x, y, width, height)
+
+
+def _dumps_json(value: Any) -> str:
+    """序列化为 JSON 文本；安装了 orjson 时优先使用其 C 实现。"""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False)
 
 
 def bool_to_str(value: bool) -> str:
@@ -1220,15 +1602,14 @@ def bool_to_str(value: bool) -> str:
 
 
 def dedupe_strings(values: List[str]) -> List[str]:
-    seen: set[str] = set()
-    unique: List[str] = []
-    for value in values:
-        normalized = value.strip() if isinstance(value, str) else ""
-        if not normalized or normalized in seen:
-            continue
-        seen.add(normalized)
-        unique.append(normalized)
-    return unique
+    stripped = (value.strip() for value in values if isinstance(value, str))
+    return list(dict.fromkeys(text for text in stripped if text))
+
+
+def _copy_dataframe(df: "PandasDataFrame") -> "PandasDataFrame":
+    """返回独立的 DataFrame 副本；启用写时复制时仅做浅拷贝。"""
+
+    return df.copy(deep=not PANDAS_COPY_ON_WRITE)
 
 
 def _new_student_dataframe() -> Optional["PandasDataFrame"]:
@@ -1237,7 +1618,7 @@ def _new_student_dataframe() -> Optional["PandasDataFrame"]:
     if not (PANDAS_READY and pd is not None):
         return None
     try:
-        return _empty_student_dataframe().copy()
+        return _empty_student_dataframe()
     except Exception:
         try:
             return pd.DataFrame(columns=DEFAULT_STUDENT_COLUMNS)
@@ -1249,13 +1630,48 @@ def recommended_control_height(font: QFont, *, extra: int = 0, minimum: int = 0)
     """根据字体高度返回推荐控件高度，避免不同平台字体溢出。"""
 
     try:
-        fm = QFontMetrics(font)
-        height = fm.height() + int(extra)
+        height = _font_line_height(font.toString()) + int(extra)
     except Exception:
         height = minimum
     return max(int(minimum), int(height))
 
 
+@functools.lru_cache(maxsize=32)
+def _font_line_height(font_spec: str) -> int:
+    """按 ``QFont.toString()`` 缓存字体行高，避免每个控件都重新构造 QFontMetrics。"""
+
+    font = QFont()
+    font.fromString(font_spec)
+    return QFontMetrics(font).height()
+
+
+@functools.lru_cache(maxsize=256)
+def _fit_font_size(w: int, h: int, text: str, monospace: bool, minimum: int, maximum: int) -> int:
+    """估算在 w×h 区域内完整显示 *text* 的字号；结果只取决于参数，可安全缓存。"""
+
+    if not text or w < 20 or h < 20:
+        return minimum
+    w_eff = max(1, w - 16)
+    h_eff = max(1, h - 16)
+    is_cjk = any("\u4e00" <= c <= "\u9fff" for c in text)
+    length = max(1, len(text))
+    width_char_factor = 1.0 if is_cjk else (0.58 if monospace else 0.6)
+    size_by_width = w_eff / (length * width_char_factor)
+    size_by_height = h_eff * 0.70
+    final_size = int(min(size_by_width, size_by_height))
+    return max(minimum, min(maximum, final_size))
+
+
+@functools.lru_cache(maxsize=32)
+def _max_text_advance(font_spec: str, texts: Tuple[str, ...]) -> int:
+    """返回 *texts* 在指定字体（``QFont.toString()`` 描述）下的最大水平宽度。"""
+
+    font = QFont()
+    font.fromString(font_spec)
+    metrics = QFontMetrics(font)
+    return max((metrics.horizontalAdvance(text) for text in texts), default=0)
+
+
 def ask_quiet_confirmation(parent: QWidget, message: str, title: str) -> bool:
     """弹出简洁的确认对话框，返回用户是否选择“确定”。"""
 
@@ -1303,7 +1719,7 @@ def _normalize_text(value: object) -> str:
             return ""
     text = str(value).strip()
     lowered = text.lower()
-    if lowered in {"nan", "none", "nat"}:
+    if lowered in _NA_TOKENS:
         return ""
     return text
 
@@ -1316,16 +1732,16 @@ def _normalize_student_dataframe(
     if not PANDAS_READY:
         return df.copy()
 
-    normalized = df.copy()
+    normalized = _copy_dataframe(df)
     for column in ("学号", "姓名", "分组"):
         if column not in normalized.columns:
             normalized[column] = pd.NA
     # 清理已废弃的成绩列，避免旧数据影响界面
     normalized = normalized.drop(columns=["成绩"], errors="ignore")
 
-    normalized["姓名"] = normalized["姓名"].apply(lambda v: re.sub(r"\s+", "", _normalize_text(v))).str.upper()
+    normalized["姓名"] = normalized["姓名"].apply(lambda v: _WHITESPACE_RE.sub("", _normalize_text(v))).str.upper()
 
-    id_series = normalized["学号"].apply(lambda v: re.sub(r"\s+", "", _normalize_text(v)))
+    id_series = normalized["学号"].apply(lambda v: _WHITESPACE_RE.sub("", _normalize_text(v)))
     id_numeric = pd.to_numeric(id_series.replace("", pd.NA), errors="coerce")
     if not id_numeric.empty:
         try:
@@ -1345,7 +1761,7 @@ def _normalize_student_dataframe(
     normalized = normalized[ordered_columns + extra_columns]
 
     if drop_incomplete:
-        normalized = normalized[(normalized["学号"].notna()) & (normalized["姓名"] != "")].copy()
+        normalized = _copy_dataframe(normalized[(normalized["学号"].notna()) & (normalized["姓名"] != "")])
         normalized.reset_index(drop=True, inplace=True)
 
     return normalized
@@ -1356,10 +1772,10 @@ def _empty_student_dataframe() -> "PandasDataFrame":
         raise RuntimeError("Pandas support is required to create student data tables.")
     global _EMPTY_STUDENT_TEMPLATE
     if _EMPTY_STUDENT_TEMPLATE is not None:
-        return _EMPTY_STUDENT_TEMPLATE.copy(deep=True)
+        return _copy_dataframe(_EMPTY_STUDENT_TEMPLATE)
     template = pd.DataFrame({column: [] for column in DEFAULT_STUDENT_COLUMNS})
     normalized = _normalize_student_dataframe(template, drop_incomplete=False)
-    _EMPTY_STUDENT_TEMPLATE = normalized.copy(deep=True)
+    _EMPTY_STUDENT_TEMPLATE = _copy_dataframe(normalized)
     return normalized
 
 
@@ -1391,7 +1807,7 @@ class StudentWorkbook:
                     normalized = pd.DataFrame(df)
                 ordered[safe_name] = normalized
         if not ordered:
-            ordered["班级1"] = _empty_student_dataframe().copy()
+            ordered["班级1"] = _empty_student_dataframe()
         self.sheets = ordered
         if not self.active_class or self.active_class not in self.sheets:
             self.active_class = next(iter(self.sheets))
@@ -1525,6 +1941,14 @@ class MappingReader:
         max_value: Optional[int] = None,
     ) -> int:
         raw = self._raw(key, fallback)
+        if type(raw) is str and raw.isascii() and raw.isdigit():
+            # 配置文件里几乎都是纯数字串，直接转换，跳过通用的类型分派与异常处理。
+            value = int(raw)
+            if min_value is not None and value < min_value:
+                return min_value
+            if max_value is not None and value > max_value:
+                return max_value
+            return value
         return self._coerce_number(raw, fallback, int, min_value, max_value)
 
     def get_float(
@@ -1675,10 +2099,11 @@ def _compute_presentation_category(
     return "other"
 
 
+@functools.lru_cache(maxsize=None)
 def _try_import_module(module: str) -> bool:
+    # 仅定位模块而不执行其代码；子模块的定位会导入其父包。
     try:
-        importlib.import_module(module)
-        return True
+        return importlib.util.find_spec(module) is not None
     except Exception:
         return False
 
@@ -1704,19 +2129,33 @@ def _count_windows_voice_tokens() -> tuple[int, Optional[str]]:
                 except OSError as exc:
                     return 0, str(exc)
                 with contextlib.closing(handle):
-                    index = 0
-                    while True:
-                        try:
-                            name = winreg.EnumKey(handle, index)  # type: ignore[name-defined]
-                        except OSError:
-                            break
-                        token_names.add(str(name))
-                        index += 1
+                    try:
+                        subkey_count = winreg.QueryInfoKey(handle)[0]  # type: ignore[name-defined]
+                    except OSError:
+                        continue
+                    enum_key = winreg.EnumKey  # type: ignore[name-defined]
+                    try:
+                        token_names.update(str(enum_key(handle, index)) for index in range(subkey_count))
+                    except OSError:
+                        # 枚举期间子键被删除时保留已读取的部分。
+                        pass
     except Exception as exc:
         return 0, str(exc)
     return len(token_names), None
 
 
+_POWERSHELL_SYSTEM_CANDIDATES = (
+    ("System32", "WindowsPowerShell", "v1.0", "pwsh.exe"),
+    ("System32", "WindowsPowerShell", "v1.0", "powershell.exe"),
+    ("SysWOW64", "WindowsPowerShell", "v1.0", "powershell.exe"),
+)
+_POWERSHELL_FIXED_CANDIDATES = (
+    os.path.join("C:\\Program Files\\PowerShell\\7", "pwsh.exe"),
+    os.path.join("C:\\Program Files\\PowerShell\\6", "pwsh.exe"),
+)
+
+
+@functools.lru_cache(maxsize=1)
 def _find_powershell_executable() -> Optional[str]:
     if sys.platform != "win32":
         return None
@@ -1724,30 +2163,83 @@ def _find_powershell_executable() -> Optional[str]:
     if path:
         return path
     system_root = os.environ.get("SystemRoot") or os.environ.get("WINDIR")
-    candidate_paths: List[str] = []
-    if system_root:
-        candidate_paths.extend(
-            [
-                os.path.join(system_root, "System32", "WindowsPowerShell", "v1.0", "pwsh.exe"),
-                os.path.join(system_root, "System32", "WindowsPowerShell", "v1.0", "powershell.exe"),
-                os.path.join(system_root, "SysWOW64", "WindowsPowerShell", "v1.0", "powershell.exe"),
-            ]
-        )
-    candidate_paths.extend(
-        [
-            os.path.join("C:\\Program Files\\PowerShell\\7", "pwsh.exe"),
-            os.path.join("C:\\Program Files\\PowerShell\\6", "pwsh.exe"),
-        ]
+    system_paths = (
+        (os.path.join(system_root, *parts) for parts in _POWERSHELL_SYSTEM_CANDIDATES) if system_root else ()
     )
-    for candidate in candidate_paths:
-        if candidate and os.path.exists(candidate):
+    for candidate in itertools.chain(system_paths, _POWERSHELL_FIXED_CANDIDATES):
+        if os.path.exists(candidate):
             return candidate
     return None
 
 
-def _probe_powershell_speech_runtime(executable: Optional[str]) -> tuple[bool, Optional[str]]:
+# PowerShell 语音探测需要启动子进程并加载 System.Speech，结果按可执行文件指纹持久化，跨次启动复用。
+_POWERSHELL_PROBE_CACHE_NAME = "speech_probe.json"
+_POWERSHELL_PROBE_MAX_AGE = 7 * 24 * 3600
+
+
+def _powershell_probe_cache_path() -> str:
+    return os.path.join(_preferred_app_directory(), _POWERSHELL_PROBE_CACHE_NAME)
+
+
+def _powershell_probe_key(executable: str) -> Optional[str]:
+    try:
+        stat = os.stat(executable)
+    except OSError:
+        return None
+    return f"{os.path.normcase(os.path.abspath(executable))}|{int(stat.st_mtime)}|{stat.st_size}"
+
+
+def _load_powershell_probe(key: str) -> Optional[tuple[bool, Optional[str]]]:
+    try:
+        with open(_powershell_probe_cache_path(), "r", encoding="utf-8") as handle:
+            record = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(record, dict) or record.get("key") != key:
+        return None
+    try:
+        age = time.time() - float(record.get("timestamp", 0))
+    except (TypeError, ValueError):
+        return None
+    if not 0 <= age < _POWERSHELL_PROBE_MAX_AGE:
+        return None
+    if not record.get("ok"):
+        return None
+    return True, None
+
+
+def _store_powershell_probe(key: str, ok: bool, reason: Optional[str]) -> None:
+    path = _powershell_probe_cache_path()
+    if not _ensure_directory(os.path.dirname(path)):
+        return
+    record = {"key": key, "ok": bool(ok), "reason": reason, "timestamp": time.time()}
+    try:
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(_dumps_json(record))
+    except OSError:
+        logger.debug("Failed to persist PowerShell speech probe result", exc_info=True)
+
+
+def _probe_powershell_speech_runtime(
+    executable: Optional[str],
+    *,
+    use_cache: bool = True,
+) -> tuple[bool, Optional[str]]:
     if sys.platform != "win32" or not executable:
         return True, None
+    key = _powershell_probe_key(executable)
+    if use_cache and key is not None:
+        cached = _load_powershell_probe(key)
+        if cached is not None:
+            return cached
+    ok, reason = _run_powershell_speech_probe(executable)
+    # 只持久化成功结果：首次冷启动 PowerShell 可能超时，失败结果留待下次启动重新探测。
+    if ok and key is not None:
+        _store_powershell_probe(key, ok, reason)
+    return ok, reason
+
+
+def _run_powershell_speech_probe(executable: str) -> tuple[bool, Optional[str]]:
     script = (
         "try { "
         "Add-Type -AssemblyName System.Speech; "
@@ -1760,7 +2252,16 @@ def _probe_powershell_speech_runtime(executable: Optional[str]) -> tuple[bool, O
         startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
     try:
         result = subprocess.run(
-            [executable, "-NoLogo", "-NonInteractive", "-NoProfile", "-Command", script],
+            [
+                executable,
+                "-NoLogo",
+                "-NonInteractive",
+                "-NoProfile",
+                "-ExecutionPolicy",
+                "Bypass",
+                "-Command",
+                script,
+            ],
             capture_output=True,
             text=True,
             timeout=8,
@@ -1779,8 +2280,9 @@ def _probe_powershell_speech_runtime(executable: Optional[str]) -> tuple[bool, O
     return True, None
 
 
+@functools.lru_cache(maxsize=1)
 def _detect_pyttsx3_driver_issue() -> Optional[str]:
-    if pyttsx3 is None or sys.platform != "win32":
+    if sys.platform != "win32" or not PYTTSX3_AVAILABLE:
         return None
     try:
         drivers_spec = importlib.util.find_spec("pyttsx3.drivers")
@@ -1792,26 +2294,40 @@ def _detect_pyttsx3_driver_issue() -> Optional[str]:
     return None
 
 
+_SPEECH_MODULE_HINTS = (
+    ("pyttsx3", "请安装 pyttsx3（命令：pip install pyttsx3）"),
+    ("comtypes.client", "请安装 comtypes（命令：pip install comtypes）"),
+    ("win32com.client", "请安装 pywin32（命令：pip install pywin32）"),
+)
+
+
 def detect_speech_environment_issues(
     force_refresh: bool = False,
     cache_seconds: float = 30.0,
-) -> tuple[str, List[str]]:
+) -> tuple[str, Tuple[str, ...]]:
+    """返回语音环境问题与建议；建议以只读元组返回，缓存命中时无需复制。"""
+
     global _SPEECH_ENV_CACHE
     now = time.time()
     cached_at, cached_reason, cached_suggestions = _SPEECH_ENV_CACHE
     if not force_refresh and cached_at and now - cached_at < cache_seconds:
-        return cached_reason, list(cached_suggestions)
+        return cached_reason, cached_suggestions
 
     issues: List[str] = []
     suggestions: List[str] = []
     if sys.platform == "win32":
+        # 注册表枚举、驱动定位与 PowerShell 子进程互不依赖，并行执行以缩短总耗时。
+        powershell_path = _find_powershell_executable()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            token_future = executor.submit(_count_windows_voice_tokens)
+            driver_future = executor.submit(_detect_pyttsx3_driver_issue)
+            ps_future = (
+                executor.submit(_probe_powershell_speech_runtime, powershell_path, use_cache=not force_refresh)
+                if powershell_path
+                else None
+            )
         missing: List[str] = []
-        module_hints = (
-            ("pyttsx3", "请安装 pyttsx3（命令：pip install pyttsx3）"),
-            ("comtypes.client", "请安装 comtypes（命令：pip install comtypes）"),
-            ("win32com.client", "请安装 pywin32（命令：pip install pywin32）"),
-        )
-        for module_name, hint in module_hints:
+        for module_name, hint in _SPEECH_MODULE_HINTS:
             if not _try_import_module(module_name):
                 base_name = module_name.split(".")[0]
                 if base_name not in missing:
@@ -1822,22 +2338,21 @@ def detect_speech_environment_issues(
             suggestions.append("未检测到 pywin32，推荐安装以启用本地 SAPI 播报（速度快、可选发音人）。")
         if missing:
             issues.append(f"缺少依赖包{'、'.join(sorted(missing))}")
-        token_count, token_error = _count_windows_voice_tokens()
+        token_count, token_error = token_future.result()
         if token_error:
             issues.append(f"无法读取语音库信息：{token_error}")
         elif token_count == 0:
             issues.append("系统未检测到任何语音包")
             suggestions.append("请在 Windows 设置 -> 时间和语言 -> 语音 中下载并启用语音包")
-        driver_issue = _detect_pyttsx3_driver_issue()
+        driver_issue = driver_future.result()
         if driver_issue:
             issues.append(driver_issue)
             suggestions.append("请确认 pyttsx3 的 SAPI5 驱动已随程序打包，或在命令提示窗运行：python -m pip install pyttsx3 comtypes pywin32")
-        powershell_path = _find_powershell_executable()
-        if not powershell_path:
+        if ps_future is None:
             issues.append("未检测到 PowerShell，可用语音回退不可用")
             suggestions.append("请确保系统安装了 PowerShell 5+ 或 PowerShell 7，并能在 PATH 中访问")
         else:
-            ps_ok, ps_reason = _probe_powershell_speech_runtime(powershell_path)
+            ps_ok, ps_reason = ps_future.result()
             if not ps_ok:
                 detail = (ps_reason or "").strip()
                 if detail:
@@ -1852,15 +2367,16 @@ def detect_speech_environment_issues(
     else:
         suggestions.append("请确认系统已安装可用的语音引擎（如 espeak 或系统自带语音）。")
     reason = "；".join(issues)
-    deduped = dedupe_strings(suggestions)
-    _SPEECH_ENV_CACHE = (now, reason, list(deduped))
-    return reason, list(deduped)
+    deduped = tuple(dedupe_strings(suggestions))
+    _SPEECH_ENV_CACHE = (now, reason, deduped)
+    return reason, deduped
 
 
 class QuietInfoPopup(QWidget):
     """提供一个静音的小型提示窗口，避免系统提示音干扰课堂。"""
 
-    _active_popups: List["QuietInfoPopup"] = []
+    # 强引用保持无父窗口的提示框存活，直到 Qt 销毁它们。
+    _active_popups: Set["QuietInfoPopup"] = set()
 
     def __init__(self, parent: Optional[QWidget], text: str, title: str) -> None:
         flags = (
@@ -1897,7 +2413,7 @@ class QuietInfoPopup(QWidget):
         button_row.addWidget(self.ok_button)
         layout.addLayout(button_row)
 
-        QuietInfoPopup._active_popups.append(self)
+        QuietInfoPopup._active_popups.add(self)
         self.destroyed.connect(self._cleanup)
 
     def showEvent(self, event) -> None:  # type: ignore[override]
@@ -1923,10 +2439,7 @@ class QuietInfoPopup(QWidget):
         self.move(geo.topLeft())
 
     def _cleanup(self, *_args) -> None:
-        try:
-            QuietInfoPopup._active_popups.remove(self)
-        except ValueError:
-            pass
+        QuietInfoPopup._active_popups.discard(self)
 
 
 def show_quiet_information(parent: Optional[QWidget], text: str, title: str = "提示") -> None:
@@ -2197,7 +2710,9 @@ def apply_button_style(button: QPushButton, style: str, *, height: Optional[int]
         button.setMinimumHeight(height)
         button.setMaximumHeight(height)
         button.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
-    button.setStyleSheet(style)
+    # 相同样式表再次设置也会触发重新解析与 repolish，内容未变时直接跳过。
+    if button.styleSheet() != style:
+        button.setStyleSheet(style)
 
 
 def style_dialog_buttons(
@@ -2227,17 +2742,85 @@ def style_dialog_buttons(
 
 
 # ---------- 配置 ----------
+_INI_SECTION_RE = re.compile(r"\[([^\]]+)\]\s*")
+_INI_KV_RE = re.compile(r"([^=:\s;#\[][^=:]*?)\s*=\s*(.*?)\s*")
+
+
+def _parse_settings_text(text: str) -> Optional[Dict[str, Dict[str, str]]]:
+    """Parse the flat INI layout written by ``SettingsManager.save_settings``.
+
+    Returns ``None`` whenever the text uses anything beyond plain
+    ``[section]`` / ``key = value`` lines (continuations, ``:`` delimiters,
+    interpolation, ``DEFAULT``, duplicates) so the caller can fall back to
+    :mod:`configparser` with its exact semantics.
+    """
+
+    if "%" in text:
+        return None
+    parsed: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    # configparser 只按 "\n" 分行；splitlines() 还会在 U+2028、\x0c 等字符处断开，导致解析结果不同。
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            continue
+        if line[0].isspace():
+            return None
+        match = _INI_SECTION_RE.fullmatch(line)
+        if match is not None:
+            name = match.group(1)
+            if name in parsed or name == configparser.DEFAULTSECT:
+                return None
+            current = parsed[name] = {}
+            continue
+        match = _INI_KV_RE.fullmatch(line)
+        if match is None or current is None:
+            return None
+        key, value = match.groups()
+        if key in current:
+            return None
+        current[key] = value
+    return parsed or None
+
+
+def _format_settings_text(snapshot: Mapping[str, Mapping[str, str]]) -> Optional[str]:
+    """Serialize ``snapshot`` exactly as ``ConfigParser.write`` would.
+
+    Returns ``None`` for content that configparser would validate or rewrite
+    (``%`` interpolation, multi-line values, ``DEFAULT``) so the caller keeps
+    its behaviour for those cases.
+    """
+
+    parts: List[str] = []
+    for section, options in snapshot.items():
+        if section == configparser.DEFAULTSECT or "\n" in section:
+            return None
+        parts.append(f"[{section}]\n")
+        for key, value in options.items():
+            if "%" in value or "\n" in value or "\r" in value or "\n" in key:
+                return None
+            parts.append(f"{key} = {value}\n")
+        parts.append("\n")
+    return "".join(parts)
+
+
 class SettingsManager:
     """负责读取/写入配置文件的轻量封装。"""
 
     def __init__(self, filename: str = "settings.ini") -> None:
         # 统一维护配置文件的存放路径，优先使用用户配置目录，保证跨次启动仍能读取到历史点名状态。
         self._mirror_targets: set[str] = set()
+        self._mirror_targets_sorted: Tuple[str, ...] = ()
         self.filename = self._prepare_storage_path(filename)
-        self._mirror_targets.add(self.filename)
+        self._add_mirror(self.filename)
         self.config = configparser.ConfigParser()
         self.config.optionxform = str
         self._settings_cache: Optional[Dict[str, Dict[str, str]]] = None
+        self._settings_view: Optional[Mapping[str, Mapping[str, str]]] = None
+        # save_settings 同时在 GUI 线程与后台写入线程中调用，缓存、只读视图与摘要须在同一把锁下更新。
+        self._state_lock = threading.RLock()
+        # 最近一次成功写盘内容的摘要，内容未变化时跳过整组原子写入。
+        self._last_written_digest: Optional[bytes] = None
         self.defaults: Dict[str, Dict[str, str]] = {
             "Launcher": {
                 "x": "120",
@@ -2295,6 +2878,11 @@ class SettingsManager:
             },
         }
 
+    def _add_mirror(self, path: str) -> None:
+        if path not in self._mirror_targets:
+            self._mirror_targets.add(path)
+            self._mirror_targets_sorted = tuple(sorted(self._mirror_targets))
+
     def _prepare_storage_path(self, filename: str) -> str:
         """根据平台选择合适的设置文件路径，并在需要时迁移旧文件。"""
 
@@ -2308,16 +2896,20 @@ class SettingsManager:
             copy_from_candidates=True,
         )
 
+        writable_dirs: Dict[str, bool] = {}
         for candidate in resolved.candidates[1:]:
             if not os.path.exists(candidate):
                 continue
             directory = os.path.dirname(candidate) or os.getcwd()
-            if os.access(directory, os.W_OK):
-                self._mirror_targets.add(candidate)
+            writable = writable_dirs.get(directory)
+            if writable is None:
+                writable = writable_dirs[directory] = os.access(directory, os.W_OK)
+            if writable:
+                self._add_mirror(candidate)
 
         try:
-            with open(resolved.primary, "a", encoding="utf-8"):
-                pass
+            # 仅确认文件可创建/追加，无需构造 Python 文件对象与编码器。
+            os.close(os.open(resolved.primary, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644))
         except OSError:
             return legacy_path
 
@@ -2327,41 +2919,74 @@ class SettingsManager:
         return {section: values.copy() for section, values in self.defaults.items()}
 
     def get_paint_settings(self) -> PaintConfig:
-        settings = self.load_settings()
-        section = settings.get("Paint", {})
+        section = self.load_section("Paint")
         defaults = self.defaults.get("Paint", {})
         return PaintConfig.from_mapping(section, defaults)
 
     def update_paint_settings(self, config: PaintConfig) -> None:
-        settings = self.load_settings()
-        settings["Paint"] = config.to_mapping()
-        self.save_settings(settings)
+        self.update_section("Paint", config.to_mapping(), replace=True)
 
     def get_roll_call_settings(self) -> RollCallTimerConfig:
-        settings = self.load_settings()
-        section = settings.get("RollCallTimer", {})
+        section = self.load_section("RollCallTimer")
         defaults = self.defaults.get("RollCallTimer", {})
         return RollCallTimerConfig.from_mapping(section, defaults)
 
-    def load_settings(self) -> Dict[str, Dict[str, str]]:
-        if self._settings_cache is not None:
+    def load_settings(self, *, copy: bool = True) -> Any:
+        """Return all settings; ``copy=False`` yields a shared read-only view.
+
+        The view is rebuilt only after the cache changes, so read-only callers
+        skip the per-call two-level dict copy.
+        """
+
+        with self._state_lock:
+            if self._settings_cache is None:
+                self._settings_cache = self._read_settings_file()
+                self._settings_view = None
+            if not copy:
+                view = self._settings_view
+                if view is None:
+                    view = MappingProxyType(
+                        {section: MappingProxyType(values) for section, values in self._settings_cache.items()}
+                    )
+                    self._settings_view = view
+                return view
             return {section: values.copy() for section, values in self._settings_cache.items()}
 
+    def _read_settings_file(self) -> Dict[str, Dict[str, str]]:
         settings = self.get_defaults()
         if os.path.exists(self.filename):
             try:
-                self.config.read(self.filename, encoding="utf-8")
-                for section in self.config.sections():
-                    if section not in settings:
-                        settings[section] = {}
-                    for key, value in self.config.items(section):
-                        settings[section][key] = value
+                with open(self.filename, "r", encoding="utf-8") as handle:
+                    text = handle.read()
+                parsed = _parse_settings_text(text)
+                if parsed is None:
+                    self.config.read_string(text, source=self.filename)
+                    parsed = {section: dict(self.config.items(section)) for section in self.config.sections()}
+                for section, values in parsed.items():
+                    settings.setdefault(section, {}).update(values)
             except (configparser.Error, OSError, UnicodeError) as exc:
                 logger.warning("Failed to read settings from %s: %s", self.filename, exc)
                 settings = self.get_defaults()
+        return settings
+
+    def load_section(self, section: str) -> Dict[str, str]:
+        """Return a copy of one section, parsing the file at most once per process."""
 
-        self._settings_cache = {section: values.copy() for section, values in settings.items()}
-        return {section: values.copy() for section, values in self._settings_cache.items()}
+        return dict(self.load_settings(copy=False).get(section, {}))
+
+    def update_section(self, section: str, values: Mapping[str, str], *, replace: bool = False) -> None:
+        """Write one section back, reusing the cached settings instead of re-reading them.
+
+        ``save_settings`` builds its own snapshot, so only the outer mapping and
+        the touched section are copied here.
+        """
+
+        with self._state_lock:
+            settings: Dict[str, Mapping[str, str]] = dict(self.load_settings(copy=False))
+            merged = {} if replace else dict(settings.get(section, {}))
+            merged.update(values)
+            settings[section] = merged
+            self.save_settings(settings)
 
     def _write_atomic(self, path: str, data: str) -> None:
         directory = os.path.dirname(path)
@@ -2394,48 +3019,113 @@ class SettingsManager:
             with open(path, "w", encoding="utf-8") as handle:
                 handle.write(data)
 
-    def save_settings(self, settings: Dict[str, Dict[str, str]]) -> None:
-        config = configparser.ConfigParser()
-        config.optionxform = str
-        snapshot: Dict[str, Dict[str, str]] = {}
-        for section, options in settings.items():
-            snapshot[section] = {key: str(value) for key, value in options.items()}
-            config[section] = snapshot[section]
+    def _write_atomic_multi(self, paths: Tuple[str, ...], data: str) -> List[str]:
+        """Write ``data`` once and fan it out to every path via hard links.
 
-        buffer = io.StringIO()
-        config.write(buffer)
-        data = buffer.getvalue()
-        buffer.close()
+        Targets that cannot be linked (other volume, no link support) fall
+        back to :meth:`_write_atomic`. Returns the paths that failed.
+        """
 
+        if not paths:
+            return []
+        primary = self.filename if self.filename in paths else paths[0]
+        directory = os.path.dirname(primary) or os.getcwd()
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, source = tempfile.mkstemp(prefix="ctools_", suffix=".tmp", dir=directory)
+        except OSError:
+            source = ""
         failed: List[str] = []
-        for path in sorted(self._mirror_targets):
-            try:
-                self._write_atomic(path, data)
-            except Exception:
-                failed.append(path)
-        if failed and self.filename not in failed:
-            logger.warning("Failed to write mirrored settings to %s", failed)
+        if not source:
+            for path in paths:
+                try:
+                    self._write_atomic(path, data)
+                except Exception:
+                    failed.append(path)
+            return failed
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(data)
+            for path in paths:
+                if path == primary:
+                    continue
+                target_dir = os.path.dirname(path) or os.getcwd()
+                link_tmp = os.path.join(target_dir, os.path.basename(source) + ".lnk")
+                try:
+                    os.link(source, link_tmp)
+                    os.replace(link_tmp, path)
+                    continue
+                except OSError:
+                    with contextlib.suppress(OSError):
+                        os.remove(link_tmp)
+                try:
+                    self._write_atomic(path, data)
+                except Exception:
+                    failed.append(path)
+            os.replace(source, primary)
+        except Exception as exc:
+            logger.warning("Batched settings write failed, writing targets one by one: %s", exc)
+            with contextlib.suppress(OSError):
+                os.remove(source)
+            for path in paths:
+                if path in failed:
+                    continue
+                try:
+                    self._write_atomic(path, data)
+                except Exception:
+                    failed.append(path)
+        return failed
 
-        self._settings_cache = {section: values.copy() for section, values in snapshot.items()}
+    def save_settings(self, settings: Mapping[str, Mapping[str, str]]) -> None:
+        # 比对、写盘与缓存更新须作为整体串行执行，否则跨线程交错会让文件与缓存/摘要长期不一致。
+        with self._state_lock:
+            cache = self._settings_cache
+            if (
+                cache is not None
+                and len(settings) == len(cache)
+                and all(cache.get(section) == options for section, options in settings.items())
+                and self._last_written_digest is not None
+                and all(os.path.exists(path) for path in self._mirror_targets_sorted)
+            ):
+                # 与上次成功写入的内容逐分区相同且各镜像文件仍在，无需再序列化与写盘。
+                return
+            snapshot: Dict[str, Dict[str, str]] = {
+                section: {key: str(value) for key, value in options.items()}
+                for section, options in settings.items()
+            }
+            data = _format_settings_text(snapshot)
+            if data is None:
+                config = configparser.ConfigParser()
+                config.optionxform = str
+                config.read_dict(snapshot)
+                buffer = io.StringIO()
+                config.write(buffer)
+                data = buffer.getvalue()
+                buffer.close()
+
+            targets = self._mirror_targets_sorted
+            digest = hashlib.blake2b(data.encode("utf-8"), digest_size=16).digest()
+            if digest != self._last_written_digest or not all(os.path.exists(path) for path in targets):
+                failed = self._write_atomic_multi(targets, data)
+                if failed and self.filename not in failed:
+                    logger.warning("Failed to write mirrored settings to %s", failed)
+                self._last_written_digest = None if failed else digest
+
+            self._settings_cache = snapshot
+            self._settings_view = None
 
     def get_launcher_state(self) -> "LauncherSettings":
         """Return launcher geometry and timing flags in a single pass."""
 
-        settings = self.load_settings()
         launcher_defaults = self.defaults.get("Launcher", {})
-        launcher_section = settings.get("Launcher", {})
+        launcher_section = self.load_settings(copy=False).get("Launcher", {})
         launcher_settings = LauncherSettings.from_mapping(launcher_section, launcher_defaults)
         return launcher_settings
 
     def update_launcher_settings(self, launcher_settings: "LauncherSettings") -> None:
         """Persist the launcher configuration."""
 
-        settings = self.load_settings()
-        launcher_section = dict(settings.get("Launcher", {}))
-        launcher_section.update(launcher_settings.to_mapping())
-        settings["Launcher"] = launcher_section
-
-        self.save_settings(settings)
+        self.update_section("Launcher", launcher_settings.to_mapping())
 
     def clear_roll_call_history(self) -> None:
         """清除点名历史信息，仅在用户主动重置时调用。"""
@@ -2485,7 +3175,7 @@ class _IOWorker(QRunnable):
             pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LauncherSettings:
     position: QPoint
     bubble_position: QPoint
@@ -2532,7 +3222,7 @@ class PenStyle(Enum):
     BRUSH = "brush"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PenStyleConfig:
     key: str
     display_name: str
@@ -2585,6 +3275,22 @@ class PenStyleConfig:
     exit_taper_curve: float = 1.0
     tail_alpha_fade: float = 0.0
     jitter_strength: float = 0.0
+    # 以下为由上述字段推导出的常量，在构造时算好，绘制路径直接读取。
+    lighten_factor: int = field(init=False, repr=False, compare=False, default=0)
+    feather_clamped: float = field(init=False, repr=False, compare=False, default=0.0)
+    overlay_factor: float = field(init=False, repr=False, compare=False, default=1.0)
+
+    def __post_init__(self) -> None:
+        lighten = 0
+        if self.color_lighten and abs(self.color_lighten - 1.0) > 1e-3:
+            lighten = max(25, min(400, int(self.color_lighten * 100)))
+        object.__setattr__(self, "lighten_factor", lighten)
+        object.__setattr__(self, "feather_clamped", _clamp_sorted(self.feather_strength, 0.0, 0.6))
+        object.__setattr__(
+            self,
+            "overlay_factor",
+            max(self.shadow_width_scale, 1.0 + self.feather_strength, 1.0 + self.noise_strength * 0.45),
+        )
 
 
 _DEFAULT_PEN_STYLE = PenStyle.FOUNTAIN
@@ -2619,16 +3325,20 @@ class PaintConfig:
         style_raw = reader.get_str("brush_style", _DEFAULT_PEN_STYLE.value)
         style = _DEFAULT_PEN_STYLE
         if isinstance(style_raw, str):
-            with contextlib.suppress(Exception):
+            try:
                 style = PenStyle(style_raw)
+            except Exception:
+                pass
         base_sizes: Dict[str, float] = {}
         opacity_overrides: Dict[str, int] = {}
         for key, _value in mapping.items():
             if key.endswith("_base_size"):
                 style_name = key[: -len("_base_size")]
                 fallback_base = get_pen_style_config(_DEFAULT_PEN_STYLE).default_base
-                with contextlib.suppress(Exception):
+                try:
                     fallback_base = get_pen_style_config(PenStyle(style_name)).default_base
+                except Exception:
+                    pass
                 base_sizes[key] = reader.get_float(key, float(fallback_base))
             if key.endswith("_opacity"):
                 opacity_overrides[key] = int(reader.get_float(key, 0.0))
@@ -3005,7 +3715,11 @@ PEN_STYLE_ORDER: tuple[PenStyle, ...] = (
 
 
 def get_pen_style_config(style: PenStyle) -> PenStyleConfig:
-    return PEN_STYLE_CONFIGS.get(style, PEN_STYLE_CONFIGS[_DEFAULT_PEN_STYLE])
+    # 绘制时逐段调用：命中时只做一次下标查找，不再每次预先取出默认配置。
+    try:
+        return PEN_STYLE_CONFIGS[style]
+    except KeyError:
+        return PEN_STYLE_CONFIGS[_DEFAULT_PEN_STYLE]
 
 
 def clamp_base_size_for_style(style: PenStyle, base_size: float) -> float:
@@ -3029,17 +3743,20 @@ def configure_pen_for_style(
     config = get_pen_style_config(style)
     effective_width = max(0.6, float(width))
     base_color = QColor(color)
-    if config.color_lighten and abs(config.color_lighten - 1.0) > 1e-3:
-        light_factor = max(25, min(400, int(config.color_lighten * 100)))
-        base_color = base_color.lighter(light_factor)
+    if config.lighten_factor:
+        base_color = base_color.lighter(config.lighten_factor)
     target_alpha = base_alpha_override if base_alpha_override is not None else config.base_alpha
-    target_alpha = int(clamp(target_alpha, 0, 255))
+    target_alpha = int(_clamp_sorted(target_alpha, 0, 255))
     if target_alpha < 255:
         base_color.setAlpha(target_alpha)
-    pen_color = QColor(base_color)
-    if style == PenStyle.HIGHLIGHTER:
+    is_highlighter = style == PenStyle.HIGHLIGHTER
+    # QPen 按值保存颜色，只有需要改动透明度时才复制一份。
+    if is_highlighter:
+        pen_color = QColor(base_color)
         pen_color.setAlpha(0)
-    pen.setColor(pen_color)
+        pen.setColor(pen_color)
+    else:
+        pen.setColor(base_color)
     pen.setWidthF(effective_width)
     pen.setStyle(Qt.PenStyle.SolidLine)
     pen.setCapStyle(Qt.PenCapStyle.RoundCap)
@@ -3056,21 +3773,21 @@ def configure_pen_for_style(
         shadow_color.setAlpha(0)
     else:
         composite_alpha = int(
-            clamp(
+            _clamp_sorted(
                 shadow_alpha + fade_alpha * config.shadow_alpha_scale * max(0.0, alpha_scale),
                 0,
                 255,
             )
         )
         shadow_color.setAlpha(composite_alpha)
-    if style == PenStyle.HIGHLIGHTER:
+    if is_highlighter:
         shadow_color.setAlpha(0)
     shadow_pen.setColor(shadow_color)
     shadow_pen.setWidthF(effective_width * config.shadow_width_scale)
     shadow_pen.setStyle(Qt.PenStyle.SolidLine)
     shadow_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
     shadow_pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
-    if style == PenStyle.HIGHLIGHTER:
+    if is_highlighter:
         shadow_pen.setCapStyle(Qt.PenCapStyle.SquareCap)
         shadow_pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
     if config.texture is not None:
@@ -3108,17 +3825,120 @@ def resolve_pen_opacity(
     return target_alpha, fade_min, fade_max, shadow_alpha, scale
 
 
+@functools.lru_cache(maxsize=512)
+def _qcolor_with_alpha(rgb: int, alpha: int) -> QColor:
+    """Return a shared colour for ``rgb`` at ``alpha``; callers must copy before mutating."""
+
+    return QColor.fromRgba((int(_clamp_sorted(alpha, 0, 255)) << 24) | (rgb & 0xFFFFFF))
+
+
+_NOISE_STRENGTH_MAX = 1.1
+
+
+def _noise_mask_dots(density_key: int, scale: int, size: int, dot_count: int) -> tuple[Any, Any]:
+    """Draw noise dot positions (flat pixel indices) and 8-bit alphas with NumPy."""
+
+    rng = np.random.default_rng(density_key * 16 + scale)
+    strengths = 0.6 + rng.random(dot_count) * 0.5
+    # 掩码透明度按最大强度归一化，着色时再乘回 alpha * 1.1。
+    alphas = np.floor(255 * strengths / _NOISE_STRENGTH_MAX).astype(np.uint32)
+    indices = rng.integers(0, size * size, size=dot_count)
+    return indices, alphas
+
+
+def _noise_mask_coverage(indices: Any, alphas: Any, pixel_count: int) -> Any:
+    """Return per-pixel 8-bit coverage of white dots composited with SourceOver."""
+
+    # 白点逐个 SourceOver 叠加后的透明度等于各点 (1 - alpha) 的乘积。
+    transparency = np.ones(pixel_count)
+    np.multiply.at(transparency, indices, 1.0 - alphas / 255.0)
+    return np.rint((1.0 - transparency) * 255).astype(np.uint32)
+
+
 class _PenStyleEffects:
     _noise_cache: Dict[Tuple[int, int, int, int], QBrush] = {}
+    # 噪点图案只与密度和尺度有关；颜色在取用时再着色，避免每换一次颜色都重画上万个点。
+    _noise_masks: Dict[Tuple[int, int], QPixmap] = {}
+    # 笔刷键到渲染方法的映射，在类定义之后填充。
+    _DISPATCH: Dict[str, Callable[..., Optional[QPainterPath]]] = {}
+
+    # 绘制只发生在 GUI 线程；描边器与画笔复用同一实例，setPen() 会按值复制画笔。
+    _stroker = QPainterPathStroker()
+    _stroker.setCapStyle(Qt.PenCapStyle.RoundCap)
+    _stroker.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+    _pooled_pen = QPen(
+        QColor(),
+        1.0,
+        Qt.PenStyle.SolidLine,
+        Qt.PenCapStyle.RoundCap,
+        Qt.PenJoinStyle.RoundJoin,
+    )
 
     @classmethod
     def _stroke_path(cls, path: QPainterPath, width: float) -> QPainterPath:
-        stroker = QPainterPathStroker()
-        stroker.setCapStyle(Qt.PenCapStyle.RoundCap)
-        stroker.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+        stroker = cls._stroker
         stroker.setWidth(max(1.0, width))
         return stroker.createStroke(path)
 
+    @classmethod
+    def _pen(cls, color: QColor, width: float) -> QPen:
+        pen = cls._pooled_pen
+        pen.setColor(color)
+        pen.setWidthF(width)
+        return pen
+
+    @classmethod
+    def _noise_mask(cls, density_key: int, scale: int) -> QPixmap:
+        mask_key = (density_key, scale)
+        mask = cls._noise_masks.get(mask_key)
+        if mask is not None:
+            return mask
+        size = max(16, min(128, 32 * scale))
+        density = density_key / 1000.0
+        dot_count = max(1, int(size * size * max(0.05, min(0.9, density))))
+        mask = None
+        if np is not None:
+            try:
+                mask = cls._noise_mask_vectorized(density_key, scale, size, dot_count)
+            except Exception:
+                # NumPy 仅为可选加速；安装损坏时在绘制事件中不能抛出，退回逐点绘制。
+                logger.debug("Vectorized noise mask failed; falling back to QPainter", exc_info=True)
+        if mask is None:
+            mask = cls._noise_mask_painted(density_key, scale, size, dot_count)
+        cls._noise_masks[mask_key] = mask
+        return mask
+
+    @classmethod
+    def _noise_mask_painted(cls, density_key: int, scale: int, size: int, dot_count: int) -> QPixmap:
+        mask = QPixmap(size, size)
+        mask.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(mask)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        rng = random.Random(f"{density_key}-{scale}")
+        dot_color = QColor(255, 255, 255)
+        for _ in range(dot_count):
+            strength = 0.6 + rng.random() * 0.5
+            # 掩码透明度按最大强度归一化，着色时再乘回 alpha * 1.1。
+            dot_color.setAlpha(int(255 * strength / _NOISE_STRENGTH_MAX))
+            painter.setPen(dot_color)
+            painter.drawPoint(rng.randrange(size), rng.randrange(size))
+        painter.end()
+        return mask
+
+    @classmethod
+    def _noise_mask_vectorized(cls, density_key: int, scale: int, size: int, dot_count: int) -> QPixmap:
+        """Build the dot mask with NumPy, matching repeated SourceOver point draws."""
+
+        indices, alphas = _noise_mask_dots(density_key, scale, size, dot_count)
+        coverage = _noise_mask_coverage(indices, alphas, size * size)
+        # 直接写入预乘格式 QImage 的像素内存，省去中间字节串与 QImage.copy()。
+        image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+        bits = image.bits()
+        bits.setsize(image.sizeInBytes())
+        pixels = np.frombuffer(bits, dtype=np.uint32).reshape(size, image.bytesPerLine() // 4)
+        pixels[:, :size] = ((coverage << 24) | (coverage << 16) | (coverage << 8) | coverage).reshape(size, size)
+        return QPixmap.fromImage(image)
+
     @classmethod
     def _noise_brush(
         cls,
@@ -3131,24 +3951,206 @@ class _PenStyleEffects:
         cached = cls._noise_cache.get(key)
         if cached is not None:
             return cached
-        size = max(16, min(128, 32 * key[3]))
-        pixmap = QPixmap(size, size)
-        pixmap.fill(Qt.GlobalColor.transparent)
+        mask = cls._noise_mask(key[2], key[3])
+        pixmap = QPixmap(mask)
+        tint = QColor(color)
+        tint.setAlpha(max(0, min(255, int(key[1] * _NOISE_STRENGTH_MAX))))
         painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
-        rng = random.Random(f"{key[0]}-{key[1]}-{key[2]}-{key[3]}")
-        dot_count = max(1, int(size * size * max(0.05, min(0.9, density))))
-        dot_color = QColor(color)
-        for _ in range(dot_count):
-            strength = 0.6 + rng.random() * 0.5
-            dot_color.setAlpha(max(0, min(255, int(alpha * strength))))
-            painter.setPen(dot_color)
-            painter.drawPoint(rng.randrange(size), rng.randrange(size))
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+        painter.fillRect(pixmap.rect(), tint)
         painter.end()
         brush = QBrush(pixmap)
         cls._noise_cache[key] = brush
         return brush
 
+    # 只保存并恢复会改动的画笔、画刷与合成模式，避免每次 save()/restore() 复制完整绘制状态。
+    @staticmethod
+    def _draw_fill(
+        painter: QPainter,
+        area: QPainterPath,
+        fill: Union[QColor, QBrush],
+        *,
+        composition: Optional[QPainter.CompositionMode] = None,
+    ) -> None:
+        prev_pen = painter.pen()
+        prev_brush = painter.brush()
+        prev_mode = painter.compositionMode() if composition is not None else None
+        if composition is not None:
+            painter.setCompositionMode(composition)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(fill)
+        painter.drawPath(area)
+        painter.setPen(prev_pen)
+        painter.setBrush(prev_brush)
+        if prev_mode is not None:
+            painter.setCompositionMode(prev_mode)
+
+    @staticmethod
+    def _draw_stroke(
+        painter: QPainter,
+        path: QPainterPath,
+        pen: QPen,
+        *,
+        composition: Optional[QPainter.CompositionMode] = None,
+    ) -> None:
+        prev_pen = painter.pen()
+        prev_mode = painter.compositionMode() if composition is not None else None
+        if composition is not None:
+            painter.setCompositionMode(composition)
+        painter.setPen(pen)
+        painter.drawPath(path)
+        painter.setPen(prev_pen)
+        if prev_mode is not None:
+            painter.setCompositionMode(prev_mode)
+
+    @classmethod
+    def _apply_chalk(
+        cls,
+        painter: QPainter,
+        path: QPainterPath,
+        width: float,
+        config: PenStyleConfig,
+        rgb: int,
+        fill_alpha: int,
+        stroke_coverage: Optional[QPainterPath],
+    ) -> Optional[QPainterPath]:
+        stroke_area = cls._stroke_path(path, width * 1.12)
+        body_color = _qcolor_with_alpha(rgb, fill_alpha)
+        cls._draw_fill(painter, stroke_area, body_color)
+        if config.noise_strength > 0:
+            noise_alpha = int(fill_alpha * clamp(config.noise_strength * 0.95, 0.0, 1.0))
+            if noise_alpha > 0:
+                noise_brush = cls._noise_brush(body_color, noise_alpha, config.noise_strength * 1.1, scale=2)
+                cls._draw_fill(painter, stroke_area, noise_brush)
+
+        edge_color = _qcolor_with_alpha(rgb, int(fill_alpha * 0.42))
+        edge_width = max(0.9, width * (1.02 + config.feather_strength * 0.3))
+        cls._draw_stroke(painter, path, cls._pen(edge_color, edge_width))
+
+        if config.edge_highlight_alpha > 0:
+            highlight_color = _qcolor_with_alpha(0xFFFFFF, config.edge_highlight_alpha)
+            cls._draw_stroke(painter, path, cls._pen(highlight_color, max(0.6, width * 0.14)))
+        return stroke_coverage
+
+    @classmethod
+    def _apply_highlighter(
+        cls,
+        painter: QPainter,
+        path: QPainterPath,
+        width: float,
+        config: PenStyleConfig,
+        rgb: int,
+        fill_alpha: int,
+        stroke_coverage: Optional[QPainterPath],
+    ) -> Optional[QPainterPath]:
+        stroke_area = cls._stroke_path(path, width * 1.02)
+        body_color = _qcolor_with_alpha(rgb, fill_alpha)
+        # 直接拼接子路径，交给 WindingFill 处理重叠，避免 united() 的布尔运算随笔画增长而变慢。
+        if isinstance(stroke_coverage, QPainterPath) and not stroke_coverage.isEmpty():
+            updated = QPainterPath(stroke_coverage)
+            updated.addPath(stroke_area)
+        else:
+            updated = QPainterPath(stroke_area)
+        updated.setFillRule(Qt.FillRule.WindingFill)
+        cls._draw_fill(
+            painter, updated, body_color, composition=QPainter.CompositionMode.CompositionMode_Source
+        )
+        if config.feather_strength > 0:
+            halo_color = _qcolor_with_alpha(rgb, int(fill_alpha * config.feather_clamped * 0.4))
+            halo_width = max(0.6, width * (1.1 + config.feather_strength * 0.6))
+            cls._draw_stroke(
+                painter,
+                path,
+                cls._pen(halo_color, halo_width),
+                composition=QPainter.CompositionMode.CompositionMode_SourceOver,
+            )
+        return updated
+
+    @classmethod
+    def _apply_fountain(
+        cls,
+        painter: QPainter,
+        path: QPainterPath,
+        width: float,
+        config: PenStyleConfig,
+        rgb: int,
+        fill_alpha: int,
+        stroke_coverage: Optional[QPainterPath],
+    ) -> Optional[QPainterPath]:
+        stroke_area = cls._stroke_path(path, width * 1.03)
+        body_color = _qcolor_with_alpha(rgb, fill_alpha)
+        cls._draw_fill(
+            painter, stroke_area, body_color, composition=QPainter.CompositionMode.CompositionMode_SourceOver
+        )
+        core_color = _qcolor_with_alpha(rgb, int(fill_alpha * 0.68))
+        cls._draw_stroke(painter, path, cls._pen(core_color.darker(112), max(0.7, width * 0.22)))
+        sheen_color = _qcolor_with_alpha(0xFFFFFF, max(12, int(fill_alpha * 0.18)))
+        cls._draw_stroke(painter, path, cls._pen(sheen_color, max(0.5, width * 0.08)))
+        highlight_alpha = min(
+            fill_alpha,
+            max(0, min(config.edge_highlight_alpha, int(fill_alpha * 0.35))),
+        )
+        if highlight_alpha > 0:
+            highlight_color = _qcolor_with_alpha(0xFFFFFF, highlight_alpha)
+            cls._draw_stroke(painter, path, cls._pen(highlight_color, max(0.6, width * 0.1)))
+        return stroke_coverage
+
+    @classmethod
+    def _apply_brush(
+        cls,
+        painter: QPainter,
+        path: QPainterPath,
+        width: float,
+        config: PenStyleConfig,
+        rgb: int,
+        fill_alpha: int,
+        stroke_coverage: Optional[QPainterPath],
+    ) -> Optional[QPainterPath]:
+        stroke_area = cls._stroke_path(path, width * 1.08)
+        body_color = _qcolor_with_alpha(rgb, fill_alpha)
+        cls._draw_fill(
+            painter,
+            stroke_area,
+            body_color,
+            composition=config.composition_mode or QPainter.CompositionMode.CompositionMode_SourceOver,
+        )
+        if config.noise_strength > 0:
+            noise_alpha = int(fill_alpha * clamp(config.noise_strength * 0.5, 0.0, 1.0))
+            if noise_alpha > 0:
+                noise_brush = cls._noise_brush(
+                    body_color, noise_alpha, config.noise_strength * 0.95, scale=3
+                )
+                cls._draw_fill(painter, stroke_area, noise_brush)
+        if config.feather_strength > 0:
+            wash_color = _qcolor_with_alpha(rgb, int(fill_alpha * config.feather_clamped * 0.25))
+            wash_width = max(0.9, width * (1.02 + config.feather_strength * 0.4))
+            cls._draw_stroke(painter, path, cls._pen(wash_color, wash_width))
+        cls._draw_stroke(painter, path, cls._pen(body_color.darker(100), max(0.9, width * 0.28)))
+        sheen_alpha = min(fill_alpha, max(18, min(config.edge_highlight_alpha, 44)))
+        if sheen_alpha > 0:
+            sheen_color = _qcolor_with_alpha(0xFFFFFF, sheen_alpha)
+            cls._draw_stroke(painter, path, cls._pen(sheen_color, max(0.7, width * 0.1)))
+        return stroke_coverage
+
+    @classmethod
+    def _apply_default(
+        cls,
+        painter: QPainter,
+        path: QPainterPath,
+        width: float,
+        config: PenStyleConfig,
+        rgb: int,
+        fill_alpha: int,
+        stroke_coverage: Optional[QPainterPath],
+    ) -> Optional[QPainterPath]:
+        if config.solid_fill:
+            stroke_area = cls._stroke_path(path, width * 1.03)
+            body_color = _qcolor_with_alpha(rgb, fill_alpha)
+            cls._draw_fill(
+                painter, stroke_area, body_color, composition=QPainter.CompositionMode.CompositionMode_SourceOver
+            )
+        return stroke_coverage
+
     @classmethod
     def apply(
         cls,
@@ -3162,213 +4164,21 @@ class _PenStyleEffects:
     ) -> Optional[QPainterPath]:
         if width <= 0.0:
             return stroke_coverage
-        style_key = config.key
         base_alpha = base_color.alpha() if base_color.isValid() else config.base_alpha
         fill_alpha = int(clamp(base_alpha + config.fill_alpha_boost, 0, 255))
-        color = QColor(base_color)
+        rgb = base_color.rgb() & 0xFFFFFF
+        renderer = cls._DISPATCH.get(config.key, cls._apply_default)
+        return renderer(painter, path, width, config, rgb, fill_alpha, stroke_coverage)
 
-        def _fill(
-            stroke_area: QPainterPath,
-            fill_color: QColor,
-            *,
-            composition: Optional[QPainter.CompositionMode] = None,
-        ) -> None:
-            painter.save()
-            if composition is not None:
-                painter.setCompositionMode(composition)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(fill_color)
-            painter.drawPath(stroke_area)
-            painter.restore()
-
-        if style_key == "chalk":
-            stroke_area = cls._stroke_path(path, width * 1.12)
-            body_color = QColor(color)
-            body_color.setAlpha(fill_alpha)
-            _fill(stroke_area, body_color)
-            if config.noise_strength > 0:
-                noise_alpha = int(fill_alpha * clamp(config.noise_strength * 0.95, 0.0, 1.0))
-                if noise_alpha > 0:
-                    noise_brush = cls._noise_brush(body_color, noise_alpha, config.noise_strength * 1.1, scale=2)
-                    painter.save()
-                    painter.setPen(Qt.PenStyle.NoPen)
-                    painter.setBrush(noise_brush)
-                    painter.drawPath(stroke_area)
-                    painter.restore()
-
-            edge_color = QColor(body_color)
-            edge_color.setAlpha(int(fill_alpha * 0.42))
-            edge_pen = QPen(
-                edge_color,
-                max(0.9, width * (1.02 + config.feather_strength * 0.3)),
-                Qt.PenStyle.SolidLine,
-                Qt.PenCapStyle.RoundCap,
-                Qt.PenJoinStyle.RoundJoin,
-            )
-            painter.save()
-            painter.setPen(edge_pen)
-            painter.drawPath(path)
-            painter.restore()
-
-            if config.edge_highlight_alpha > 0:
-                highlight_pen = QPen(
-                    QColor(255, 255, 255, config.edge_highlight_alpha),
-                    max(0.6, width * 0.14),
-                    Qt.PenStyle.SolidLine,
-                    Qt.PenCapStyle.RoundCap,
-                    Qt.PenJoinStyle.RoundJoin,
-                )
-                painter.save()
-                painter.setPen(highlight_pen)
-                painter.drawPath(path)
-                painter.restore()
-            return stroke_coverage
 
-        if style_key == "highlighter":
-            stroke_area = cls._stroke_path(path, width * 1.02)
-            body_color = QColor(color)
-            body_color.setAlpha(fill_alpha)
-            if isinstance(stroke_coverage, QPainterPath) and not stroke_coverage.isEmpty():
-                updated = stroke_coverage.united(stroke_area)
-            else:
-                updated = QPainterPath(stroke_area)
-            painter.save()
-            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(body_color)
-            painter.drawPath(updated)
-            painter.restore()
-            if config.feather_strength > 0:
-                halo_color = QColor(body_color)
-                halo_color.setAlpha(int(fill_alpha * clamp(config.feather_strength, 0.0, 0.6) * 0.4))
-                halo_pen = QPen(
-                    halo_color,
-                    max(0.6, width * (1.1 + config.feather_strength * 0.6)),
-                    Qt.PenStyle.SolidLine,
-                    Qt.PenCapStyle.RoundCap,
-                    Qt.PenJoinStyle.RoundJoin,
-                )
-                painter.save()
-                painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
-                painter.setPen(halo_pen)
-                painter.drawPath(path)
-                painter.restore()
-            return updated
-
-        if style_key == "fountain":
-            stroke_area = cls._stroke_path(path, width * 1.03)
-            body_color = QColor(color)
-            body_color.setAlpha(fill_alpha)
-            _fill(stroke_area, body_color, composition=QPainter.CompositionMode.CompositionMode_SourceOver)
-            core_color = QColor(body_color)
-            core_color.setAlpha(int(fill_alpha * 0.68))
-            core_pen = QPen(
-                core_color.darker(112),
-                max(0.7, width * 0.22),
-                Qt.PenStyle.SolidLine,
-                Qt.PenCapStyle.RoundCap,
-                Qt.PenJoinStyle.RoundJoin,
-            )
-            painter.save()
-            painter.setPen(core_pen)
-            painter.drawPath(path)
-            painter.restore()
-            sheen_pen = QPen(
-                QColor(255, 255, 255, max(12, int(fill_alpha * 0.18))),
-                max(0.5, width * 0.08),
-                Qt.PenStyle.SolidLine,
-                Qt.PenCapStyle.RoundCap,
-                Qt.PenJoinStyle.RoundJoin,
-            )
-            painter.save()
-            painter.setPen(sheen_pen)
-            painter.drawPath(path)
-            painter.restore()
-            highlight_alpha = min(
-                fill_alpha,
-                max(0, min(config.edge_highlight_alpha, int(fill_alpha * 0.35))),
-            )
-            if highlight_alpha > 0:
-                highlight_pen = QPen(
-                    QColor(255, 255, 255, highlight_alpha),
-                    max(0.6, width * 0.1),
-                    Qt.PenStyle.SolidLine,
-                    Qt.PenCapStyle.RoundCap,
-                    Qt.PenJoinStyle.RoundJoin,
-                )
-                painter.save()
-                painter.setPen(highlight_pen)
-                painter.drawPath(path)
-                painter.restore()
-            return stroke_coverage
+_PenStyleEffects._DISPATCH = {
+    "chalk": _PenStyleEffects._apply_chalk,
+    "highlighter": _PenStyleEffects._apply_highlighter,
+    "fountain": _PenStyleEffects._apply_fountain,
+    "brush": _PenStyleEffects._apply_brush,
+}
 
-        if style_key == "brush":
-            stroke_area = cls._stroke_path(path, width * 1.08)
-            body_color = QColor(color)
-            body_color.setAlpha(fill_alpha)
-            _fill(
-                stroke_area,
-                body_color,
-                composition=config.composition_mode or QPainter.CompositionMode.CompositionMode_SourceOver,
-            )
-            if config.noise_strength > 0:
-                noise_alpha = int(fill_alpha * clamp(config.noise_strength * 0.5, 0.0, 1.0))
-                if noise_alpha > 0:
-                    noise_brush = cls._noise_brush(
-                        body_color, noise_alpha, config.noise_strength * 0.95, scale=3
-                    )
-                    painter.save()
-                    painter.setPen(Qt.PenStyle.NoPen)
-                    painter.setBrush(noise_brush)
-                    painter.drawPath(stroke_area)
-                    painter.restore()
-            if config.feather_strength > 0:
-                wash_color = QColor(body_color)
-                wash_color.setAlpha(int(fill_alpha * clamp(config.feather_strength, 0.0, 0.6) * 0.25))
-                wash_pen = QPen(
-                    wash_color,
-                    max(0.9, width * (1.02 + config.feather_strength * 0.4)),
-                    Qt.PenStyle.SolidLine,
-                    Qt.PenCapStyle.RoundCap,
-                    Qt.PenJoinStyle.RoundJoin,
-                )
-                painter.save()
-                painter.setPen(wash_pen)
-                painter.drawPath(path)
-                painter.restore()
-            edge_pen = QPen(
-                QColor(body_color).darker(100),
-                max(0.9, width * 0.28),
-                Qt.PenStyle.SolidLine,
-                Qt.PenCapStyle.RoundCap,
-                Qt.PenJoinStyle.RoundJoin,
-            )
-            painter.save()
-            painter.setPen(edge_pen)
-            painter.drawPath(path)
-            painter.restore()
-            sheen_alpha = min(fill_alpha, max(18, min(config.edge_highlight_alpha, 44)))
-            if sheen_alpha > 0:
-                sheen_pen = QPen(
-                    QColor(255, 255, 255, sheen_alpha),
-                    max(0.7, width * 0.1),
-                    Qt.PenStyle.SolidLine,
-                    Qt.PenCapStyle.RoundCap,
-                    Qt.PenJoinStyle.RoundJoin,
-                )
-                painter.save()
-                painter.setPen(sheen_pen)
-                painter.drawPath(path)
-                painter.restore()
-            return stroke_coverage
 
-        # fallback styles
-        stroke_area = cls._stroke_path(path, width * 1.03)
-        if config.solid_fill:
-            body_color = QColor(color)
-            body_color.setAlpha(fill_alpha)
-            _fill(stroke_area, body_color, composition=QPainter.CompositionMode.CompositionMode_SourceOver)
-        return stroke_coverage
 def render_pen_preview_pixmap(
     color: QColor,
     style: PenStyle,
@@ -3381,6 +4191,14 @@ def render_pen_preview_pixmap(
         size = QSize(200, 64)
     width = max(60, size.width())
     height = max(36, size.height())
+    # 预览只取决于以下参数；交给 QPixmapCache 缓存，命中时直接返回共享的隐式拷贝。
+    cache_key = (
+        f"ctools-pen-preview:{color.rgba():08x}:{style.value}:{width}x{height}:"
+        f"{float(base_size)!r}:{opacity_override}"
+    )
+    cached = QPixmapCache.find(cache_key)
+    if cached is not None and not cached.isNull():
+        return cached
     pixmap = QPixmap(width, height)
     pixmap.fill(QColor(255, 255, 255, 0))
 
@@ -3426,6 +4244,7 @@ def render_pen_preview_pixmap(
         painter.drawPath(path)
     _PenStyleEffects.apply(painter, path, effective_width, config, QColor(base_color))
     painter.end()
+    QPixmapCache.insert(cache_key, pixmap)
     return pixmap
 
 
@@ -3509,6 +4328,7 @@ class PenSettingsDialog(_EnsureOnScreenMixin, QDialog):
             self.pen_color = QColor("#FF0000")
 
         self._current_style = self._normalize_style(initial_style)
+        self._current_config = get_pen_style_config(self._current_style)
         self._preview_size = QSize(220, 76)
         self._initial_base_size = clamp_base_size_for_style(
             self._current_style, float(initial_base_size)
@@ -3619,6 +4439,7 @@ class PenSettingsDialog(_EnsureOnScreenMixin, QDialog):
         self.preview_label = QLabel(self)
         self.preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.preview_label.setMinimumSize(self._preview_size)
+        self._preview_pixmap_key: Optional[int] = None
         layout.addWidget(self.preview_label, 0, Qt.AlignmentFlag.AlignCenter)
 
         layout.addWidget(QLabel("临时更换画笔的颜色:"))
@@ -3725,8 +4546,16 @@ class PenSettingsDialog(_EnsureOnScreenMixin, QDialog):
         self.eraser_slider.valueChanged.connect(self._on_eraser_size_changed)
         self._update_eraser_label()
 
+        # 拖动滑块时合并到下一帧再重绘预览与图标，避免每个刻度都完整渲染一次。
+        self._preview_refresh_timer = QTimer(self)
+        self._preview_refresh_timer.setSingleShot(True)
+        self._preview_refresh_timer.setInterval(16)
+        self._preview_refresh_timer.timeout.connect(self._flush_preview_refresh)
+        self._pending_icon_styles: Set[PenStyle] = set()
+
         self._update_style_description()
         self._apply_style_to_slider(base_size=self._initial_base_size, use_default=False)
+        self._preview_refresh_timer.stop()
         self._refresh_style_icons()
         self._update_preview()
         self.setFixedSize(self.sizeHint())
@@ -3747,7 +4576,7 @@ class PenSettingsDialog(_EnsureOnScreenMixin, QDialog):
         base_size: Optional[float] = None,
         use_default: bool = False,
     ) -> None:
-        config = get_pen_style_config(self._current_style)
+        config = self._current_config
         minimum, maximum = self.SIZE_RANGE
         prev_block = self.size_slider.blockSignals(True)
         self.size_slider.setRange(minimum, maximum)
@@ -3767,7 +4596,7 @@ class PenSettingsDialog(_EnsureOnScreenMixin, QDialog):
         self._apply_style_to_opacity(use_default=use_default)
 
     def _update_size_label(self) -> None:
-        config = get_pen_style_config(self._current_style)
+        config = self._current_config
         base_value = int(self.size_slider.value())
         effective = int(round(base_value * config.width_multiplier))
         self.size_value.setText(f"基础 {base_value}px · 实际≈{effective}px")
@@ -3782,7 +4611,7 @@ class PenSettingsDialog(_EnsureOnScreenMixin, QDialog):
         self.eraser_value.setText(f"{value}px")
 
     def _apply_style_to_opacity(self, *, use_default: bool) -> None:
-        config = get_pen_style_config(self._current_style)
+        config = self._current_config
         if not config.opacity_range:
             self.opacity_container.hide()
             self.opacity_value.setText("")
@@ -3806,7 +4635,7 @@ class PenSettingsDialog(_EnsureOnScreenMixin, QDialog):
         self._update_opacity_label()
 
     def _update_opacity_label(self) -> None:
-        config = get_pen_style_config(self._current_style)
+        config = self._current_config
         if not config.opacity_range:
             self.opacity_value.setText("")
             return
@@ -3815,7 +4644,7 @@ class PenSettingsDialog(_EnsureOnScreenMixin, QDialog):
         self.opacity_value.setText(f"{percent}% · α={alpha}")
 
     def _update_style_description(self) -> None:
-        config = get_pen_style_config(self._current_style)
+        config = self._current_config
         minimum, maximum = config.slider_range
         self.style_description.setText(
             f"{config.description}"
@@ -3855,18 +4684,25 @@ class PenSettingsDialog(_EnsureOnScreenMixin, QDialog):
         return int(clamp(alpha, min_alpha, max_alpha))
 
     def _refresh_style_icons(self) -> None:
-        for index, style in enumerate(PEN_STYLE_ORDER):
-            config = get_pen_style_config(style)
-            icon = QIcon(
-                render_pen_preview_pixmap(
-                    self.pen_color,
-                    style,
-                    config.default_base,
-                    size=QSize(96, 40),
-                    opacity_override=self._resolve_opacity_for_style(style),
-                )
+        for style in PEN_STYLE_ORDER:
+            self._refresh_single_style_icon(style)
+
+    def _refresh_single_style_icon(self, style: PenStyle) -> None:
+        try:
+            index = PEN_STYLE_ORDER.index(style)
+        except ValueError:
+            return
+        config = get_pen_style_config(style)
+        icon = QIcon(
+            render_pen_preview_pixmap(
+                self.pen_color,
+                style,
+                config.default_base,
+                size=QSize(96, 40),
+                opacity_override=self._resolve_opacity_for_style(style),
             )
-            self.style_combo.setItemIcon(index, icon)
+        )
+        self.style_combo.setItemIcon(index, icon)
 
     def _update_preview(self) -> None:
         pixmap = render_pen_preview_pixmap(
@@ -3876,38 +4712,59 @@ class PenSettingsDialog(_EnsureOnScreenMixin, QDialog):
             size=self._preview_size,
             opacity_override=self._resolve_opacity_for_style(self._current_style),
         )
-        self.preview_label.setPixmap(pixmap)
-        self.preview_label.setFixedSize(pixmap.size())
+        # 预览缓存命中时得到的是同一张位图，cacheKey 相同就无需重新设置与重绘。
+        pixmap_key = pixmap.cacheKey()
+        if pixmap_key != self._preview_pixmap_key:
+            self._preview_pixmap_key = pixmap_key
+            self.preview_label.setPixmap(pixmap)
+        size = pixmap.size()
+        if self.preview_label.minimumSize() != size or self.preview_label.maximumSize() != size:
+            self.preview_label.setFixedSize(size)
+
+    def _schedule_preview_refresh(self, *icon_styles: PenStyle) -> None:
+        self._pending_icon_styles.update(icon_styles)
+        self._preview_refresh_timer.start()
+
+    def _flush_preview_refresh(self) -> None:
+        pending = self._pending_icon_styles
+        if pending:
+            self._pending_icon_styles = set()
+            if len(pending) >= len(PEN_STYLE_ORDER):
+                self._refresh_style_icons()
+            else:
+                for style in pending:
+                    self._refresh_single_style_icon(style)
+        self._update_preview()
 
     def _on_style_changed(self) -> None:
         style = self._normalize_style(self.style_combo.currentData())
         if style == self._current_style:
             return
         self._current_style = style
+        self._current_config = get_pen_style_config(style)
         self._update_style_description()
         self._apply_style_to_slider(use_default=False)
-        self._refresh_style_icons()
-        self._update_preview()
+        # 图标只随颜色与各风格透明度变化，切换风格时最多影响当前风格那一项。
+        self._schedule_preview_refresh(style)
 
     def _on_size_changed(self) -> None:
         value = clamp_base_size_for_style(self._current_style, float(self.size_slider.value()))
         self._style_base_sizes[self._current_style] = float(value)
         self._update_size_label()
-        self._update_preview()
+        self._schedule_preview_refresh()
 
     def _on_eraser_size_changed(self) -> None:
         self._update_eraser_label()
 
     def _on_opacity_changed(self) -> None:
-        config = get_pen_style_config(self._current_style)
+        config = self._current_config
         if not config.opacity_range:
             return
         percent = int(self.opacity_slider.value())
         alpha = self._percent_to_alpha(percent, config)
         self._opacity_overrides[self._current_style] = alpha
         self._update_opacity_label()
-        self._refresh_style_icons()
-        self._update_preview()
+        self._schedule_preview_refresh(self._current_style)
 
     def _on_scale_changed(self) -> None:
         idx = self.scale_combo.currentIndex()
@@ -3922,8 +4779,7 @@ class PenSettingsDialog(_EnsureOnScreenMixin, QDialog):
         if not color.isValid():
             return
         self.pen_color = color
-        self._refresh_style_icons()
-        self._update_preview()
+        self._schedule_preview_refresh(*PEN_STYLE_ORDER)
 
     def _collect_control_flags(self) -> Dict[str, bool]:
         return {
@@ -4115,9 +4971,8 @@ class FloatingToolbar(_EnsureOnScreenMixin, QWidget):
         self._build_ui()
         self._whiteboard_locked = False
 
-        settings = self.settings_manager.load_settings().get("Paint", {})
+        settings = self.settings_manager.load_section("Paint")
         self.move(int(settings.get("x", "260")), int(settings.get("y", "260")))
-        self.adjustSize()
         self.setFixedSize(self.sizeHint())
         self._base_minimum_width = self.width()
         self._base_minimum_height = self.height()
@@ -4158,7 +5013,6 @@ class FloatingToolbar(_EnsureOnScreenMixin, QWidget):
         for btn in getattr(self, "_all_buttons", []):
             btn.setIconSize(QSize(icon_size, icon_size))
             btn.setMinimumSize(min_size, min_size)
-        self.adjustSize()
         self.setFixedSize(self.sizeHint())
         self._base_minimum_width = self.width()
         self._base_minimum_height = self.height()
@@ -4183,6 +5037,7 @@ class FloatingToolbar(_EnsureOnScreenMixin, QWidget):
         self.btn_cursor = QPushButton(IconManager.get_icon("cursor"), "")
         self.quick_colors: List[str] = [c.lower() for c in self.overlay.get_quick_colors()]
         self._palette_colors: List[Tuple[str, str]] = list(PenSettingsDialog.COLOR_CHOICES)
+        IconManager.prime_brush_icons(self.quick_colors + [color for color, _label in self._palette_colors])
         self.brush_color_buttons: List[QPushButton] = []
         brush_buttons: List[QPushButton] = []
         for idx, color_hex in enumerate(self.quick_colors):
@@ -9697,7 +10552,7 @@ class OverlayWindow(QWidget, _PresentationWindowMixin):
             stable = _clamp_width(effective_base * (1.0 + min(0.03, curve_scale * 0.08)))
             base_target = _clamp_width(stable * (0.985 + speed_scale * 0.035))
             if prev_width is not None:
-                easing = clamp(0.86 + speed_scale * 0.08, 0.86, 0.95)
+                easing = _clamp_sorted(0.86 + speed_scale * 0.08, 0.86, 0.95)
                 cur_width = _clamp_width(prev_width * easing + base_target * (1.0 - easing))
                 step_limit = max(0.1, effective_base * 0.006)
                 delta = cur_width - prev_width
@@ -9713,10 +10568,10 @@ class OverlayWindow(QWidget, _PresentationWindowMixin):
             if rng is not None:
                 grain = (rng.random() - 0.5) * max(0.0, effective_base * 0.08)
                 cur_width = _clamp_width(cur_width + grain)
-            softness = clamp(0.1 + speed_scale * 0.18 + tail_state * 0.12, 0.1, 0.36)
+            softness = _clamp_sorted(0.1 + speed_scale * 0.18 + tail_state * 0.12, 0.1, 0.36)
             cur_width = _clamp_width(cur_width * (1.0 - softness) + min_width * softness)
             if prev_width is not None:
-                easing = clamp(0.78 + speed_scale * 0.1, 0.78, 0.92)
+                easing = _clamp_sorted(0.78 + speed_scale * 0.1, 0.78, 0.92)
                 cur_width = _clamp_width(prev_width * easing + cur_width * (1.0 - easing))
                 step_limit = max(0.16, effective_base * 0.01)
                 delta = cur_width - prev_width
@@ -9726,51 +10581,51 @@ class OverlayWindow(QWidget, _PresentationWindowMixin):
             return cur_width, fade_alpha
 
         if style_key == PenStyle.FOUNTAIN.value:
-            thinness = clamp(0.32 + speed_scale * 0.6 - tail_state * 0.28, 0.22, 0.92)
-            curve_gain = clamp(curve_scale * 0.74 + pressure * 0.32, 0.0, 1.0)
+            thinness = _clamp_sorted(0.32 + speed_scale * 0.6 - tail_state * 0.28, 0.22, 0.92)
+            curve_gain = _clamp_sorted(curve_scale * 0.74 + pressure * 0.32, 0.0, 1.0)
             body = _clamp_width(effective_base * (0.58 + curve_gain * 0.82))
             tapered = _clamp_width(body * thinness)
-            blend = clamp(0.44 + curve_gain * 0.24, 0.44, 0.92)
+            blend = _clamp_sorted(0.44 + curve_gain * 0.24, 0.44, 0.92)
             profile_target = _clamp_width(cur_width * (1.0 - blend) + tapered * blend)
-            end_tip = clamp(tail_state * (1.0 - speed_scale) * 1.4, 0.0, 1.0)
+            end_tip = _clamp_sorted(tail_state * (1.0 - speed_scale) * 1.4, 0.0, 1.0)
             profile_target = _clamp_width(profile_target * (1.0 - 0.38 * end_tip) + min_width * 0.38 * end_tip)
             if prev_width is not None:
-                easing = clamp(0.84 + speed_scale * 0.1, 0.84, 0.96)
+                easing = _clamp_sorted(0.84 + speed_scale * 0.1, 0.84, 0.96)
                 profile_target = _clamp_width(prev_width * easing + profile_target * (1.0 - easing))
                 step_limit = max(0.12, effective_base * 0.008)
                 delta = profile_target - prev_width
                 if abs(delta) > step_limit:
                     profile_target = _clamp_width(prev_width + math.copysign(step_limit, delta))
-                nib_memory = clamp(0.82 + curve_gain * 0.08, 0.82, 0.92)
+                nib_memory = _clamp_sorted(0.82 + curve_gain * 0.08, 0.82, 0.92)
                 profile_target = _clamp_width(prev_width * nib_memory + profile_target * (1.0 - nib_memory))
                 accel_clamp = max(0.06, effective_base * 0.005)
                 accel_delta = profile_target - prev_width
                 if abs(accel_delta) > accel_clamp:
                     profile_target = _clamp_width(prev_width + math.copysign(accel_clamp, accel_delta))
             fade_shrink = 0.9 + (1.0 - speed_scale) * 0.08 - tail_state * 0.22 - end_tip * 0.16
-            fade_alpha = _clamp_alpha(fade_alpha * clamp(fade_shrink, 0.64, 1.0))
+            fade_alpha = _clamp_alpha(fade_alpha * _clamp_sorted(fade_shrink, 0.64, 1.0))
             return profile_target, fade_alpha
 
         if style_key == PenStyle.BRUSH.value:
-            body_gain = clamp(pressure * 0.6 + curve_scale * 0.4, 0.0, 1.2)
-            speed_relief = clamp(speed_scale * 0.4, 0.08, 0.7)
+            body_gain = _clamp_sorted(pressure * 0.6 + curve_scale * 0.4, 0.0, 1.2)
+            speed_relief = _clamp_sorted(speed_scale * 0.4, 0.08, 0.7)
             base_target = _clamp_width(effective_base * (0.72 + body_gain * 0.62 + speed_relief * 0.2))
-            tip_mix = clamp(tail_state * 0.7 + (1.0 - speed_scale) * 0.2, 0.0, 1.0)
+            tip_mix = _clamp_sorted(tail_state * 0.7 + (1.0 - speed_scale) * 0.2, 0.0, 1.0)
             tapered = _clamp_width(base_target * (0.54 + tip_mix * 0.26))
             profile_target = _clamp_width(
                 base_target * (0.5 - tip_mix * 0.04) + tapered * (0.5 + tip_mix * 0.12)
             )
-            easing = clamp(0.66 + speed_scale * 0.16 - curve_scale * 0.08, 0.6, 0.88)
+            easing = _clamp_sorted(0.66 + speed_scale * 0.16 - curve_scale * 0.08, 0.6, 0.88)
             cur_width = _clamp_width(cur_width * easing + profile_target * (1.0 - easing))
             if prev_width is not None and prev_width > 0.0:
                 step_limit = max(0.22, effective_base * 0.02)
                 delta = cur_width - prev_width
                 if abs(delta) > step_limit:
                     cur_width = _clamp_width(prev_width + math.copysign(step_limit, delta))
-            end_tip = clamp(tip_mix * (1.0 - speed_scale) * 1.0, 0.0, 1.0)
+            end_tip = _clamp_sorted(tip_mix * (1.0 - speed_scale) * 1.0, 0.0, 1.0)
             cur_width = _clamp_width(cur_width * (1.0 - 0.16 * end_tip) + min_width * 0.16 * end_tip)
             fade_factor = 1.0 - tip_mix * 0.08 + body_gain * 0.05 - end_tip * 0.05
-            fade_alpha = _clamp_alpha(fade_alpha * clamp(fade_factor, 0.8, 1.05))
+            fade_alpha = _clamp_alpha(fade_alpha * _clamp_sorted(fade_factor, 0.8, 1.05))
             return cur_width, fade_alpha
 
         return _clamp_width(cur_width), _clamp_alpha(fade_alpha)
@@ -9885,53 +10740,53 @@ class OverlayWindow(QWidget, _PresentationWindowMixin):
         target_w = max(min_w, min(max_w, target_w))
         self._stroke_target_width = target_w
 
-        responsiveness = clamp(getattr(config, "target_responsiveness", 0.35), 0.05, 0.95)
+        responsiveness = _clamp_sorted(getattr(config, "target_responsiveness", 0.35), 0.05, 0.95)
         smoothed_prev = getattr(self, "_stroke_smoothed_target", self.last_width)
         smoothed_target = smoothed_prev + (target_w - smoothed_prev) * responsiveness
         smoothed_target = float(clamp(smoothed_target, min_w, max_w))
         self._stroke_smoothed_target = smoothed_target
 
         velocity = getattr(self, "_stroke_width_velocity", 0.0)
-        accel = clamp(getattr(config, "width_accel", 0.18), 0.02, 0.6)
+        accel = _clamp_sorted(getattr(config, "width_accel", 0.18), 0.02, 0.6)
         velocity += (smoothed_target - self.last_width) * accel
         if config.key == PenStyle.FOUNTAIN.value:
             velocity += (target_w - smoothed_target) * 0.04
-        damping = clamp(getattr(config, "width_velocity_damping", 0.7), 0.4, 0.95)
+        damping = _clamp_sorted(getattr(config, "width_velocity_damping", 0.7), 0.4, 0.95)
         velocity *= damping
         velocity_limit = max(
             0.06,
             target_step_limit * 0.6,
-            effective_base * clamp(getattr(config, "width_velocity_limit", 0.22), 0.05, 0.6),
+            effective_base * _clamp_sorted(getattr(config, "width_velocity_limit", 0.22), 0.05, 0.6),
         )
         velocity = float(clamp(velocity, -velocity_limit, velocity_limit))
         cur_w = self.last_width + velocity
-        memory = clamp(getattr(config, "width_memory", 0.9), 0.6, 0.985)
+        memory = _clamp_sorted(getattr(config, "width_memory", 0.9), 0.6, 0.985)
         cur_w = float(clamp(self.last_width * memory + cur_w * (1.0 - memory), min_w, max_w))
         self._stroke_width_velocity = velocity
         entry_strength = float(getattr(config, "entry_taper_strength", 0.0) or 0.0)
         entry_distance = float(getattr(config, "entry_taper_distance", 0.0) or 0.0)
         if entry_strength > 0.0 and entry_distance > 0.0:
-            entry_progress = clamp(self._stroke_total_length / max(4.0, entry_distance), 0.0, 1.0)
-            entry_curve = clamp(float(getattr(config, "entry_taper_curve", 1.0) or 1.0), 0.3, 4.0)
+            entry_progress = _clamp_sorted(self._stroke_total_length / max(4.0, entry_distance), 0.0, 1.0)
+            entry_curve = _clamp_sorted(float(getattr(config, "entry_taper_curve", 1.0) or 1.0), 0.3, 4.0)
             entry_mix = entry_progress ** entry_curve
-            entry_weight = clamp(entry_strength * (1.0 - entry_mix), 0.0, 1.0)
+            entry_weight = _clamp_sorted(entry_strength * (1.0 - entry_mix), 0.0, 1.0)
             if entry_weight > 0.0:
                 cur_w = max(min_w, cur_w * (1.0 - entry_weight) + min_w * entry_weight)
 
         tail_strength = float(getattr(config, "exit_taper_strength", 0.0) or 0.0)
         tail_speed_threshold = float(getattr(config, "exit_taper_speed", 0.0) or 0.0)
-        tail_curve = clamp(float(getattr(config, "exit_taper_curve", 1.0) or 1.0), 0.3, 4.0)
+        tail_curve = _clamp_sorted(float(getattr(config, "exit_taper_curve", 1.0) or 1.0), 0.3, 4.0)
         tail_state = float(getattr(self, "_stroke_tail_state", 0.0))
         if tail_strength > 0.0 and tail_speed_threshold > 0.0:
-            tail_speed_norm = clamp(speed / max(20.0, tail_speed_threshold), 0.0, 1.0)
+            tail_speed_norm = _clamp_sorted(speed / max(20.0, tail_speed_threshold), 0.0, 1.0)
             tail_target = (1.0 - tail_speed_norm) ** tail_curve
             tail_state = tail_state * 0.62 + tail_target * 0.38
         else:
             tail_state *= 0.72
-        tail_state = float(clamp(tail_state, 0.0, 1.0))
+        tail_state = float(_clamp_sorted(tail_state, 0.0, 1.0))
         self._stroke_tail_state = tail_state
         if tail_strength > 0.0 and tail_state > 0.0:
-            tail_weight = clamp(tail_strength * tail_state, 0.0, 1.0)
+            tail_weight = _clamp_sorted(tail_strength * tail_state, 0.0, 1.0)
             if tail_weight > 0.0:
                 cur_w = max(min_w, cur_w * (1.0 - tail_weight) + min_w * tail_weight)
         cur_w = float(clamp(cur_w, min_w, max_w))
@@ -9950,7 +10805,7 @@ class OverlayWindow(QWidget, _PresentationWindowMixin):
         tail_alpha_fade = float(getattr(config, "tail_alpha_fade", 0.0) or 0.0)
         if tail_alpha_fade > 0.0 and tail_state > 0.0:
             fade_alpha = int(
-                fade_alpha * (1.0 - clamp(tail_alpha_fade * tail_state, 0.0, 0.9))
+                fade_alpha * (1.0 - _clamp_sorted(tail_alpha_fade * tail_state, 0.0, 0.9))
             )
         fade_alpha = int(clamp(fade_alpha, self._active_fade_min, self._active_fade_max))
         cur_w, fade_alpha = self._style_profile_adjustment(
@@ -9982,22 +10837,19 @@ class OverlayWindow(QWidget, _PresentationWindowMixin):
             path,
             cur_w,
             config,
-            QColor(self._active_pen_color),
+            self._active_pen_color,
             stroke_coverage=self._stroke_fill_coverage,
         )
+        # apply() 只读取颜色，且返回的覆盖路径要么是新建的，要么就是传入的那一条，无需再复制。
         if isinstance(updated_coverage, QPainterPath):
-            self._stroke_fill_coverage = QPainterPath(updated_coverage)
+            self._stroke_fill_coverage = updated_coverage
 
         self.last_point = QPointF(cur_point)
         self._stroke_last_midpoint = QPointF(current_mid)
         self.last_width = cur_w
 
         dirty = path.boundingRect()
-        overlay_factor = max(
-            config.shadow_width_scale,
-            1.0 + config.feather_strength,
-            1.0 + config.noise_strength * 0.45,
-        )
+        overlay_factor = config.overlay_factor
         margin = max(cur_w * (0.6 + (overlay_factor - 1.0) * 0.7), cur_w * 0.6) + 6.0
         return dirty.adjusted(-margin, -margin, margin, margin)
 
@@ -10146,7 +10998,7 @@ class TTSManager(QObject):
 
         def _try_pyttsx3() -> bool:
             nonlocal missing_reason
-            if pyttsx3 is None:
+            if not PYTTSX3_AVAILABLE:
                 missing_reason = "未检测到 pyttsx3 模块"
                 return False
             try:
@@ -11073,6 +11925,7 @@ class RollCallLogic(QObject):
         w = self.window
         if ensure_mode and w.mode != "roll_call":
             w.mode = "roll_call"
+            w._settings_dirty = True
             w.update_mode_ui(force_timer_reset=False)
         if w.mode != "roll_call":
             return False
@@ -11677,6 +12530,8 @@ class RollCallTimerWindow(QWidget):
 
         self.photo_root_path, self._photo_search_roots = _determine_student_photo_roots()
         self._photo_extensions = [".png", ".jpg", ".jpeg", ".bmp", ".gif"]
+        # 每个班级照片目录缓存一次扫描结果：(mtime, {小写学号: 文件名})，目录变化时重建。
+        self._photo_index: Dict[str, Tuple[float, Dict[str, str]]] = {}
         self._photo_overlay: Optional[StudentPhotoOverlay] = None
         self._last_photo_student_id: Optional[str] = None
         self._photo_manual_hidden = False
@@ -11731,8 +12586,12 @@ class RollCallTimerWindow(QWidget):
         self._speech_check_scheduled = False
         self._pending_passive_student: Optional[int] = None
         self._settings_write_lock = QMutex()
+        self._workbook_write_lock = QMutex()
+        self._workbook_save_inflight = False
+        self._workbook_save_pending: Optional[Tuple[Dict[str, PandasDataFrame], str, Optional[str]]] = None
         self._student_data_loading = False
-        self._io_pool = QThreadPool.globalInstance()
+        # 独立线程池只承载本窗口的写入任务，退出时等待它即可，不受全局线程池中其他任务影响。
+        self._io_pool = QThreadPool(self)
 
         # 点名逻辑与后台触发控制
         self.roll_logic = RollCallLogic(self)
@@ -11763,6 +12622,8 @@ class RollCallTimerWindow(QWidget):
         self._save_timer.setSingleShot(True)
         self._save_timer.setInterval(250)
         self._save_timer.timeout.connect(self.save_settings)
+        # 自上次保存后是否有状态变化；隐藏窗口时据此跳过重复写入。
+        self._settings_dirty = True
 
         self._build_ui()
         if self.student_workbook is not None:
@@ -12021,7 +12882,7 @@ class RollCallTimerWindow(QWidget):
         if df is None:
             df = _new_student_dataframe() or pd.DataFrame(columns=DEFAULT_STUDENT_COLUMNS)
         try:
-            working = df.copy()
+            working = _copy_dataframe(df)
         except Exception:
             working = pd.DataFrame(df)
         self.student_data = working
@@ -12044,6 +12905,7 @@ class RollCallTimerWindow(QWidget):
         self._ensure_group_pool(self.current_group_name, force_reset=True)
         self.current_student_index = None
         self._pending_passive_student = None
+        self._settings_dirty = True
         self._restore_active_class_state(restore_current_student=False)
         self._store_active_class_state()
         self._update_class_button_label()
@@ -12067,6 +12929,7 @@ class RollCallTimerWindow(QWidget):
             # 没有有效记录时，保持 workbook 自身的 active_class
             target_class = workbook.active_class
         self.current_class_name = target_class
+        self._settings_dirty = True
         df = workbook.get_active_dataframe()
         self._set_student_dataframe(df, propagate=propagate)
 
@@ -12084,12 +12947,13 @@ class RollCallTimerWindow(QWidget):
         if class_name not in self.student_workbook.class_names():
             class_name = self.student_workbook.active_class
         try:
-            snapshot = self.student_data.copy()
+            snapshot = _copy_dataframe(self.student_data)
         except Exception:
             snapshot = pd.DataFrame(self.student_data)
         self.student_workbook.update_class(class_name, snapshot)
         self.student_workbook.set_active_class(class_name)
         self.current_class_name = class_name
+        self._settings_dirty = True
         self._store_active_class_state(class_name)
 
     def _resolve_active_class_name(self) -> str:
@@ -12142,14 +13006,19 @@ class RollCallTimerWindow(QWidget):
             else:
                 last_payload[group] = idx
 
-        global_drawn_payload: List[int] = []
-        for value in sorted(self._global_drawn_students):
-            try:
-                idx = int(value)
-            except (TypeError, ValueError):
-                continue
-            if not all_set or idx in all_set:
-                global_drawn_payload.append(idx)
+        drawn_sorted = sorted(self._global_drawn_students)
+        if all(type(value) is int for value in drawn_sorted):
+            # 常见情况：集合中均为整数，无需逐项转换与异常处理。
+            global_drawn_payload = [idx for idx in drawn_sorted if not all_set or idx in all_set]
+        else:
+            global_drawn_payload = []
+            for value in drawn_sorted:
+                try:
+                    idx = int(value)
+                except (TypeError, ValueError):
+                    continue
+                if not all_set or idx in all_set:
+                    global_drawn_payload.append(idx)
 
         if self.groups:
             if self.current_group_name in self.groups:
@@ -12227,7 +13096,7 @@ class RollCallTimerWindow(QWidget):
 
     def _encode_class_states(self) -> str:
         payload = {name: state.to_json() for name, state in self._class_roll_states.items()}
-        return json.dumps(payload, ensure_ascii=False)
+        return _dumps_json(payload)
 
     def _parse_legacy_roll_state(self, section: Mapping[str, str]) -> Optional[ClassRollState]:
         def _load_dict(key: str) -> Dict[str, Any]:
@@ -12288,6 +13157,7 @@ class RollCallTimerWindow(QWidget):
     def _apply_roll_state(self, snapshot: ClassRollState, *, restore_current_student: bool = True) -> None:
         if not self._can_apply_roll_state():
             return
+        self._settings_dirty = True
 
         remaining_data = snapshot.group_remaining or {}
         last_data = snapshot.group_last or {}
@@ -12765,6 +13635,7 @@ class RollCallTimerWindow(QWidget):
                 controller.stop()
             if self.remote_presenter_enabled:
                 self.remote_presenter_enabled = False
+                self._settings_dirty = True
                 if show_feedback:
                     show_quiet_information(self, "当前系统无法拦截翻页笔按键，已自动关闭遥控点名。")
             self._sync_remote_presenter_actions()
@@ -12782,6 +13653,7 @@ class RollCallTimerWindow(QWidget):
             return
         if not controller.set_enabled(True):
             self.remote_presenter_enabled = False
+            self._settings_dirty = True
             self._remote_presenter_paused = False
             self._sync_remote_presenter_actions()
             if show_feedback:
@@ -13208,8 +14080,8 @@ class RollCallTimerWindow(QWidget):
             except (TypeError, ValueError):
                 normalized_idx = idx
             sid_value = row.get("学号", "")
-            sid_display = re.sub(r"\s+", "", _normalize_text(sid_value))
-            name = re.sub(r"\s+", "", _normalize_text(row.get("姓名", "")))
+            sid_display = _WHITESPACE_RE.sub("", _normalize_text(sid_value))
+            name = _WHITESPACE_RE.sub("", _normalize_text(row.get("姓名", "")))
             try:
                 sort_key = int(sid_display) if sid_display else sys.maxsize
             except (TypeError, ValueError):
@@ -13251,6 +14123,7 @@ class RollCallTimerWindow(QWidget):
             if selected in self.student_data.index:
                 self.current_student_index = selected
                 self._pending_passive_student = None
+                self._settings_dirty = True
                 self.display_current_student()
                 self._announce_current_student()
 
@@ -13266,6 +14139,7 @@ class RollCallTimerWindow(QWidget):
         timer_reset_required = force_timer_reset
         if is_roll and not self._ensure_student_data_ready():
             self.mode = "timer"
+            self._settings_dirty = True
             is_roll = False
             timer_reset_required = True
         self.title_label.setText("点名" if is_roll else "计时")
@@ -13279,6 +14153,8 @@ class RollCallTimerWindow(QWidget):
         self._update_class_button_label()
         if is_roll:
             if self._placeholder_on_show:
+                if self.current_student_index is not None:
+                    self._settings_dirty = True
                 self.current_student_index = None
             self.stack.setCurrentWidget(self.roll_call_frame)
             # 保持计时/秒表在后台运行，不强制重置/暂停
@@ -13310,6 +14186,7 @@ class RollCallTimerWindow(QWidget):
     def _handle_timer_mode_transition(self, previous_mode: Optional[str], new_mode: str) -> None:
         if previous_mode == new_mode:
             return
+        self._settings_dirty = True
         if new_mode in {"countdown", "stopwatch"}:
             self.timer_running = False
             self.count_timer.stop()
@@ -13346,6 +14223,8 @@ class RollCallTimerWindow(QWidget):
         else:
             self.timer_mode_button.setText("时钟")
             self.timer_start_pause_button.setEnabled(False); self.timer_reset_button.setEnabled(False); self.timer_set_button.setEnabled(False)
+            if self.timer_running:
+                self._settings_dirty = True
             self.timer_running = False; self.count_timer.stop(); self._update_clock(); self.clock_timer.start()
             self.timer_start_pause_button.setText("开始")
         self.schedule_font_update()
@@ -13407,6 +14286,7 @@ class RollCallTimerWindow(QWidget):
                 self._handle_mid_reminder_tick()
             else:
                 self.count_timer.stop(); self.timer_running = False; self.timer_start_pause_button.setText("开始"); self.update_timer_display()
+                self._settings_dirty = True
                 self._reset_reminder_progress()
                 self.play_timer_sound(kind="end")
                 return
@@ -13711,8 +14591,8 @@ class RollCallTimerWindow(QWidget):
             stu = self.student_data.loc[self.current_student_index]
             raw_sid = stu.get("学号", "")
             raw_name = stu.get("姓名", "")
-            sid = re.sub(r"\s+", "", _normalize_text(raw_sid))
-            name = re.sub(r"\s+", "", _normalize_text(raw_name))
+            sid = _WHITESPACE_RE.sub("", _normalize_text(raw_sid))
+            name = _WHITESPACE_RE.sub("", _normalize_text(raw_name))
             self.id_label.setText(sid if self.show_id else ""); self.name_label.setText(name if self.show_name else "")
             if not self.show_id: self.id_label.setText("")
             if not self.show_name: self.name_label.setText("")
@@ -13828,35 +14708,52 @@ class RollCallTimerWindow(QWidget):
                 continue
             visited.add(normalized_root)
             base_dir = os.path.join(root, class_name)
-            if normalized_root == primary_root:
+            if normalized_root == primary_root and base_dir not in self._photo_index:
                 try:
                     os.makedirs(base_dir, exist_ok=True)
                 except OSError:
                     logger.debug("Unable to ensure photo directory %s", base_dir, exc_info=True)
-            if not os.path.isdir(base_dir):
+            index = self._photo_directory_index(base_dir)
+            if not index:
                 continue
-            for ext in self._photo_extensions:
-                candidate = os.path.join(base_dir, f"{student_id}{ext}")
-                if os.path.isfile(candidate):
-                    return candidate
-                upper = os.path.join(base_dir, f"{student_id}{ext.upper()}")
-                if os.path.isfile(upper):
-                    return upper
-            lower_id = student_id.lower()
-            try:
-                for entry in os.listdir(base_dir):
-                    name, ext = os.path.splitext(entry)
-                    if not ext:
+            filename = index.get(student_id.lower())
+            if filename:
+                return os.path.join(base_dir, filename)
+        return None
+
+    def _photo_directory_index(self, base_dir: str) -> Dict[str, str]:
+        try:
+            mtime = os.stat(base_dir).st_mtime
+        except OSError:
+            self._photo_index.pop(base_dir, None)
+            return {}
+        cached = self._photo_index.get(base_dir)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        ranks = {ext: rank for rank, ext in enumerate(self._photo_extensions)}
+        best: Dict[str, Tuple[int, str]] = {}
+        try:
+            with os.scandir(base_dir) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    rank = ranks.get(ext.lower())
+                    if rank is None or not stem:
                         continue
-                    if ext.lower() not in self._photo_extensions:
+                    try:
+                        if not entry.is_file():
+                            continue
+                    except OSError:
                         continue
-                    if name.lower() == lower_id:
-                        candidate = os.path.join(base_dir, entry)
-                        if os.path.isfile(candidate):
-                            return candidate
-            except OSError:
-                logger.debug("Failed to scan photo directory %s", base_dir, exc_info=True)
-        return None
+                    key = stem.lower()
+                    current = best.get(key)
+                    if current is None or rank < current[0]:
+                        best[key] = (rank, entry.name)
+        except OSError:
+            logger.debug("Failed to scan photo directory %s", base_dir, exc_info=True)
+            return {}
+        index = {key: name for key, (_rank, name) in best.items()}
+        self._photo_index[base_dir] = (mtime, index)
+        return index
 
     @staticmethod
     def _sanitize_photo_segment(value: str) -> str:
@@ -13924,6 +14821,7 @@ class RollCallTimerWindow(QWidget):
 
     def update_dynamic_fonts(self) -> None:
         name_font_size = self.last_name_font_size
+        previous_sizes = (self.last_id_font_size, self.last_name_font_size, self.last_timer_font_size)
         for lab in (self.id_label, self.name_label):
             if not lab.isVisible(): continue
             w = max(40, lab.width()); h = max(40, lab.height()); text = lab.text()
@@ -13943,23 +14841,17 @@ class RollCallTimerWindow(QWidget):
             size = self._calc_font_size(w, h, text, monospace=True)
             self.time_display_label.setFont(QFont("Consolas", size, QFont.Weight.Bold))
             self.last_timer_font_size = size
+        if previous_sizes != (self.last_id_font_size, self.last_name_font_size, self.last_timer_font_size):
+            self._settings_dirty = True
 
     def _calc_font_size(self, w: int, h: int, text: str, monospace: bool = False) -> int:
-        if not text or w < 20 or h < 20:
-            return self.MIN_FONT_SIZE
-        w_eff = max(1, w - 16)
-        h_eff = max(1, h - 16)
-        is_cjk = any("\u4e00" <= c <= "\u9fff" for c in text)
-        length = max(1, len(text))
-        width_char_factor = 1.0 if is_cjk else (0.58 if monospace else 0.6)
-        size_by_width = w_eff / (length * width_char_factor)
-        size_by_height = h_eff * 0.70
-        final_size = int(min(size_by_width, size_by_height))
-        return max(self.MIN_FONT_SIZE, min(self.MAX_FONT_SIZE, final_size))
+        return _fit_font_size(w, h, text, monospace, self.MIN_FONT_SIZE, self.MAX_FONT_SIZE)
 
     def showEvent(self, e) -> None:
         super().showEvent(e)
         if self.mode == "roll_call" and self._placeholder_on_show:
+            if self.current_student_index is not None:
+                self._settings_dirty = True
             self.current_student_index = None
             self.display_current_student()
             self._placeholder_on_show = False
@@ -13982,7 +14874,7 @@ class RollCallTimerWindow(QWidget):
         self._hide_student_photo(force=True)
         super().hideEvent(e)
         self._placeholder_on_show = True
-        self.save_settings()
+        self.save_settings(force=False)
         self.visibility_changed.emit(False)
 
     def closeEvent(self, e) -> None:
@@ -13993,11 +14885,12 @@ class RollCallTimerWindow(QWidget):
     def _schedule_save(self) -> None:
         """延迟写入设置，避免频繁保存导致的磁盘抖动。"""
 
+        self._settings_dirty = True
         if self._save_timer.isActive():
             self._save_timer.stop()
         self._save_timer.start()
 
-    def _threaded_save_settings(self, payload: Dict[str, Dict[str, str]]) -> bool:
+    def _threaded_save_settings(self, payload: Mapping[str, Mapping[str, str]]) -> bool:
         locker = QMutexLocker(self._settings_write_lock)
         try:
             self.settings_manager.save_settings(payload)
@@ -14005,7 +14898,7 @@ class RollCallTimerWindow(QWidget):
             del locker
         return True
 
-    def _queue_settings_save(self, settings: Dict[str, Dict[str, str]]) -> None:
+    def _queue_settings_save(self, settings: Mapping[str, Mapping[str, str]]) -> None:
         worker = _IOWorker(self._threaded_save_settings, settings)
 
         def _log_error(message: str, _exc: object) -> None:
@@ -14014,10 +14907,19 @@ class RollCallTimerWindow(QWidget):
         worker.signals.error.connect(_log_error)
         self._io_pool.start(worker)
 
-    def save_settings(self) -> None:
+    def _has_unsaved_settings(self, geometry: str) -> bool:
+        if self._settings_dirty or self.timer_running:
+            return True
+        return geometry != self.roll_call_config.geometry
+
+    def save_settings(self, *, force: bool = True) -> None:
         if self._save_timer.isActive():
             self._save_timer.stop()
-        self.roll_call_config.geometry = geometry_to_text(self)
+        geometry = geometry_to_text(self)
+        if not force and not self._has_unsaved_settings(geometry):
+            return
+        self._settings_dirty = False
+        self.roll_call_config.geometry = geometry
         self.roll_call_config.show_id = bool(self.show_id)
         self.roll_call_config.show_name = bool(self.show_name)
         self.roll_call_config.show_photo = bool(self.show_photo)
@@ -14053,14 +14955,15 @@ class RollCallTimerWindow(QWidget):
             # 在尚未加载真实名单数据时，保留磁盘上已有的未点名状态，避免误把占位空列表写回
             # 此时直接返回，保持上一轮保存的名单信息不被覆盖。
             payload = self.roll_call_config.to_mapping()
-            settings = self.settings_manager.load_settings()
-            settings["RollCallTimer"] = payload
-            self.settings_manager.save_settings(settings)
+            self.settings_manager.update_section("RollCallTimer", payload, replace=True)
             return
 
         # 名单已经加载完成，正常序列化各分组的剩余名单及历史记录
         remaining_payload: Dict[str, List[int]] = {}
         for group, indices in self._group_remaining_indices.items():
+            if all(type(idx) is int for idx in indices):
+                remaining_payload[group] = list(indices)
+                continue
             cleaned: List[int] = []
             for idx in indices:
                 try:
@@ -14072,27 +14975,28 @@ class RollCallTimerWindow(QWidget):
         all_groups = set(self._group_all_indices.keys()) | set(self._group_last_student.keys())
         for group in all_groups:
             value = self._group_last_student.get(group)
-            if value is None:
-                last_payload[group] = None
+            if value is None or type(value) is int:
+                last_payload[group] = value
             else:
                 try:
                     last_payload[group] = int(value)
                 except (TypeError, ValueError):
                     last_payload[group] = None
         try:
-            self.roll_call_config.group_remaining = json.dumps(remaining_payload, ensure_ascii=False)
+            self.roll_call_config.group_remaining = _dumps_json(remaining_payload)
         except TypeError:
-            self.roll_call_config.group_remaining = json.dumps({}, ensure_ascii=False)
+            self.roll_call_config.group_remaining = "{}"
         try:
-            self.roll_call_config.group_last = json.dumps(last_payload, ensure_ascii=False)
+            self.roll_call_config.group_last = _dumps_json(last_payload)
         except TypeError:
-            self.roll_call_config.group_last = json.dumps({}, ensure_ascii=False)
+            self.roll_call_config.group_last = "{}"
         try:
             global_drawn_payload = sorted(int(idx) for idx in self._global_drawn_students)
-            self.roll_call_config.global_drawn = json.dumps(global_drawn_payload, ensure_ascii=False)
+            self.roll_call_config.global_drawn = _dumps_json(global_drawn_payload)
         except TypeError:
-            self.roll_call_config.global_drawn = json.dumps([], ensure_ascii=False)
-        settings = self.settings_manager.load_settings()
+            self.roll_call_config.global_drawn = "[]"
+        # 只替换整个分区，外层浅拷贝即可；缓存中的分区字典不会被原地修改。
+        settings = dict(self.settings_manager.load_settings(copy=False))
         settings["RollCallTimer"] = self.roll_call_config.to_mapping()
         self._queue_settings_save(settings)
         self._persist_roll_state_to_workbook()
@@ -14112,9 +15016,9 @@ class RollCallTimerWindow(QWidget):
         if active_class:
             self._class_roll_states[active_class] = snapshot
         self.roll_call_config.class_states = self._encode_class_states()
-        settings = self.settings_manager.load_settings()
-        settings["RollCallTimer"] = self.roll_call_config.to_mapping()
-        self.settings_manager.save_settings(settings)
+        self.settings_manager.update_section(
+            "RollCallTimer", self.roll_call_config.to_mapping(), replace=True
+        )
         self._persist_roll_state_to_workbook()
 
     def _persist_roll_state_to_workbook(self) -> None:
@@ -14134,7 +15038,7 @@ class RollCallTimerWindow(QWidget):
             if self.student_data is None or not isinstance(self.student_data, pd.DataFrame):
                 return
             try:
-                snapshot = self.student_data.copy()
+                snapshot = _copy_dataframe(self.student_data)
             except Exception:
                 snapshot = pd.DataFrame(self.student_data)
             class_name = self.current_class_name or "班级1"
@@ -14152,12 +15056,63 @@ class RollCallTimerWindow(QWidget):
         except Exception:
             return
         self._refresh_student_file_paths()
+        # 在 GUI 线程中复制数据快照，后台线程只处理快照，避免与界面修改竞争。
+        snapshot: "OrderedDict[str, PandasDataFrame]" = OrderedDict()
+        for name, df in data.items():
+            try:
+                snapshot[name] = _copy_dataframe(df)
+            except Exception:
+                snapshot[name] = df
+        self._queue_workbook_save((snapshot, self._plain_file_path, roll_state_json))
+
+    def _threaded_save_workbook(
+        self,
+        data: Mapping[str, PandasDataFrame],
+        file_path: str,
+        roll_state_json: Optional[str],
+    ) -> bool:
+        locker = QMutexLocker(self._workbook_write_lock)
         try:
-            _save_student_workbook(
-                data,
-                self._plain_file_path,
-                roll_state_json=roll_state_json,
-            )
+            _save_student_workbook(data, file_path, roll_state_json=roll_state_json)
+        finally:
+            del locker
+        return True
+
+    def _queue_workbook_save(self, job: Tuple[Dict[str, PandasDataFrame], str, Optional[str]]) -> None:
+        """后台写入学生数据文件；同一时间只保留一个写入任务，其余合并为最新的一次。"""
+
+        if self._workbook_save_inflight:
+            self._workbook_save_pending = job
+            return
+        self._workbook_save_inflight = True
+        worker = _IOWorker(self._threaded_save_workbook, *job)
+
+        def _log_error(message: str, _exc: object) -> None:
+            logger.debug("Failed to persist roll state into workbook: %s", message)
+            self._on_workbook_save_finished()
+
+        worker.signals.finished.connect(lambda _result: self._on_workbook_save_finished())
+        worker.signals.error.connect(_log_error)
+        self._io_pool.start(worker)
+
+    def _on_workbook_save_finished(self) -> None:
+        self._workbook_save_inflight = False
+        pending = self._workbook_save_pending
+        self._workbook_save_pending = None
+        if pending is not None:
+            self._queue_workbook_save(pending)
+
+    def flush_pending_io(self) -> None:
+        """等待后台写入完成，并同步写出尚未开始的学生数据任务（用于退出前）。"""
+
+        self._io_pool.waitForDone()
+        pending = self._workbook_save_pending
+        self._workbook_save_pending = None
+        self._workbook_save_inflight = False
+        if pending is None:
+            return
+        try:
+            self._threaded_save_workbook(*pending)
         except Exception as exc:
             logger.debug("Failed to persist roll state into workbook: %s", exc, exc_info=True)
 
@@ -14292,7 +15247,7 @@ def _export_student_workbook_bytes(
     if roll_state_json is not None:
         normalized["_ROLL_STATE"] = pd.DataFrame({"ROLL_STATE_JSON": [roll_state_json]})
     if not normalized:
-        normalized["班级1"] = _empty_student_dataframe().copy()
+        normalized["班级1"] = _empty_student_dataframe()
 
     def _render_bytes(engine: Optional[str]) -> bytes:
         buffer = io.BytesIO()
@@ -14460,6 +15415,11 @@ class LauncherBubble(_EnsureOnScreenMixin, QWidget):
         super().mouseReleaseEvent(event)
 
 class LauncherWindow(QWidget):
+    # 两个主按钮可能显示的全部文字，用于计算统一宽度。
+    _PAINT_LABELS: Tuple[str, ...] = ("画笔", "隐藏画笔")
+    _ROLL_LABELS: Tuple[str, ...] = ("点名/计时", "显示点名", "隐藏点名")
+    _ACTION_BUTTON_PADDING = 28
+
     def __init__(self, settings_manager: SettingsManager, student_workbook: Optional[StudentWorkbook]) -> None:
         super().__init__(
             None,
@@ -14484,18 +15444,28 @@ class LauncherWindow(QWidget):
                 self.student_data = _new_student_dataframe() or pd.DataFrame(columns=DEFAULT_STUDENT_COLUMNS)
         self.overlay: Optional[OverlayWindow] = None
         self.roll_call_window: Optional[RollCallTimerWindow] = None
+        self._student_workbook_worker: Optional[_IOWorker] = None
         self._dragging = False
         self._drag_origin: Optional[QPoint] = None
         self._drag_offset = QPoint()
+        # 拖动时只保留最新的目标位置，在下一轮事件循环统一移动窗口。
+        self._pending_move_pos: Optional[QPoint] = None
+        self._move_scheduled = False
         self.bubble: Optional[LauncherBubble] = None
         self._last_position = QPoint()
         self._bubble_position = QPoint()
         self._minimized = False
         self._minimized_on_start = False
+        self._geometry_clamped = False
         self._auto_exit_seconds = 0
         self._auto_exit_timer = QTimer(self)
         self._auto_exit_timer.setSingleShot(True)
         self._auto_exit_timer.timeout.connect(self.request_exit)
+        # 拖动、气泡移动等会连续触发保存，合并为一次写盘。
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(400)
+        self._save_timer.timeout.connect(self._flush_save)
 
     def _configure_window(self) -> None:
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
@@ -14607,53 +15577,32 @@ class LauncherWindow(QWidget):
         return container
 
     def _apply_button_metrics(self) -> None:
+        action_buttons = (self.paint_button, self.roll_call_button)
+        info_buttons = (self.about_button, self.settings_button, self.exit_button)
+        # 只有需要按文字定宽的按钮才查询 sizeHint；所有按钮共用同一字体与样式表，
+        # 行高一致，直接复用这些结果即可，并一次性设置固定尺寸以减少重复布局。
+        hints = {button: button.sizeHint() for button in (self.minimize_button,) + info_buttons}
+        target_height = max(hint.height() for hint in hints.values())
         unified_width = self._action_button_width()
-        self.paint_button.setFixedWidth(unified_width)
-        self.roll_call_button.setFixedWidth(unified_width)
-
-        auxiliary_width = max(self.minimize_button.sizeHint().width(), 52)
-        self.minimize_button.setFixedWidth(auxiliary_width)
+        auxiliary_width = max(hints[self.minimize_button].width(), 52)
+        info_width = max(max(hints[button].width() for button in info_buttons), 52)
 
-        info_width = max(
-            self.about_button.sizeHint().width(),
-            self.settings_button.sizeHint().width(),
-            self.exit_button.sizeHint().width(),
-            52,
-        )
-        self.about_button.setFixedWidth(info_width)
-        self.settings_button.setFixedWidth(info_width)
-        self.exit_button.setFixedWidth(info_width)
-
-        button_heights = [
-            self.paint_button.sizeHint().height(),
-            self.roll_call_button.sizeHint().height(),
-            self.minimize_button.sizeHint().height(),
-            self.about_button.sizeHint().height(),
-            self.settings_button.sizeHint().height(),
-            self.exit_button.sizeHint().height(),
-        ]
-        target_height = max(button_heights)
-        for button in (
-            self.paint_button,
-            self.roll_call_button,
-            self.minimize_button,
-            self.about_button,
-            self.settings_button,
-            self.exit_button,
-        ):
-            button.setFixedHeight(target_height)
+        self.setUpdatesEnabled(False)
+        try:
+            for button in action_buttons:
+                button.setFixedSize(unified_width, target_height)
+            self.minimize_button.setFixedSize(auxiliary_width, target_height)
+            for button in info_buttons:
+                button.setFixedSize(info_width, target_height)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _finalize_drag_regions(self, container: QWidget) -> None:
-        for widget in (
-            self,
-            container,
-            self.paint_button,
-            self.roll_call_button,
-            self.minimize_button,
-        ):
+        # 按钮会自行接收鼠标事件，不参与拖动；只需监听窗口与容器本身。
+        self._drag_sources = frozenset((self, container))
+        for widget in self._drag_sources:
             widget.installEventFilter(self)
 
-        self.adjustSize()
         self.setFixedSize(self.sizeHint())
         self._base_minimum_width = self.minimumWidth()
         self._base_minimum_height = self.minimumHeight()
@@ -14689,26 +15638,24 @@ class LauncherWindow(QWidget):
     def _action_button_width(self) -> int:
         """计算“画笔”与“点名/计时”按钮的统一宽度，保证观感一致。"""
 
-        paint_metrics = QFontMetrics(self.paint_button.font())
-        roll_metrics = QFontMetrics(self.roll_call_button.font())
-        paint_texts = ["画笔", "隐藏画笔"]
-        roll_texts = ["点名/计时", "显示点名", "隐藏点名"]
         max_width = max(
-            max(paint_metrics.horizontalAdvance(text) for text in paint_texts),
-            max(roll_metrics.horizontalAdvance(text) for text in roll_texts),
+            _max_text_advance(self.paint_button.font().toString(), self._PAINT_LABELS),
+            _max_text_advance(self.roll_call_button.font().toString(), self._ROLL_LABELS),
         )
-        return max_width + 28
+        return max_width + self._ACTION_BUTTON_PADDING
 
     def showEvent(self, e) -> None:
         super().showEvent(e)
-        ensure_widget_within_screen(self)
+        if self._geometry_clamped:
+            self._geometry_clamped = False
+        else:
+            ensure_widget_within_screen(self)
         self._last_position = self.pos()
         if self._minimized_on_start:
             QTimer.singleShot(0, self._restore_minimized_state)
 
     def eventFilter(self, obj, e) -> bool:
-        drag_blockers = {self.paint_button, self.roll_call_button, self.minimize_button}
-        if obj not in drag_blockers:
+        if obj in self._drag_sources:
             if e.type() == QEvent.Type.MouseButtonPress and e.button() == Qt.MouseButton.LeftButton:
                 self._drag_origin = e.globalPosition().toPoint()
                 self._drag_offset = self._drag_origin - self.pos()
@@ -14718,16 +15665,33 @@ class LauncherWindow(QWidget):
                 if (not self._dragging) and (abs(delta.x()) >= 3 or abs(delta.y()) >= 3):
                     self._dragging = True
                 if self._dragging:
-                    self.move(e.globalPosition().toPoint() - self._drag_offset)
+                    self._pending_move_pos = e.globalPosition().toPoint() - self._drag_offset
+                    if not self._move_scheduled:
+                        self._move_scheduled = True
+                        QTimer.singleShot(0, self._apply_pending_move)
             elif e.type() == QEvent.Type.MouseButtonRelease and e.button() == Qt.MouseButton.LeftButton:
                 if self._dragging:
+                    self._apply_pending_move()
                     self._last_position = self.pos()
                     self.save_position()
                 self._dragging = False
                 self._drag_origin = None
         return super().eventFilter(obj, e)
 
+    def _apply_pending_move(self) -> None:
+        self._move_scheduled = False
+        target = self._pending_move_pos
+        self._pending_move_pos = None
+        if target is not None:
+            self.move(target)
+
     def save_position(self) -> None:
+        """延迟保存启动器位置；短时间内的多次调用只写盘一次。"""
+
+        self._save_timer.start()
+
+    def _flush_save(self) -> None:
+        self._save_timer.stop()
         anchor_position = (
             self._last_position if (self._minimized and not self._last_position.isNull()) else self.pos()
         )
@@ -14773,7 +15737,7 @@ class LauncherWindow(QWidget):
         if overlay.isVisible() and toolbar_visible:
             overlay.hide_overlay(); self.paint_button.setText("画笔")
         else:
-            overlay.show_overlay(); overlay.raise_toolbar(); overlay.raise_(); overlay.activateWindow()
+            overlay.show_overlay()
             self.paint_button.setText("隐藏画笔")
 
     def toggle_roll_call(self) -> None:
@@ -14782,31 +15746,12 @@ class LauncherWindow(QWidget):
             if not PANDAS_AVAILABLE or not OPENPYXL_AVAILABLE:
                 QMessageBox.warning(self, "提示", "未安装 pandas/openpyxl，点名功能不可用。")
                 return
-            config = self.settings_manager.get_roll_call_settings()
+            if self._student_workbook_worker is not None:
+                return
             if self.student_workbook is None:
-                workbook = load_student_data(self)
-                if workbook is None:
-                    QMessageBox.warning(self, "提示", "学生数据加载失败，无法打开点名器。")
-                    return
-                # 使用上次保存的班级作为初始 active_class，避免默认落到第一张表
-                saved_class = str(config.current_class).strip()
-                if saved_class and saved_class in workbook.class_names():
-                    workbook.set_active_class(saved_class)
-                self.student_workbook = workbook
-                if PANDAS_READY:
-                    try:
-                        self.student_data = workbook.get_active_dataframe()
-                    except Exception:
-                        self.student_data = _new_student_dataframe() or pd.DataFrame(columns=DEFAULT_STUDENT_COLUMNS)
-            self.roll_call_window = RollCallTimerWindow(
-                self.settings_manager,
-                self.student_workbook,
-                parent=self,
-            )
-            self.roll_call_window.window_closed.connect(self.on_roll_call_window_closed)
-            self.roll_call_window.visibility_changed.connect(self.on_roll_call_visibility_changed)
-            self.roll_call_window.show()
-            self.roll_call_button.setText("隐藏点名")
+                self._load_student_workbook_async()
+                return
+            self._open_roll_call_window()
         else:
             if self.roll_call_window.isVisible():
                 self.roll_call_window.hide()
@@ -14816,6 +15761,63 @@ class LauncherWindow(QWidget):
                 self.roll_call_window.raise_()
                 self.roll_call_button.setText("隐藏点名")
 
+    def _load_student_workbook_async(self) -> None:
+        """在后台线程读取学生名单，完成后再创建点名窗口，避免首次点击卡住界面。"""
+
+        resources = _STUDENT_RESOURCES
+        file_path = resources.plain
+        existing_plain = _any_existing_path(resources.plain_candidates)
+        worker = _IOWorker(_read_student_workbook, existing_plain, file_path)
+        worker.signals.finished.connect(
+            lambda result: self._on_student_workbook_loaded(result, file_path)
+        )
+        worker.signals.error.connect(lambda message, _exc: self._on_student_workbook_failed(message))
+        self._student_workbook_worker = worker
+        self.roll_call_button.setEnabled(False)
+        self.roll_call_button.setText("加载中…")
+        QThreadPool.globalInstance().start(worker)
+
+    def _finish_student_workbook_load(self) -> None:
+        self._student_workbook_worker = None
+        self.roll_call_button.setEnabled(True)
+        self.roll_call_button.setText("点名/计时")
+
+    def _on_student_workbook_loaded(self, result: object, file_path: str) -> None:
+        self._finish_student_workbook_load()
+        workbook, created, _embedded = cast(Tuple[Optional[StudentWorkbook], bool, Optional[str]], result)
+        if workbook is None:
+            QMessageBox.warning(self, "提示", "学生数据加载失败，无法打开点名器。")
+            return
+        if created:
+            show_quiet_information(self, f"未找到学生数据，已为你创建模板文件：{file_path}")
+        config = self.settings_manager.get_roll_call_settings()
+        # 使用上次保存的班级作为初始 active_class，避免默认落到第一张表
+        saved_class = str(config.current_class).strip()
+        if saved_class and saved_class in workbook.class_names():
+            workbook.set_active_class(saved_class)
+        self.student_workbook = workbook
+        if PANDAS_READY:
+            try:
+                self.student_data = workbook.get_active_dataframe()
+            except Exception:
+                self.student_data = _new_student_dataframe() or pd.DataFrame(columns=DEFAULT_STUDENT_COLUMNS)
+        self._open_roll_call_window()
+
+    def _on_student_workbook_failed(self, message: str) -> None:
+        self._finish_student_workbook_load()
+        QMessageBox.critical(self, "错误", f"无法加载学生数据，文件格式异常\n详情: {message}")
+
+    def _open_roll_call_window(self) -> None:
+        self.roll_call_window = RollCallTimerWindow(
+            self.settings_manager,
+            self.student_workbook,
+            parent=self,
+        )
+        self.roll_call_window.window_closed.connect(self.on_roll_call_window_closed)
+        self.roll_call_window.visibility_changed.connect(self.on_roll_call_visibility_changed)
+        self.roll_call_window.show()
+        self.roll_call_button.setText("隐藏点名")
+
     def on_roll_call_window_closed(self) -> None:
         window = self.roll_call_window
         if window is not None:
@@ -14842,11 +15844,12 @@ class LauncherWindow(QWidget):
     def handle_about_to_quit(self) -> None:
         """在应用退出前的最后一道保险，保证关键状态已经写入配置。"""
 
-        self.save_position()
+        self._flush_save()
         window = self.roll_call_window
         if window is not None:
             try:
                 window.save_settings()
+                window.flush_pending_io()
             except RuntimeError:
                 pass
 
@@ -14868,8 +15871,9 @@ class LauncherWindow(QWidget):
             self.bubble.place_near(self._bubble_position, screen)
         else:
             self.bubble.place_near(target_center, screen)
-        self.bubble.setWindowOpacity(0.74)
-        self.bubble.show()
+        # 气泡只创建一次，透明度在构造时已设置；hide/show 不会销毁原生窗口。
+        if not self.bubble.isVisible():
+            self.bubble.show()
         self.bubble.raise_()
         self._minimized = True
         self.save_position()
@@ -14885,6 +15889,7 @@ class LauncherWindow(QWidget):
 
         self._minimized = False
         target_pos: Optional[QPoint] = None
+        clamped_to_screen = False
         screen = None
         if self.bubble:
             self._bubble_position = self.bubble.pos()
@@ -14896,42 +15901,49 @@ class LauncherWindow(QWidget):
             height = self.height() or self.sizeHint().height()
             if screen is not None:
                 available = screen.availableGeometry()
-                distances = {
-                    "left": abs(bubble_center.x() - available.left()),
-                    "right": abs(available.right() - bubble_center.x()),
-                    "top": abs(bubble_center.y() - available.top()),
-                    "bottom": abs(available.bottom() - bubble_center.y()),
-                }
-                nearest_edge = min(distances, key=distances.get)
-                if nearest_edge == "left":
+                center_x = bubble_center.x()
+                center_y = bubble_center.y()
+                # 按 左/右/上/下 的顺序比较距离，距离相同时取靠前的边。
+                _distance, nearest_edge = min(
+                    (abs(center_x - available.left()), 0),
+                    (abs(available.right() - center_x), 1),
+                    (abs(center_y - available.top()), 2),
+                    (abs(available.bottom() - center_y), 3),
+                )
+                if nearest_edge == 0:
                     x = bubble_geom.right() + margin
-                    y = bubble_center.y() - height // 2
-                elif nearest_edge == "right":
+                    y = center_y - height // 2
+                elif nearest_edge == 1:
                     x = bubble_geom.left() - width - margin
-                    y = bubble_center.y() - height // 2
-                elif nearest_edge == "top":
+                    y = center_y - height // 2
+                elif nearest_edge == 2:
                     y = bubble_geom.bottom() + margin
-                    x = bubble_center.x() - width // 2
+                    x = center_x - width // 2
                 else:
                     y = bubble_geom.top() - height - margin
-                    x = bubble_center.x() - width // 2
+                    x = center_x - width // 2
                 x = max(available.left(), min(int(x), available.right() - width))
                 y = max(available.top(), min(int(y), available.bottom() - height))
                 target_pos = QPoint(x, y)
+                clamped_to_screen = True
             self.bubble.hide()
         if target_pos is None and not self._last_position.isNull():
             target_pos = QPoint(self._last_position)
         if target_pos is not None:
             self.move(target_pos)
+        # 已按可用区域夹紧过位置时，showEvent 无需再次检查屏幕边界；窗口已可见时 show() 不会触发
+        # showEvent，此时不能留下标记，否则下一次真正显示会跳过边界检查。
+        self._geometry_clamped = clamped_to_screen and not self.isVisible()
         self.show()
         self.raise_()
         self.activateWindow()
-        ensure_widget_within_screen(self)
+        if not clamped_to_screen:
+            ensure_widget_within_screen(self)
         self._last_position = self.pos()
         self.save_position()
 
     def _on_bubble_position_changed(self, pos: QPoint) -> None:
-        self._bubble_position = QPoint(pos.x(), pos.y())
+        self._bubble_position = QPoint(pos)
         if self._minimized:
             self.save_position()
 
@@ -14939,7 +15951,7 @@ class LauncherWindow(QWidget):
         AboutDialog(self).exec()
 
     def closeEvent(self, e) -> None:
-        self.save_position()
+        self._flush_save()
         if self.bubble is not None:
             self.bubble.close()
         if self.roll_call_window is not None: self.roll_call_window.close()
@@ -14954,11 +15966,8 @@ class ApplicationContext:
 
     @classmethod
     def create(cls) -> "ApplicationContext":
-        settings_manager = SettingsManager()
-        workbook: Optional[StudentWorkbook] = None
-        if PANDAS_AVAILABLE:
-            workbook = load_student_data(None)
-        return cls(settings_manager=settings_manager, student_workbook=workbook)
+        # 学生名单延迟到首次打开点名窗口时在后台加载，避免阻塞启动器首次显示。
+        return cls(settings_manager=SettingsManager(), student_workbook=None)
 
     def create_launcher_window(self) -> LauncherWindow:
         return LauncherWindow(self.settings_manager, self.student_workbook)
@@ -14971,12 +15980,15 @@ def main() -> None:
     _setup_qt_plugin_paths()
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
-    QToolTip.setFont(QFont("Microsoft YaHei UI", 9))
+    # 在首个窗口构建期间于后台解码工具条图标。
+    IconManager.warm()
 
     context = ApplicationContext.create()
     window = context.create_launcher_window()
     app.aboutToQuit.connect(window.handle_about_to_quit)
     window.show()
+    # 提示框字体不影响首屏，待事件循环启动后再设置。
+    QTimer.singleShot(0, lambda: QToolTip.setFont(QFont("Microsoft YaHei UI", 9)))
     sys.exit(app.exec())
 if __name__ == "__main__":
     main()
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import ast
+import configparser
 import dataclasses
 import enum
 import functools
+import importlib
+import io
+import logging
 import math
 import contextlib
 import os
@@ -13,6 +17,7 @@ import sys
 import tempfile
 import types
 import pytest
+import re
 from functools import singledispatch
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, cast
@@ -32,7 +37,9 @@ def _load_helper_module() -> types.ModuleType:
             "__file__": str(path),
             "__name__": module.__name__,
             "os": os,
+            "re": re,
             "sys": sys,
+            "configparser": configparser,
             "contextlib": contextlib,
             "tempfile": tempfile,
             "Optional": Optional,
@@ -51,16 +58,25 @@ def _load_helper_module() -> types.ModuleType:
             "math": math,
             "singledispatch": singledispatch,
             "win32gui": None,
+            "np": None,
+            "importlib": importlib,
+            "logger": logging.getLogger("ctools_helpers"),
             "_user32_top_level_hwnd": lambda hwnd: 0,
         }
     )
     sys.modules[module.__name__] = module
 
     targets = {
-        "_TRUE_STRINGS",
-        "_FALSE_STRINGS",
+        "_BOOL_STRINGS",
         "_BooleanParseResult",
         "_coerce_to_text",
+        "_coerce_bool_from_bool",
+        "_coerce_bool_from_int",
+        "_coerce_bool_from_float",
+        "_coerce_bool_from_bytes",
+        "_coerce_bool_from_byteslike",
+        "_coerce_bool_from_str",
+        "_BOOL_COERCERS",
         "_coerce_bool",
         "_casefold_cached",
         "_normalize_text_token",
@@ -68,11 +84,21 @@ def _load_helper_module() -> types.ModuleType:
         "parse_bool",
         "_ensure_directory",
         "_ensure_writable_directory",
+        "_is_writable_dir",
         "_preferred_app_directory",
         "_choose_writable_target",
         "str_to_bool",
         "_compute_presentation_category",
         "_PresentationWindowMixin",
+        "_INI_SECTION_RE",
+        "_INI_KV_RE",
+        "_parse_settings_text",
+        "_format_settings_text",
+        "_NOISE_STRENGTH_MAX",
+        "_noise_mask_dots",
+        "_noise_mask_coverage",
+        "_LazyModule",
+        "_ModuleGate",
     }
     def _should_include_function(node: ast.FunctionDef) -> bool:
         if node.name in targets:
@@ -156,6 +182,20 @@ def test_str_to_bool_handles_bytes_and_enums() -> None:
     assert helpers.str_to_bool(_SampleEnum.DISABLED) is False
 
 
+def test_str_to_bool_handles_builtin_subclasses() -> None:
+    class _Flag(enum.IntEnum):
+        OFF = 0
+        ON = 1
+
+    class _Text(str):
+        pass
+
+    assert helpers.str_to_bool(_Flag.ON) is True
+    assert helpers.str_to_bool(_Flag.OFF, default=True) is False
+    assert helpers.str_to_bool(_Text(" Yes ")) is True
+    assert helpers.str_to_bool(object(), default=True) is True
+
+
 def test_str_to_bool_handles_common_byteslikes() -> None:
     assert helpers.str_to_bool(bytearray(b"YES")) is True
     assert helpers.str_to_bool(memoryview(b"0")) is False
@@ -166,6 +206,8 @@ def test_str_to_bool_interprets_numeric_strings() -> None:
     assert helpers.str_to_bool("-1") is True
     assert helpers.str_to_bool("0.0") is False
     assert helpers.str_to_bool("+0") is False
+    assert helpers.str_to_bool("000") is False
+    assert helpers.str_to_bool("0000000000001") is True
 
 
 def test_str_to_bool_ignores_nan_strings() -> None:
@@ -234,6 +276,38 @@ def test_choose_writable_target_strips_path_components(monkeypatch: pytest.Monke
     assert Path(result).name == "unsafe_students.xlsx"
 
 
+def test_parse_settings_text_matches_configparser_output() -> None:
+    config = configparser.ConfigParser()
+    config.optionxform = str
+    config["Launcher"] = {"x": "120", "Minimized": "False", "empty": ""}
+    config["RollCallTimer"] = {"current_group": "全部", "geometry": "480x280+180+180"}
+    buffer = io.StringIO()
+    config.write(buffer)
+    text = buffer.getvalue()
+    parsed = helpers._parse_settings_text(text)  # type: ignore[attr-defined]
+    assert parsed == {section: dict(config.items(section)) for section in config.sections()}
+    assert helpers._format_settings_text(parsed) == text  # type: ignore[attr-defined]
+    assert helpers._format_settings_text({"a": {"ratio": "50%"}}) is None  # type: ignore[attr-defined]
+
+
+def test_parse_settings_text_defers_unusual_layouts() -> None:
+    parse = helpers._parse_settings_text  # type: ignore[attr-defined]
+    assert parse("[a]\nkey: value\n") is None
+    assert parse("[a]\nkey = one\n  two\n") is None
+    assert parse("[a]\nkey = 50%%\n") is None
+    assert parse("[a]\nkey = 1\nkey = 2\n") is None
+    assert parse("") is None
+
+
+def test_parse_settings_text_splits_lines_like_configparser() -> None:
+    text = "[RollCallTimer]\ncurrent_class = 一班\u2028备注=1\nmode = roll_call\x0cx\n"
+    config = configparser.ConfigParser(interpolation=None)
+    config.optionxform = str
+    config.read_string(text)
+    expected = {section: dict(config.items(section)) for section in config.sections()}
+    assert helpers._parse_settings_text(text) == expected  # type: ignore[attr-defined]
+
+
 _WPS_WRITER_CLASSES = {
     "kwpsframeclass",
     "kwpsmainframe",
@@ -671,3 +745,89 @@ def test_summarize_wps_process_hints_respects_wrapped_overrides() -> None:
     hints = harness._summarize_wps_process_hints(normalized)
     assert hints.has_wps_presentation_signature is False
     assert harness.calls == ["kwppshowframeclass"]
+
+
+def _import_time_name_loads(node: ast.AST) -> Iterable[ast.Name]:
+    """Yield names read while a top-level statement executes at import time."""
+
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        for decorator in node.decorator_list:
+            yield from _import_time_name_loads(decorator)
+        for default in (*node.args.defaults, *node.args.kw_defaults):
+            if default is not None:
+                yield from _import_time_name_loads(default)
+        return
+    if isinstance(node, ast.Lambda):
+        return
+    if isinstance(node, ast.ClassDef):
+        for item in (*node.decorator_list, *node.bases, *(kw.value for kw in node.keywords)):
+            yield from _import_time_name_loads(item)
+        for statement in node.body:
+            yield from _import_time_name_loads(statement)
+        return
+    if isinstance(node, (ast.AnnAssign, ast.arg)):
+        # The module uses ``from __future__ import annotations``, so annotations are never evaluated.
+        if isinstance(node, ast.AnnAssign) and node.value is not None:
+            yield from _import_time_name_loads(node.value)
+        return
+    if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+        yield node
+        return
+    for child in ast.iter_child_nodes(node):
+        yield from _import_time_name_loads(child)
+
+
+def test_module_level_code_only_reads_bound_names() -> None:
+    import builtins
+
+    path = Path(__file__).resolve().parents[1] / "ClassroomTools.py"
+    tree = ast.parse(path.read_text(encoding="utf-8").lstrip("\ufeff"), filename=str(path))
+    bound: Set[str] = set(dir(builtins))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            bound.add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound.add(node.name)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                bound.add((alias.asname or alias.name).split(".")[0])
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            bound.add(node.name)
+    unbound = sorted(
+        {
+            f"{name.id}@{name.lineno}"
+            for statement in tree.body
+            for name in _import_time_name_loads(statement)
+            if name.id not in bound
+        }
+    )
+    assert unbound == []
+
+
+def test_noise_mask_coverage_matches_sequential_point_draws(monkeypatch: pytest.MonkeyPatch) -> None:
+    numpy = pytest.importorskip("numpy")
+    monkeypatch.setattr(helpers, "np", numpy)
+
+    size = 32
+    indices, alphas = helpers._noise_mask_dots(450, 2, size, int(size * size * 0.45))
+    coverage = helpers._noise_mask_coverage(indices, alphas, size * size)
+
+    # Reference: the QPainter loop composites each white point with SourceOver in turn.
+    expected = [0.0] * (size * size)
+    for index, alpha in zip(indices.tolist(), alphas.tolist()):
+        source = alpha / 255.0
+        expected[index] = source + expected[index] * (1.0 - source)
+    assert coverage.tolist() == [round(value * 255) for value in expected]
+
+
+def test_module_gate_treats_broken_lazy_module_as_unavailable(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "ctools_broken_dep.py").write_text("raise ImportError('ABI mismatch')\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    broken = helpers._LazyModule("ctools_broken_dep")
+    gate = helpers._ModuleGate(broken)
+    assert not gate
+    with pytest.raises(ImportError):
+        broken.anything
+    assert not helpers._ModuleGate(helpers._LazyModule("json"), None)
+    assert helpers._ModuleGate(helpers._LazyModule("json"))